@@ -0,0 +1,63 @@
+"""
+Time building an Arrow table from a decoded /markets/historical body
+directly (output_type='arrow') against going through pandas first.
+
+Usage:
+    python benchmarks/bench_arrow.py [records]
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+import pandas as pd
+import pyarrow as pa
+
+from tradingeconomics import arrow
+from tradingeconomics import decoder
+
+URL = "/markets/historical/aapl:us"
+
+
+def records(count):
+    return [
+        {
+            "Symbol": "SYM%02d:US" % (i % 20),
+            "Date": "%02d/%02d/%d" % (i % 28 + 1, i // 28 % 12 + 1, 2000 + i // 336 % 24),
+            "Open": 1.5 + i,
+            "High": 2.0 + i,
+            "Low": 1.0 + i,
+            "Close": 1.75 + i,
+        }
+        for i in range(count)
+    ]
+
+
+def measure(label, func, data):
+    start = time.perf_counter()
+    func(data)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    table = func(data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(
+        "%-22s %6.2f s   peak %6.1f MB   table %6.1f MB"
+        % (label, elapsed, peak / 2**20, table.nbytes / 2**20)
+    )
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    data = records(count)
+    print("records: %d, decoder %s" % (count, decoder.getDecoder()))
+    measure("via pandas", lambda d: pa.Table.from_pandas(pd.DataFrame(d)), data)
+    measure("output_type='arrow'", lambda d: arrow.toTable(d, URL), data)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Time building a DataFrame of stream ticks by appending one tick at a
+time, by collecting decoded dicts and building the frame at the end, and
+through the preallocated columns of batching.TickBatcher.
+
+Usage:
+    python benchmarks/bench_batching.py [messages] [batch size]
+"""
+
+import json
+import os
+import sys
+import time
+
+import pandas as pd
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from tradingeconomics.batching import TickBatcher
+
+
+SYMBOLS = ["SYM%d:US" % i for i in range(200)]
+
+
+def ticks(count):
+    return [
+        json.dumps(
+            {
+                "s": SYMBOLS[i % len(SYMBOLS)],
+                "price": 100 + i * 0.01,
+                "bid": 99.99 + i * 0.01,
+                "ask": 100.01 + i * 0.01,
+                "dt": 1700000000000 + i,
+            }
+        )
+        for i in range(count)
+    ]
+
+
+def per_tick(messages):
+    start = time.perf_counter()
+    df = pd.DataFrame()
+    for message in messages:
+        df = pd.concat([df, pd.DataFrame([json.loads(message)])], ignore_index=True)
+    return time.perf_counter() - start, df
+
+
+def records(messages):
+    start = time.perf_counter()
+    df = pd.DataFrame([json.loads(message) for message in messages])
+    return time.perf_counter() - start, df
+
+
+def batched(messages, size):
+    batches = []
+    start = time.perf_counter()
+    batcher = TickBatcher(batches.append, size=size, interval=0, output_type="df")
+    for message in messages:
+        batcher.onMessage(None, message)
+    batcher.close()
+    df = pd.concat(batches, ignore_index=True)
+    return time.perf_counter() - start, df
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    messages = ticks(count)
+
+    # Quadratic, so timed on a slice
+    head = messages[: min(count, 2000)]
+    elapsed, _ = per_tick(head)
+    print("append per tick (%d)  %7.3f s  %9.0f msg/s" % (len(head), elapsed, len(head) / elapsed))
+    elapsed, _ = records(messages)
+    print("list of dicts         %7.3f s  %9.0f msg/s" % (elapsed, count / elapsed))
+    elapsed, df = batched(messages, size)
+    print("batches of %-6d     %7.3f s  %9.0f msg/s  %d rows" % (size, elapsed, count / elapsed, len(df)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Time and measure the memory of building the news DataFrame from 100k
+records with the previous column-by-column pd.concat loop, against
+functions.columnarFrame (news.getNewsResults) and the output_type='df'
+path of dataRequest (decoder.loadsFrame on the body), each with and
+without the category dtype for repeated strings.
+
+Usage:
+    python benchmarks/bench_columns.py [records]
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+import pandas as pd
+
+from tradingeconomics import decoder
+from tradingeconomics import news
+from tradingeconomics import schema
+
+FIELDS = ["id", "title", "date", "description", "country", "category", "symbol", "url"]
+
+
+def records(count):
+    countries = ["Country%02d " % i for i in range(60)]
+    categories = ["Category%02d" % i for i in range(40)]
+    return [
+        {
+            "id": str(i),
+            "title": "Title of article %d" % i,
+            "date": "2024-01-01T00:00:%02d" % (i % 60),
+            "description": "Description of article %d" % i,
+            "country": countries[i % len(countries)],
+            "category": categories[i % len(categories)],
+            "symbol": "SYM%02d:IND" % (i % 25),
+            "url": "/country/category/%d" % i,
+        }
+        for i in range(count)
+    ]
+
+
+def previous(webResults, country):
+    maindf = pd.DataFrame()
+    for name in FIELDS:
+        col_data = [d[name] for d in webResults]
+        maindf = pd.concat([maindf, pd.DataFrame(col_data, columns=[name])], axis=1)
+    maindf["country"] = maindf["country"].map(lambda x: x.strip())
+    return maindf
+
+
+def frame(body, typed=False):
+    df = decoder.loadsFrame(body)
+    return schema.getSchema("/news").apply(df) if typed else df
+
+
+def measure(label, func, *args, **kwargs):
+    tracemalloc.start()
+    start = time.perf_counter()
+    frame = func(*args, **kwargs)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    size = frame.memory_usage(deep=True).sum()
+    print(
+        "%-24s %7.3f s   peak %7.1f MB   frame %7.1f MB"
+        % (label, elapsed, peak / 2**20, size / 2**20)
+    )
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    data = records(count)
+    body = json.dumps(data).encode()
+    print("records: %d" % count)
+    measure("previous concat loop", lambda: previous(json.loads(body), None))
+    measure("columnarFrame", lambda: news.getNewsResults(json.loads(body), None))
+    measure(
+        "columnarFrame category",
+        lambda: news.getNewsResults(json.loads(body), None, categorical=True),
+    )
+    measure("loadsFrame", frame, body)
+    measure("loadsFrame + schema", frame, body, typed=True)
+
+
+if __name__ == "__main__":
+    main()
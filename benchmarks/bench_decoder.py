@@ -0,0 +1,60 @@
+"""
+Time and measure the peak memory of turning a large /markets/historical
+body into a DataFrame: stdlib json and orjson building the list of dicts
+first, against decoder.loadsFrame decoding it a chunk at a time.
+
+Usage:
+    python benchmarks/bench_decoder.py [records]
+"""
+
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+import pandas as pd
+
+from tradingeconomics import decoder
+
+
+def historical(count):
+    record = (
+        '{"Symbol":"AAPL:US","Date":"%02d/01/2024","Open":%d.5,"High":%d.75,'
+        '"Low":%d.25,"Close":%d.5}'
+    )
+    return (
+        "[" + ",".join(record % (i % 28 + 1, i, i, i, i) for i in range(count)) + "]"
+    ).encode()
+
+
+def measure(label, func, body):
+    start = time.perf_counter()
+    func(body)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func(body)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print("%-28s %7.2f s   peak %7.1f MB" % (label, elapsed, peak / 2**20))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    body = historical(count)
+    print("records: %d, body %.1f MB" % (count, len(body) / 2**20))
+    measure("json.loads + DataFrame", lambda b: pd.DataFrame(json.loads(b)), body)
+    for name in decoder.BACKENDS[:-1]:
+        try:
+            decoder.setDecoder(name)
+        except ImportError:
+            continue
+        measure(name + " + DataFrame", lambda b: pd.DataFrame(decoder.loads(b)), body)
+    measure("loadsFrame (chunked)", decoder.loadsFrame, body)
+
+
+if __name__ == "__main__":
+    main()
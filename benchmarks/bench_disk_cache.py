@@ -0,0 +1,73 @@
+"""
+Time a repeated getHistoricalData call served from the on-disk cache by a
+cold process, against the same call going to a local stub server.
+
+Usage:
+    python benchmarks/bench_disk_cache.py [rows]
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from tests.stubserver import StubServer
+
+CHILD = """
+import sys, time
+start = time.perf_counter()
+import tradingeconomics as te
+from tradingeconomics import cache, glob
+glob.API_BASE_URL = sys.argv[1]
+if sys.argv[2] == "disk":
+    cache.enableDiskCache(sys.argv[3])
+imported = time.perf_counter()
+te.getHistoricalData(country='mexico', indicator='gdp', initDate='1990-01-01', output_type='raw')
+done = time.perf_counter()
+print("%.2f %.2f" % ((imported - start) * 1e3, (done - imported) * 1e3))
+"""
+
+
+def payload(rows):
+    return [
+        {
+            "Country": "Mexico",
+            "Category": "GDP",
+            "DateTime": "%04d-01-01T00:00:00" % (1000 + i % 1000),
+            "Value": float(i),
+            "Frequency": "Quarterly",
+            "HistoricalDataSymbol": "MXNGDPY",
+            "LastUpdate": "2024-01-01T00:00:00",
+        }
+        for i in range(rows)
+    ]
+
+
+def run_child(url, mode, path):
+    out = subprocess.check_output(
+        [sys.executable, "-c", CHILD, url, mode, path], cwd=ROOT, text=True
+    )
+    return [float(x) for x in out.split()]
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    body = json.dumps(payload(rows)).encode()
+    path = os.path.join(tempfile.mkdtemp(), "responses.sqlite")
+    with StubServer(handler=lambda p: body) as server:
+        run_child(server.url, "disk", path)  # populate
+        network = min(run_child(server.url, "network", path)[1] for _ in range(3))
+        disk = min(run_child(server.url, "disk", path)[1] for _ in range(3))
+
+    print("rows:                         %d (%.1f MB JSON)" % (rows, len(body) / 1e6))
+    print("cold process, stub server:    %8.2f ms" % network)
+    print("cold process, disk cache:     %8.2f ms" % disk)
+    print("database size:                %8.2f MB" % (os.path.getsize(path) / 1e6))
+
+
+if __name__ == "__main__":
+    main()
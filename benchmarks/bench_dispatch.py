@@ -0,0 +1,85 @@
+"""
+Time the delivery of a burst of stream ticks to an on_message callback,
+starting one thread per message as stream.py used to, and through the
+bounded worker pool of dispatch.Dispatcher.
+
+The callback decodes the tick and keeps the last price per symbol.
+
+Usage:
+    python benchmarks/bench_dispatch.py [messages]
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from tradingeconomics.dispatch import Dispatcher
+
+
+SYMBOLS = ["SYM%d:US" % i for i in range(200)]
+
+
+def ticks(count):
+    return [
+        json.dumps({"s": SYMBOLS[i % len(SYMBOLS)], "price": i, "dt": 1700000000000 + i})
+        for i in range(count)
+    ]
+
+
+def make_callback():
+    last = {}
+    lock = threading.Lock()
+
+    def on_message(ws, message):
+        tick = json.loads(message)
+        with lock:
+            last[tick["s"]] = tick["price"]
+
+    return on_message, last
+
+
+def thread_per_message(messages):
+    on_message, last = make_callback()
+    threads = []
+    start = time.perf_counter()
+    for message in messages:
+        t = threading.Thread(target=on_message, args=(None, message))
+        t.start()
+        threads.append(t)
+    for t in threads:
+        t.join()
+    return time.perf_counter() - start, last
+
+
+def dispatcher(messages, policy):
+    on_message, last = make_callback()
+    pool = Dispatcher(on_message, workers=4, queue_size=10000, policy=policy)
+    start = time.perf_counter()
+    for message in messages:
+        pool.submit(None, message)
+    pool.close()
+    elapsed = time.perf_counter() - start
+    return elapsed, last, pool.stats()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    messages = ticks(count)
+
+    elapsed, _ = thread_per_message(messages)
+    print("thread per message   %7.3f s  %9.0f msg/s" % (elapsed, count / elapsed))
+    for policy in ("block", "drop_oldest", "coalesce"):
+        elapsed, last, stats = dispatcher(messages, policy)
+        print(
+            "dispatcher %-11s %7.3f s  %9.0f msg/s  delivered %d, max depth %d"
+            % (policy, elapsed, count / elapsed, stats["delivered"], stats["max_depth"])
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Time historical.multiParams on synthetic payloads of 50 countries x 20
+indicators, against the previous nested-loop implementation (skipped
+above 100k rows, where it takes minutes).
+
+Usage:
+    python benchmarks/bench_historical.py [rows ...]
+"""
+
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+import pandas as pd
+
+from tradingeconomics.historical import multiParams, parseData
+
+COUNTRIES = ["Country%02d" % i for i in range(50)]
+INDICATORS = ["Indicator%02d" % i for i in range(20)]
+
+
+def payload(rows):
+    per_pair = max(1, rows // (len(COUNTRIES) * len(INDICATORS)))
+    dates = [str(d.date()) + "T00:00:00" for d in pd.date_range("1950-01-01", periods=per_pair)]
+    return [
+        {"Country": c, "Category": i, "DateTime": d, "Value": float(n)}
+        for c in COUNTRIES
+        for i in INDICATORS
+        for n, d in enumerate(dates)
+    ]
+
+
+def previous(webdata):
+    mycntry = list(set([d["Country"] for d in webdata]))
+    myind = list(set([d["Category"] for d in webdata]))
+    lst2 = [[d["Country"], d["Value"], d["DateTime"], d["Category"]] for d in webdata]
+    countryDict = {}
+    for c in mycntry:
+        countryDict[c] = {}
+        for m in myind:
+            countryDict[c][m] = {"dates": [], "values": []}
+            for row in lst2:
+                if row[0] == c and row[3] == m:
+                    countryDict[c][m]["dates"].append(row[2])
+                    countryDict[c][m]["values"].append(row[1])
+    return {
+        c: {m: [parseData(v).to_dict("Series").values()] for m, v in ind.items()}
+        for c, ind in countryDict.items()
+    }
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def main():
+    sizes = [int(n) for n in sys.argv[1:]] or [10000, 100000, 1000000]
+    print("%10s %14s %14s %14s" % ("rows", "previous", "nested", "wide"))
+    for rows in sizes:
+        data = payload(rows)
+        old = "%12.2f s" % timed(previous, data) if len(data) <= 100000 else "%14s" % "-"
+        nested = timed(multiParams, data)
+        wide = timed(multiParams, data, wide=True)
+        print("%10d %14s %12.2f s %12.2f s" % (len(data), old, nested, wide))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Time `import tradingeconomics` in fresh processes: the bare package import,
+the first raw endpoint lookup, and everything the package used to import
+eagerly (every endpoint module plus pandas and dateutil).
+
+Usage:
+    python benchmarks/bench_import.py [runs]
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+CASES = {
+    "import tradingeconomics": "import tradingeconomics",
+    "+ te.getMarketsData (raw)": "import tradingeconomics as te; te.getMarketsData",
+    "eager (all modules + pandas)": (
+        "import pandas, dateutil.relativedelta, tradingeconomics as te;"
+        "[getattr(te, name) for name in te.__all__]"
+    ),
+}
+
+CHILD = """
+import sys, time
+start = time.perf_counter()
+exec(sys.argv[1])
+elapsed = time.perf_counter() - start
+print("%.2f %d" % (elapsed * 1e3, "pandas" in sys.modules))
+"""
+
+
+def run_child(code):
+    out = subprocess.check_output([sys.executable, "-c", CHILD, code], cwd=ROOT, text=True)
+    elapsed, pandas = out.split()
+    return float(elapsed), pandas == "1"
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    run_child("import tradingeconomics")  # warm the bytecode and file caches
+    for label, code in CASES.items():
+        results = [run_child(code) for _ in range(runs)]
+        best = min(elapsed for elapsed, _ in results)
+        print("%-30s %8.2f ms   pandas loaded: %s" % (label + ":", best, results[0][1]))
+
+
+if __name__ == "__main__":
+    main()
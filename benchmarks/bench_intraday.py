@@ -0,0 +1,77 @@
+"""
+Time getMarketsIntradayByInterval for two months of 1-minute bars from a
+local server serving synthetic bars, as one request and split into date
+windows fetched concurrently.
+
+The server takes 30 ms plus 5 microseconds per bar to answer, a rough
+model of a database-backed API.
+
+Usage:
+    python benchmarks/bench_intraday.py [days]
+"""
+
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from functools import lru_cache
+from urllib.parse import parse_qs, urlsplit
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+from tests.stubserver import StubServer
+
+import tradingeconomics as te
+from tradingeconomics import glob, markets, transport
+
+
+@lru_cache(maxsize=None)
+def day(date):
+    start = datetime.strptime(date, "%Y-%m-%d")
+    return ",".join(
+        '{"Symbol":"AAPL:US","Date":"%s","Open":1.0,"High":2.0,"Low":0.5,"Close":1.5}'
+        % (start + timedelta(minutes=m)).isoformat()
+        for m in range(24 * 60)
+    )
+
+
+def bars(path):
+    query = parse_qs(urlsplit(path).query)
+    first = datetime.strptime(query["d1"][0], "%Y-%m-%d")
+    last = datetime.strptime(query["d2"][0], "%Y-%m-%d")
+    days = [
+        day((first + timedelta(days=i)).strftime("%Y-%m-%d"))
+        for i in range((last - first).days + 1)
+    ]
+    time.sleep(0.03 + 5e-6 * 24 * 60 * len(days))
+    return ("[" + ",".join(days) + "]").encode()
+
+
+def timed(label, **kwargs):
+    start = time.perf_counter()
+    frame = te.getMarketsIntradayByInterval(output_type="df", **kwargs)
+    elapsed = time.perf_counter() - start
+    print("%-34s %6.2f s   %d bars" % (label, elapsed, len(frame)))
+
+
+def main():
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    end = (datetime(2024, 1, 1) + timedelta(days=days)).strftime("%Y-%m-%d")
+    query = dict(symbol="aapl:us", interval="1m", initDate="2024-01-01", endDate=end)
+    with StubServer(handler=bars) as server:
+        glob.API_BASE_URL = server.url
+        transport.configurePool()
+        for i in range(days + 1):
+            day((datetime(2024, 1, 1) + timedelta(days=i)).strftime("%Y-%m-%d"))
+        glob.INTRADAY_WINDOW_BARS = 10**9
+        timed("one request", **query)
+        glob.INTRADAY_WINDOW_BARS = 20000
+        n = len(markets.intradayWindows("2024-01-01", end, "1m"))
+        for workers in (1, 4, 8):
+            glob.FANOUT_WORKERS = workers
+            timed("%d windows, %d workers" % (n, workers), **query)
+
+
+if __name__ == "__main__":
+    main()
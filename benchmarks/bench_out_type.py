@@ -0,0 +1,73 @@
+"""
+Time functions.out_type on a synthetic indicator snapshot against the
+previous implementation, which filtered the frame once per
+(country, category) pair.
+
+Usage:
+    python benchmarks/bench_out_type.py [rows]
+"""
+
+import itertools
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+import pandas as pd
+
+from tradingeconomics import functions as fn
+
+
+def snapshot(rows):
+    countries = ["Country%03d" % i for i in range(200)]
+    categories = ["Category%04d" % i for i in range(rows // len(countries))]
+    return pd.DataFrame(
+        {
+            "Country": [c for c in countries for _ in categories],
+            "Category": [k for _ in countries for k in categories],
+            "LatestValue": [float(i) for i in range(len(countries) * len(categories))],
+            "Unit": "percent",
+            "LatestValueDate": pd.Timestamp("2024-01-01"),
+        }
+    )
+
+
+def previous(init_format):
+    list_of_countries = init_format.Country.unique()
+    list_of_cat = init_format.Category.unique()
+    nested = {el: {elm: 0 for elm in list_of_cat} for el in list_of_countries}
+    for i, j in itertools.product(range(len(list_of_countries)), range(len(list_of_cat))):
+        dict_cntry = init_format.loc[init_format["Country"] == list_of_countries[i]]
+        dict_cat = dict_cntry.loc[init_format["Category"] == list_of_cat[j]].to_dict("records")
+        nested[list_of_countries[i]][list_of_cat[j]] = dict_cat
+        for record in dict_cat:
+            del record["Country"]
+            del record["Category"]
+    return nested
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    if not isinstance(result, dict):
+        for _ in result:
+            pass
+    return time.perf_counter() - start
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    frame = snapshot(rows)
+    small = snapshot(5000)
+    print("rows:                        %d" % len(frame))
+    print("out_type:                    %8.2f s" % timed(fn.out_type, frame))
+    print("iterOutType (consumed):      %8.2f s" % timed(fn.iterOutType, frame))
+    # The previous implementation is quadratic; time it on 5k rows only
+    print("previous, 5k rows:           %8.2f s" % timed(previous, small))
+    print("out_type, 5k rows:           %8.2f s" % timed(fn.out_type, small))
+
+
+if __name__ == "__main__":
+    main()
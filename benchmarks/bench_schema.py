@@ -0,0 +1,77 @@
+"""
+Measure the memory of historical and intraday frames with the pandas
+defaults, with schema.py dtypes, and with schema dtypes plus float32.
+
+Usage:
+    python benchmarks/bench_schema.py [rows]
+"""
+
+import os
+import sys
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+
+import pandas as pd
+
+from tradingeconomics import schema
+
+
+def historical(rows):
+    countries = ["Country%02d" % i for i in range(50)]
+    categories = ["Category%02d" % i for i in range(20)]
+    return [
+        {
+            "Country": countries[i % 50],
+            "Category": categories[i // 50 % 20],
+            "DateTime": "%d-%02d-01T00:00:00" % (1950 + i // 12000, i // 1000 % 12 + 1),
+            "Value": float(i),
+            "Frequency": "Monthly",
+            "HistoricalDataSymbol": "SYM%02d%02d" % (i % 50, i // 50 % 20),
+            "LastUpdate": "2024-01-01T10:00:00",
+        }
+        for i in range(rows)
+    ]
+
+
+def intraday(rows):
+    symbols = ["SYM%02d:US" % i for i in range(20)]
+    return [
+        {
+            "Symbol": symbols[i % 20],
+            "Date": "2024-01-%02dT%02d:%02d:00" % (i // 28800 % 28 + 1, i // 1200 % 24, i // 20 % 60),
+            "Open": 100.0 + i,
+            "High": 101.0 + i,
+            "Low": 99.0 + i,
+            "Close": 100.5 + i,
+        }
+        for i in range(rows)
+    ]
+
+
+def report(name, records, path):
+    size = lambda f: f.memory_usage(deep=True).sum() / 2**20
+    plain = pd.DataFrame(records)
+    start = time.perf_counter()
+    typed = schema.getSchema(path).apply(pd.DataFrame(records))
+    elapsed = time.perf_counter() - start
+    compact = schema.getSchema(path).apply(pd.DataFrame(records), float32=True)
+    print(
+        "%-11s pandas %7.1f MB   schema %6.1f MB (%.1fx, %.2f s)   +float32 %6.1f MB (%.1fx)"
+        % (
+            name, size(plain), size(typed), size(plain) / size(typed), elapsed,
+            size(compact), size(plain) / size(compact),
+        )
+    )
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    print("rows: %d" % rows)
+    report("historical", historical(rows), "/historical/country/all")
+    report("intraday", intraday(rows), "/markets/intraday/sym:us")
+
+
+if __name__ == "__main__":
+    main()
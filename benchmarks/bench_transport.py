@@ -0,0 +1,63 @@
+"""
+Per-request latency of the pooled transport against one urlopen() per call.
+
+Runs against a local stub server, so the difference is the cost of opening
+and tearing down a TCP connection for every request. Against the real API
+each new connection also pays a TLS handshake, so the gain is larger there.
+
+Usage:
+    python benchmarks/bench_transport.py [requests]
+"""
+
+import os
+import sys
+import time
+from urllib.request import Request, urlopen
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from tradingeconomics import functions as fn
+from tradingeconomics import glob
+from tradingeconomics import transport
+from tests.stubserver import StubServer
+
+
+def one_connection_per_call(url, n):
+    for _ in range(n):
+        with urlopen(Request(url)) as response:
+            response.read()
+
+
+def pooled(url, n):
+    for _ in range(n):
+        fn.dataRequest(url, "raw")
+
+
+def timed(func, url, n):
+    start = time.perf_counter()
+    func(url, n)
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with StubServer() as server:
+        glob.API_BASE_URL = server.url
+        url = server.url + "/markets/index"
+        transport.configurePool()
+        # Warm up both paths
+        one_connection_per_call(url, 50)
+        pooled(url, 50)
+
+        baseline = timed(one_connection_per_call, url, n)
+        pool = timed(pooled, url, n)
+
+    print("requests:                 %d" % n)
+    print("urlopen per call:         %8.1f us/request" % baseline)
+    print("pooled dataRequest:       %8.1f us/request" % pool)
+    print("latency reduction:        %8.1f %%" % ((1 - pool / baseline) * 100))
+    print("connections opened:       %d" % transport.getPool().created)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,14 +1,9 @@
 import tradingeconomics as te
+from tradingeconomics import ratelimit
 from datetime import datetime
-import time
 import sys
 import pandas as pd
 
-def chunks(l, n):
-    """Yield successive n-sized chunks from l."""
-    for i in range(0, len(l), n):
-        yield l[i:i + n]
-
 def get_indicators():
     """
     Gets all indicators
@@ -31,13 +26,13 @@ def main():
     for indicator in list(indicators):
         countries = get_countries(str(indicator))
         if countries:
-            for countries_chunk in chunks(countries, 1): 
-                print(",".join(countries_chunk) + " - " + indicator)
-                mydata = te.getHistoricalData(country = countries_chunk, indicator = [indicator],  initDate = '1800-01-01', endDate = today_date  ) #Choose initDate or EndDate
-                print(mydata)
-                # HERE: do something with the data
-                time.sleep(1) #avoid throttling protection
+            print(indicator)
+            # Long country lists are split into concurrent requests and merged
+            mydata = te.getHistoricalData(country = countries, indicator = [indicator],  initDate = '1800-01-01', endDate = today_date  ) #Choose initDate or EndDate
+            print(mydata)
+            # HERE: do something with the data
                 
 if __name__ == "__main__":
     te.login('') #Insert your API Key
+    ratelimit.enableRateLimit(rate = 1) #avoid throttling protection, set to your plan's requests per second
     main()
\ No newline at end of file
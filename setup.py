@@ -41,4 +41,9 @@ setup(
         "pandas>=2.0,<4",
         "websocket-client>=1.0",
     ],
+    extras_require={
+        "orjson": ["orjson>=3"],
+        "arrow": ["pyarrow>=14"],
+        "polars": ["polars>=0.20", "pyarrow>=14"],
+    },
 )
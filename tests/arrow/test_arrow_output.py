@@ -0,0 +1,122 @@
+import importlib.util
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from tradingeconomics import arrow
+from tradingeconomics import functions as fn
+from tradingeconomics import glob
+from tradingeconomics import schema
+from tradingeconomics.transport import Response
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+HAS_POLARS = importlib.util.find_spec("polars") is not None
+
+RECORDS = [
+    {"Symbol": "AAPL:US", "Date": "31/12/2020", "Open": 1.0, "Close": 1.5},
+    {"Symbol": "AAPL:US", "Date": "04/01/2021", "Open": 2.0, "Close": 2.5, "Note": "x"},
+]
+
+
+@unittest.skipUnless(HAS_PYARROW, "requires pyarrow")
+class TestArrowOutput(unittest.TestCase):
+
+    def tearDown(self):
+        schema.disableSchemas()
+
+    def test_table_follows_schema(self):
+        # Dates become timestamps and symbols are dictionary encoded
+        import pyarrow as pa
+
+        table = arrow.toTable(RECORDS, "/markets/historical/aapl:us")
+
+        self.assertEqual(table.column_names, ["Symbol", "Date", "Open", "Close", "Note"])
+        self.assertTrue(pa.types.is_dictionary(table["Symbol"].type))
+        self.assertTrue(pa.types.is_timestamp(table["Date"].type))
+        self.assertEqual(table["Note"].to_pylist(), [None, "x"])
+        self.assertEqual(table["Close"].type, pa.float64())
+
+    def test_float32(self):
+        # Prices are single precision with float32 schemas
+        import pyarrow as pa
+
+        schema.enableSchemas(float32=True)
+        table = arrow.toTable(RECORDS, "/markets/historical/aapl:us")
+
+        self.assertEqual(table["Close"].type, pa.float32())
+
+    def test_unknown_endpoint_keeps_types(self):
+        # Without a schema columns keep the types inferred by Arrow
+        import pyarrow as pa
+
+        table = arrow.toTable(RECORDS, "/markets/index")
+
+        self.assertEqual(table["Date"].type, pa.string())
+
+    def test_mixed_types_fall_back_to_text(self):
+        # Columns Arrow cannot type are kept as JSON text
+        import pyarrow as pa
+
+        records = [
+            {"Symbol": "AAPL:US", "Value": 1, "Flag": True, "Extra": {"a": 1}},
+            {"Symbol": "AAPL:US", "Value": "n/a", "Flag": 2, "Extra": "b"},
+        ]
+        table = arrow.toTable(records)
+
+        self.assertEqual(table["Value"].to_pylist(), ["1", "n/a"])
+        self.assertEqual(table["Flag"].to_pylist(), ["true", "2"])
+        self.assertEqual(table["Extra"].to_pylist(), ['{"a": 1}', "b"])
+        self.assertEqual(table["Symbol"].type, pa.string())
+
+    def test_zone_offsets_become_utc(self):
+        # ISO timestamps with an offset are converted to UTC
+        import datetime as dt
+
+        import pyarrow as pa
+
+        records = [
+            {"Symbol": "AAPL:US", "Date": "2024-01-02T10:00:00+02:00", "Close": 1.0},
+            {"Symbol": "AAPL:US", "Date": "2024-01-02T10:00:00Z", "Close": 2.0},
+        ]
+        table = arrow.toTable(records, "/markets/intraday/aapl:us")
+
+        self.assertEqual(table["Date"].type, pa.timestamp("us", "UTC"))
+        self.assertEqual(
+            [d.replace(tzinfo=None) for d in table["Date"].to_pylist()],
+            [dt.datetime(2024, 1, 2, 8), dt.datetime(2024, 1, 2, 10)],
+        )
+
+    def test_data_request(self):
+        # dataRequest returns a table for output_type='arrow'
+        pool = MagicMock()
+        pool.request.return_value = Response(200, "OK", {}, json.dumps(RECORDS).encode())
+        with patch("tradingeconomics.transport.getPool", return_value=pool), patch.object(
+            glob, "apikey", "TESTKEY:SECRET"
+        ):
+            table = fn.dataRequest("/markets/historical/aapl:us", "arrow")
+
+        self.assertEqual(table.num_rows, 2)
+
+    @unittest.skipUnless(HAS_POLARS, "requires polars")
+    def test_polars(self):
+        # Polars frames wrap the Arrow table
+        import polars as pl
+
+        frame = arrow.toPolars(RECORDS, "/markets/historical/aapl:us")
+
+        self.assertEqual(frame.height, 2)
+        self.assertEqual(frame["Symbol"].dtype, pl.Categorical)
+
+
+class TestMissingDependency(unittest.TestCase):
+
+    def test_clear_error(self):
+        # A missing optional package names the extra to install
+        with patch("importlib.import_module", side_effect=ImportError("missing")):
+            with self.assertRaises(ImportError) as raised:
+                arrow.toTable(RECORDS)
+        self.assertIn("tradingeconomics[arrow]", str(raised.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
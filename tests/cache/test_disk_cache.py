@@ -0,0 +1,177 @@
+import json
+import multiprocessing
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from tradingeconomics import cache
+from tradingeconomics import functions as fn
+from tradingeconomics import glob
+from tradingeconomics.cache import DiskCache
+from tradingeconomics.transport import Response
+
+
+def write_entries(path, worker):
+    disk = DiskCache(path)
+    for i in range(50):
+        disk.set("https://h/historical/country/c%d/indicator/gdp" % i, b"[%d]" % worker)
+
+
+class TestDiskCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "responses.sqlite")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_roundtrip_is_compressed(self):
+        # Bodies are stored compressed and returned unchanged
+        disk = DiskCache(self.path)
+        body = json.dumps([{"Country": "Mexico", "Value": i} for i in range(500)]).encode()
+        disk.set("https://h/historical/country/mexico/indicator/gdp?c=KEY", body)
+
+        self.assertEqual(disk.get("https://h/historical/country/mexico/indicator/gdp"), body)
+        self.assertLess(disk.stats()["bytes"], len(body) / 4)
+
+    def test_visible_to_a_new_instance(self):
+        # Another cache object (or process) on the same file sees the entry
+        DiskCache(self.path).set("https://h/sectors", b"[1]")
+
+        self.assertEqual(DiskCache(self.path).get("https://h/sectors"), b"[1]")
+
+    @patch("tradingeconomics.cache.time.time")
+    def test_expired_entries_are_misses_but_keep_validators(self, mock_time):
+        # Stale entries are not served but can be revalidated
+        mock_time.return_value = 1000.0
+        disk = DiskCache(self.path, default_ttl=10)
+        disk.set("https://h/news", b"[1]", {"ETag": '"abc"', "Last-Modified": "Mon"})
+
+        mock_time.return_value = 1011.0
+        self.assertIsNone(disk.get("https://h/news"))
+        self.assertEqual(
+            disk.validators("https://h/news"),
+            {"If-None-Match": '"abc"', "If-Modified-Since": "Mon"},
+        )
+        self.assertEqual(disk.revalidated("https://h/news"), b"[1]")
+        self.assertEqual(disk.get("https://h/news"), b"[1]")
+
+    @patch("tradingeconomics.cache.time.time")
+    def test_size_cap_evicts_least_recently_used(self, mock_time):
+        # Entries accessed longest ago are evicted first
+        disk = DiskCache(self.path, max_bytes=90)
+        for i, url in enumerate(["https://h/a", "https://h/b", "https://h/c"]):
+            mock_time.return_value = 1000.0 + i * 100
+            disk.set(url, os.urandom(20))
+        mock_time.return_value = 1300.0
+        disk.get("https://h/a")
+        mock_time.return_value = 1400.0
+        disk.set("https://h/d", os.urandom(20))
+
+        urls = [e["url"] for e in disk.entries()]
+        self.assertNotIn("https://h/b", urls)
+        self.assertIn("https://h/a", urls)
+        self.assertLessEqual(disk.stats()["bytes"], 90)
+
+    def test_size_total_follows_writes(self):
+        # The running total matches the stored bodies after replaces and purges
+        disk = DiskCache(self.path)
+        disk.set("https://h/a", os.urandom(100))
+        disk.set("https://h/b", os.urandom(50))
+        disk.set("https://h/a", os.urandom(10))
+        disk.purge("/b")
+
+        total = disk._connect().execute("SELECT SUM(size) FROM responses").fetchone()[0]
+        self.assertEqual(disk.stats()["bytes"], total)
+        self.assertEqual(DiskCache(self.path).stats()["bytes"], total)
+
+    def test_entries_and_purge(self):
+        # Entries can be listed and purged by path pattern
+        disk = DiskCache(self.path)
+        disk.set("https://h/historical/country/mexico/indicator/gdp", b"[1]")
+        disk.set("https://h/markets/historical/aapl:us", b"[2]")
+        disk.set("https://h/sectors", b"[3]")
+
+        self.assertEqual(len(disk.entries("/historical/*")), 1)
+        self.assertEqual(disk.purge("*/historical/*"), 2)
+        self.assertEqual([e["url"] for e in disk.entries()], ["https://h/sectors"])
+
+    @unittest.skipUnless(
+        "fork" in multiprocessing.get_all_start_methods(), "requires fork"
+    )
+    def test_concurrent_processes(self):
+        # Several processes can write to the same file at once
+        DiskCache(self.path)
+        context = multiprocessing.get_context("fork")
+        workers = [context.Process(target=write_entries, args=(self.path, n)) for n in range(4)]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+
+        self.assertEqual([w.exitcode for w in workers], [0] * 4)
+        self.assertEqual(DiskCache(self.path).stats()["entries"], 50)
+
+
+class TestDataRequestDiskCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.pool = MagicMock()
+        self.pool.request.return_value = Response(
+            200, "OK", {"ETag": '"v1"'}, b'[{"Country": "Mexico"}]'
+        )
+        self.patches = [
+            patch("tradingeconomics.transport.getPool", return_value=self.pool),
+            patch.object(glob, "apikey", "TESTKEY:SECRET"),
+        ]
+        for p in self.patches:
+            p.start()
+        self.disk = cache.enableDiskCache(os.path.join(self.directory, "r.sqlite"))
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        cache.disableDiskCache()
+        cache.disableCache()
+        shutil.rmtree(self.directory)
+
+    def test_second_call_is_served_from_disk(self):
+        # A repeated call does not reach the network
+        fn.dataRequest("/historical/country/mexico/indicator/gdp", None)
+        result = fn.dataRequest("/historical/country/mexico/indicator/gdp", "df")
+
+        self.assertEqual(self.pool.request.call_count, 1)
+        self.assertEqual(result["Country"].tolist(), ["Mexico"])
+
+    def test_disk_hit_fills_memory_cache(self):
+        # Disk hits are promoted to the in-memory tier
+        fn.dataRequest("/sectors", None)
+        memory = cache.enableCache()
+        fn.dataRequest("/sectors", None)
+        fn.dataRequest("/sectors", None)
+
+        self.assertEqual(memory.stats()["hits"], 1)
+        self.assertEqual(self.disk.stats()["hits"], 1)
+
+    @patch("tradingeconomics.cache.time.time")
+    def test_stale_entry_is_revalidated(self, mock_time):
+        # A 304 answer refreshes the stored entry
+        mock_time.return_value = 1000.0
+        fn.dataRequest("/news", None)
+        mock_time.return_value = 1000.0 + 10 ** 6
+        self.pool.request.return_value = Response(304, "Not Modified", {}, b"")
+
+        result = fn.dataRequest("/news", None)
+
+        self.assertEqual(result, [{"Country": "Mexico"}])
+        headers = self.pool.request.call_args[0][1]
+        self.assertEqual(headers["If-None-Match"], '"v1"')
+        self.assertEqual(self.disk.stats()["revalidations"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
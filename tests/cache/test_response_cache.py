@@ -0,0 +1,169 @@
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+from tradingeconomics import cache
+from tradingeconomics import functions as fn
+from tradingeconomics import glob
+from tradingeconomics.cache import ResponseCache, canonicalUrl
+from tradingeconomics.transport import Response
+
+
+class TestCanonicalUrl(unittest.TestCase):
+
+    def test_removes_credentials_and_sorts_query(self):
+        # API key parameters are dropped and the query is sorted
+        url = "HTTPS://API.tradingeconomics.com/markets/intraday/aapl:us?d1=2022&agr=1m&client=KEY:SECRET&c=KEY"
+
+        self.assertEqual(
+            canonicalUrl(url),
+            "https://api.tradingeconomics.com/markets/intraday/aapl:us?agr=1m&d1=2022",
+        )
+
+    def test_same_key_for_equivalent_urls(self):
+        # Parameter order does not change the key
+        self.assertEqual(
+            canonicalUrl("https://h/news?limit=10&start=5"),
+            canonicalUrl("https://h/news?start=5&limit=10"),
+        )
+
+
+class TestResponseCache(unittest.TestCase):
+
+    def test_hit_and_miss_counters(self):
+        # Lookups count hits and misses
+        c = ResponseCache()
+        self.assertIsNone(c.get("https://h/sectors"))
+        c.set("https://h/sectors", b"[1]")
+
+        self.assertEqual(c.get("https://h/sectors/"), None)
+        self.assertEqual(c.get("https://h/sectors"), b"[1]")
+        stats = c.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(stats["entries"], 1)
+
+    def test_ttl_patterns(self):
+        # The longest matching path pattern decides the TTL
+        c = ResponseCache(default_ttl=5, ttls={"/markets/index": 1})
+
+        self.assertEqual(c.ttlFor("https://h/country/"), 86400)
+        self.assertEqual(c.ttlFor("https://h/country/mexico"), 5)
+        self.assertEqual(c.ttlFor("https://h/markets/bond"), 60)
+        self.assertEqual(c.ttlFor("https://h/markets/index"), 1)
+        self.assertEqual(c.ttlFor("https://h/markets/symbol/aapl:us"), 60)
+        self.assertEqual(c.ttlFor("https://h/markets/historical/aapl:us?d1=2020-01-01"), 5)
+        self.assertEqual(c.ttlFor("https://h/markets/intraday/aapl:us"), 5)
+
+    @patch("tradingeconomics.cache.time.monotonic")
+    def test_entries_expire(self, mock_time):
+        # Entries older than their TTL are dropped
+        mock_time.return_value = 100.0
+        c = ResponseCache(default_ttl=10)
+        c.set("https://h/news", b"[1]")
+
+        mock_time.return_value = 109.0
+        self.assertEqual(c.get("https://h/news"), b"[1]")
+        mock_time.return_value = 110.0
+        self.assertIsNone(c.get("https://h/news"))
+        self.assertEqual(c.stats()["expirations"], 1)
+
+    def test_zero_ttl_is_not_cached(self):
+        # A TTL of 0 disables caching for a path
+        c = ResponseCache(default_ttl=0)
+        c.set("https://h/news", b"[1]")
+
+        self.assertEqual(c.stats()["entries"], 0)
+
+    def test_lru_eviction_by_entries(self):
+        # The least recently used entry is evicted first
+        c = ResponseCache(max_entries=2)
+        c.set("https://h/a", b"[1]")
+        c.set("https://h/b", b"[2]")
+        c.get("https://h/a")
+        c.set("https://h/c", b"[3]")
+
+        self.assertIsNone(c.get("https://h/b"))
+        self.assertEqual(c.get("https://h/a"), b"[1]")
+        self.assertEqual(c.stats()["evictions"], 1)
+
+    def test_lru_eviction_by_bytes(self):
+        # The byte budget bounds the total size of cached bodies
+        c = ResponseCache(max_bytes=100)
+        c.set("https://h/a", b"x" * 40)
+        c.set("https://h/b", b"x" * 40)
+
+        self.assertEqual(c.stats()["entries"], 1)
+        self.assertLessEqual(c.stats()["bytes"], 100)
+        c.set("https://h/huge", b"x" * 200)
+        self.assertIsNone(c.get("https://h/huge"))
+
+    def test_thread_safety(self):
+        # Concurrent readers and writers keep the counters consistent
+        c = ResponseCache(max_entries=50)
+
+        def worker(n):
+            for i in range(200):
+                url = "https://h/p%d" % ((n * i) % 80)
+                if c.get(url) is None:
+                    c.set(url, b"[1]")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        stats = c.stats()
+        self.assertEqual(stats["hits"] + stats["misses"], 1600)
+        self.assertLessEqual(stats["entries"], 50)
+        self.assertEqual(stats["bytes"], sum(len(k) + 3 for k in c._entries))
+
+
+class TestDataRequestCache(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = MagicMock()
+        self.pool.request.return_value = Response(200, "OK", {}, b'[{"Country": "Mexico"}]')
+        self.patches = [
+            patch("tradingeconomics.transport.getPool", return_value=self.pool),
+            patch.object(glob, "apikey", "TESTKEY:SECRET"),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        cache.disableCache()
+
+    def test_disabled_by_default(self):
+        # Without enableCache every call reaches the network
+        fn.dataRequest("/country/", None)
+        fn.dataRequest("/country/", None)
+
+        self.assertEqual(self.pool.request.call_count, 2)
+
+    def test_repeated_calls_are_served_from_cache(self):
+        # A cached response is decoded again for each caller
+        cache.enableCache()
+        first = fn.dataRequest("/country/", None)
+        first[0]["Country"] = "changed"
+        second = fn.dataRequest("/country/", "df")
+
+        self.assertEqual(self.pool.request.call_count, 1)
+        self.assertEqual(second["Country"].tolist(), ["Mexico"])
+        self.assertEqual(cache.getCache().stats()["hits"], 1)
+
+    def test_errors_are_not_cached(self):
+        # Failed responses are never stored
+        cache.enableCache()
+        self.pool.request.return_value = Response(500, "Error", {}, b"{}")
+        with self.assertRaises(fn.WebRequestError):
+            fn.dataRequest("/country/", None)
+
+        self.assertEqual(cache.getCache().stats()["entries"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
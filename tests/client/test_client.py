@@ -0,0 +1,160 @@
+import asyncio
+import itertools
+import threading
+import unittest
+from unittest.mock import patch
+
+from tests.stubserver import StubHandler, StubServer
+import tradingeconomics as te
+from tradingeconomics import aio
+from tradingeconomics import functions as fn
+from tradingeconomics import glob
+from tradingeconomics import transport
+from tradingeconomics.cache import ResponseCache
+from tradingeconomics.client import DefaultClient, TradingEconomicsClient, getClient
+from tradingeconomics.ratelimit import TokenBucket
+
+
+class EchoHandler(StubHandler):
+
+    def do_GET(self):
+        self.reply(200, [{"Path": self.path, "Authorization": self.headers.get("Authorization")}])
+
+
+class TestTradingEconomicsClient(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubServer(EchoHandler).start()
+        self.base_url = self.server.url
+        self.patches = [
+            patch.object(glob, "API_BASE_URL", self.base_url),
+            patch.object(glob, "apikey", "DEFAULT:KEY"),
+        ]
+        for p in self.patches:
+            p.start()
+        transport.configurePool()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        transport.getPool().clear()
+        self.server.stop()
+
+    def client(self, apikey, **kwargs):
+        client = TradingEconomicsClient(apikey, base_url=self.base_url, **kwargs)
+        self.addCleanup(client.close)
+        return client
+
+    def test_endpoint_methods_use_the_client_key(self):
+        # Endpoints called on a client send its key, not the global one
+        client = self.client("TENANT:ONE")
+
+        result = client.getMarketsBySymbol(symbols="aapl:us")
+
+        self.assertEqual(result[0]["Authorization"], "TENANT:ONE")
+        self.assertTrue(result[0]["Path"].startswith("/markets/symbol/aapl"))
+
+    def test_module_functions_use_the_default_client(self):
+        # te.getX keeps following te.login()
+        self.assertIsInstance(getClient(), DefaultClient)
+        result = te.getMarketsBySymbol(symbols="aapl:us")
+
+        self.assertEqual(result[0]["Authorization"], "DEFAULT:KEY")
+
+    def test_concurrent_clients_are_isolated(self):
+        # Many tenants can be served from one process at the same time
+        clients = [self.client("TENANT:%d" % n) for n in range(8)]
+        results = {}
+
+        def worker(client):
+            for _ in range(5):
+                row = client.getMarketsBySymbol(symbols="aapl:us")[0]
+                results.setdefault(client.apikey, set()).add(row["Authorization"])
+
+        threads = [threading.Thread(target=worker, args=(c,)) for c in clients]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(results, {c.apikey: {c.apikey} for c in clients})
+
+    def test_activate_scopes_module_functions(self):
+        # Module functions called inside activate() use that client
+        client = self.client("TENANT:ONE")
+
+        with client.activate():
+            inside = te.getMarketsBySymbol(symbols="aapl:us")
+        outside = te.getMarketsBySymbol(symbols="aapl:us")
+
+        self.assertEqual(inside[0]["Authorization"], "TENANT:ONE")
+        self.assertEqual(outside[0]["Authorization"], "DEFAULT:KEY")
+
+    def test_streamed_results_use_the_client(self):
+        # Lazy results consumed after the call returned still use its client
+        client = self.client("TENANT:ONE")
+
+        frames = client.getMarketsIntradayByInterval(
+            symbol="aapl:us", interval="1m", initDate="2024-01-01", endDate="2024-01-20", stream=True
+        )
+        pages = client.iterWBCountry(country="mexico")
+        news = client.iterNews(country="mexico", limit=10)
+        results = list(frames) + list(itertools.islice(pages, 2)) + list(itertools.islice(news, 2))
+
+        self.assertGreater(len(results), 4)
+        self.assertEqual({r[0]["Authorization"] for r in results}, {"TENANT:ONE"})
+
+    def test_own_pool_and_cache(self):
+        # Each client has its own connections and response cache
+        first = self.client("TENANT:ONE", memory_cache=ResponseCache())
+        second = self.client("TENANT:TWO")
+
+        first.getMarketsBySymbol(symbols="aapl:us")
+        first.getMarketsBySymbol(symbols="aapl:us")
+        second.getMarketsBySymbol(symbols="aapl:us")
+
+        self.assertEqual(first.memory_cache.stats()["hits"], 1)
+        self.assertEqual(first.pool.created, 1)
+        self.assertEqual(second.pool.created, 1)
+        self.assertEqual(transport.getPool().created, 0)
+
+    def test_own_rate_limiter(self):
+        # Requests of a client take tokens from its own limiter only
+        limiter = TokenBucket(rate=100)
+        client = self.client("TENANT:ONE", rate_limiter=limiter)
+
+        client.getMarketsBySymbol(symbols="aapl:us")
+        te.getMarketsBySymbol(symbols="aapl:us")
+
+        self.assertEqual(limiter.stats()["acquired"], 1)
+
+    def test_asyncio_with_active_client(self):
+        # The asyncio client sends the active client's key
+        client = self.client("TENANT:ONE")
+
+        async def main():
+            with client.activate():
+                result = await aio.getMarketsBySymbol(symbols="aapl:us")
+            await aio.close()
+            return result
+
+        result = asyncio.run(main())
+
+        self.assertEqual(result[0]["Authorization"], "TENANT:ONE")
+
+    def test_invalid_key(self):
+        # Keys are validated like te.login() does
+        with self.assertRaises(fn.CredentialsError):
+            TradingEconomicsClient("no-colon")
+
+    def test_unknown_attribute(self):
+        # Only endpoint functions are exposed as methods
+        client = self.client("TENANT:ONE")
+
+        with self.assertRaises(AttributeError):
+            client.login
+        self.assertIn("getHistoricalData", dir(client))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import json
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from tradingeconomics import decoder
+from tradingeconomics import functions as fn
+from tradingeconomics import glob
+
+
+def body(count):
+    records = [
+        {"Symbol": "AAPL:US", "Date": "2024-01-01", "Close": float(i), "Volume": i}
+        for i in range(count)
+    ]
+    records[1]["Note"] = "split"
+    return json.dumps(records, indent=1).encode()
+
+
+def only_json(name):
+    if name != "json":
+        raise ImportError("No module named %r" % name)
+    return json
+
+
+class TestDecoder(unittest.TestCase):
+
+    def tearDown(self):
+        decoder.setDecoder(glob.JSON_DECODER)
+
+    def test_backends_decode_bytes(self):
+        # Every installed backend decodes a body straight from bytes
+        for name in decoder.BACKENDS:
+            try:
+                decoder.setDecoder(name)
+            except ImportError:
+                continue
+            self.assertEqual(decoder.getDecoder(), name)
+            self.assertEqual(decoder.loads(b'[{"a": 1}]'), [{"a": 1}])
+
+    def test_auto_falls_back_to_stdlib(self):
+        # Without the optional packages the json module is used
+        with patch("importlib.import_module", side_effect=only_json):
+            self.assertEqual(decoder.setDecoder("auto"), "json")
+
+    def test_unknown_backend(self):
+        # Only the known backends can be chosen
+        with self.assertRaises(ValueError):
+            decoder.setDecoder("yaml")
+
+
+class TestLoadsFrame(unittest.TestCase):
+
+    def test_chunked_matches_one_go(self):
+        # Decoding in slices gives the frame built from the whole list
+        data = body(5000)
+        expected = pd.DataFrame(json.loads(data))
+
+        chunked = decoder.loadsFrame(data, chunk=20000)
+
+        pd.testing.assert_frame_equal(chunked, expected)
+
+    def test_cut_inside_a_record(self):
+        # Record boundaries inside strings or nested arrays are not cut
+        records = [
+            {"Title": "},{" * 50, "Items": [{"a": i}, {"b": i}], "Value": i}
+            for i in range(200)
+        ]
+        data = json.dumps(records).encode()
+
+        frame = decoder.loadsFrame(data, chunk=500)
+
+        self.assertEqual(frame["Value"].tolist(), list(range(200)))
+        self.assertEqual(frame["Items"][3], [{"a": 3}, {"b": 3}])
+
+    def test_null_chunk_keeps_numeric_dtype(self):
+        # A column null in a whole slice still ends up numeric
+        records = [{"Close": None} for _ in range(1000)]
+        records += [{"Close": 1.5} for _ in range(1000)]
+        data = json.dumps(records).encode()
+
+        frame = decoder.loadsFrame(data, chunk=2000)
+
+        self.assertEqual(frame["Close"].dtype, "float64")
+        self.assertEqual(frame["Close"].isna().sum(), 1000)
+
+    def test_invalid_body(self):
+        # Malformed bodies raise ValueError like json.loads
+        with self.assertRaises(ValueError):
+            decoder.loadsFrame(body(100)[:-10], chunk=500)
+
+    def test_decode_body_for_df(self):
+        # dataRequest bodies for 'df' decode straight into a DataFrame
+        frame = fn.decodeBody(b'[{"a": 1}, {"a": 2}]', "df")
+
+        self.assertIsInstance(frame, pd.DataFrame)
+        self.assertIs(fn.formatResults(frame, "df"), frame)
+        with self.assertRaises(fn.ParametersError):
+            fn.decodeBody(b"[]", "df")
+        with self.assertRaises(fn.WebRequestError):
+            fn.decodeBody(b"[{", "df")
+
+
+if __name__ == "__main__":
+    unittest.main()
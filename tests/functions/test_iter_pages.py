@@ -0,0 +1,139 @@
+import unittest
+from unittest.mock import patch
+from urllib.parse import urlsplit
+
+from tests.stubserver import StubHandler, StubServer
+from tradingeconomics import comtrade
+from tradingeconomics import federalReserve
+from tradingeconomics import functions as fn
+from tradingeconomics import glob
+from tradingeconomics import transport
+from tradingeconomics import worldBank
+
+PAGES = 5
+ROWS = 3
+
+
+class PagesHandler(StubHandler):
+    requested = []
+
+    def do_GET(self):
+        # /comtrade/countries/<page> has ROWS records on pages 1 to PAGES;
+        # /worldBank/categories/<page> repeats its last page forever;
+        # /fred/snapshot/... answers 404 past its last page
+        path = urlsplit(self.path).path
+        page = int(path.rsplit("/", 1)[1])
+        self.requested.append(page)
+        if path.startswith("/fred/") and page > PAGES:
+            self.reply(404, {"message": "page not found"})
+            return
+        if path.startswith("/worldBank/"):
+            page = min(page, PAGES)
+        rows = []
+        if page <= PAGES:
+            rows = [{"page": page, "row": row} for row in range(ROWS)]
+        self.reply(200, rows)
+
+
+class TestIterPages(unittest.TestCase):
+
+    def setUp(self):
+        PagesHandler.requested = []
+        self.server = StubServer(PagesHandler).start()
+        base_url = self.server.url
+        self.patches = [
+            patch.object(glob, "API_BASE_URL", base_url),
+            patch.object(glob, "apikey", "TESTKEY:SECRET"),
+        ]
+        for p in self.patches:
+            p.start()
+        transport.configurePool()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        transport.getPool().clear()
+        self.server.stop()
+
+    def test_stops_at_empty_page(self):
+        # Pages are yielded in order and the first empty one ends the loop
+        pages = list(comtrade.iterCmtCountry())
+
+        self.assertEqual([page[0]["page"] for page in pages], list(range(1, PAGES + 1)))
+        self.assertEqual(sorted(PagesHandler.requested), list(range(1, PAGES + 2)))
+
+    def test_pages_are_lazy(self):
+        # Nothing past the pages consumed and the prefetched ones is requested
+        pages = comtrade.iterCmtCountry(prefetch=2)
+        next(pages)
+        next(pages)
+        pages.close()
+
+        self.assertLessEqual(max(PagesHandler.requested), 4)
+
+    def test_prefetch_keeps_order(self):
+        # Concurrent pages come back in page order
+        pages = list(comtrade.iterCmtCountry(output_type="df", prefetch=4))
+
+        self.assertEqual([int(page["page"][0]) for page in pages], list(range(1, PAGES + 1)))
+
+    def test_repeated_page_ends_the_loop(self):
+        # A page equal to the previous one is not yielded
+        pages = list(worldBank.iterWBCategories())
+
+        self.assertEqual(len(pages), PAGES)
+
+    def test_not_found_past_the_end_ends_the_loop(self):
+        # A 404 after the last page ends the walk instead of raising
+        pages = list(federalReserve.iterFedRSnaps(state="tennessee", prefetch=3))
+
+        self.assertEqual([page[0]["page"] for page in pages], list(range(1, PAGES + 1)))
+
+    def test_not_found_first_page_raises(self):
+        # A 404 for the first page is still an error
+        with self.assertRaises(fn.ParametersError):
+            list(fn.iterPages(lambda page: "/fred/snapshot/state/x/%d" % (page + PAGES), None))
+
+    def test_all_pages_merged(self):
+        # all_pages=True returns every page in one frame
+        frame = comtrade.getCmtCountry(output_type="df", all_pages=True)
+
+        self.assertEqual(len(frame), PAGES * ROWS)
+        self.assertEqual(frame["page"].tolist()[::ROWS], list(range(1, PAGES + 1)))
+
+    def test_no_pages(self):
+        # An endpoint without data raises like a single request
+        with self.assertRaises(fn.NoDataError):
+            fn.mergeResults(fn.iterPages(lambda page: "/comtrade/countries/9%d" % page, None), None)
+
+
+class TestPagedEndpoints(unittest.TestCase):
+
+    @patch("tradingeconomics.functions.dataRequest")
+    def test_page_urls(self, mock_dataRequest):
+        # Each endpoint appends the page number the way its page parameter does
+        mock_dataRequest.side_effect = lambda api_request, output_type: None
+        cases = [
+            (worldBank.iterWBCountry("portugal"), "/worldBank/country/portugal/1"),
+            (comtrade.iterCmtTwoCountries("portugal", "spain"), "/comtrade/country/portugal/spain/1"),
+            (federalReserve.iterFedRSnaps(state="tennessee"), "/fred/snapshot/state/tennessee/1"),
+        ]
+        for pages, url in cases:
+            self.assertEqual(list(pages), [])
+            self.assertEqual(mock_dataRequest.call_args[0][0], url)
+
+    def test_missing_parameters(self):
+        # Required parameters are checked before any request and raise
+        cases = [
+            (worldBank.iterWBCountry, worldBank.ParametersError, "A country is required!"),
+            (comtrade.iterCmtTwoCountries, comtrade.ParametersError, "country1 is required"),
+            (federalReserve.iterFedRSnaps, federalReserve.ParametersError, "A parameter must be provided!"),
+        ]
+        for iterate, error, message in cases:
+            with self.assertRaisesRegex(error, message):
+                for page in iterate():
+                    self.fail("yielded %r" % (page,))
+
+
+if __name__ == "__main__":
+    unittest.main()
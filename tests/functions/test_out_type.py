@@ -0,0 +1,64 @@
+import unittest
+
+import pandas as pd
+
+from tradingeconomics import functions as fn
+from tradingeconomics import historical
+
+
+def frame():
+    return pd.DataFrame(
+        [
+            {"Country": "Mexico", "Category": "GDP", "LatestValue": 1.0, "Unit": "USD"},
+            {"Country": "Sweden", "Category": "GDP", "LatestValue": 2.0, "Unit": "SEK"},
+            {"Country": "Mexico", "Category": "CPI", "LatestValue": 3.0, "Unit": "%"},
+            {"Country": "Mexico", "Category": "GDP", "LatestValue": 4.0, "Unit": "USD"},
+        ]
+    )
+
+
+class TestOutType(unittest.TestCase):
+
+    def test_nested_records(self):
+        # Records are nested by country and category without those keys
+        result = fn.out_type(frame())
+
+        self.assertEqual(
+            result["Mexico"]["GDP"],
+            [{"LatestValue": 1.0, "Unit": "USD"}, {"LatestValue": 4.0, "Unit": "USD"}],
+        )
+        self.assertEqual(result["Sweden"]["GDP"], [{"LatestValue": 2.0, "Unit": "SEK"}])
+
+    def test_missing_pairs_are_empty(self):
+        # Every country gets every category, unless sparse is requested
+        self.assertEqual(fn.out_type(frame())["Sweden"]["CPI"], [])
+        self.assertNotIn("CPI", fn.out_type(frame(), sparse=True)["Sweden"])
+
+    def test_key_order(self):
+        # Countries and categories keep their order of first appearance
+        result = fn.out_type(frame())
+
+        self.assertEqual(list(result), ["Mexico", "Sweden"])
+        self.assertEqual(list(result["Mexico"]), ["GDP", "CPI"])
+
+    def test_commodities_nest_by_title(self):
+        # isCommodity nests by Title
+        data = pd.DataFrame(
+            [{"Title": "Gold", "Category": "Metals", "Last": 2000.0}]
+        )
+
+        self.assertEqual(fn.out_type(data, isCommodity=True), {"Gold": {"Metals": [{"Last": 2000.0}]}})
+
+    def test_streaming_variant(self):
+        # iterOutType yields one (country, category, records) per present pair
+        pairs = [(c, k, len(r)) for c, k, r in fn.iterOutType(frame())]
+
+        self.assertEqual(pairs, [("Mexico", "GDP", 2), ("Sweden", "GDP", 1), ("Mexico", "CPI", 1)])
+
+    def test_historical_out_type(self):
+        # historical.out_type returns the same nested dict
+        self.assertEqual(historical.out_type(frame()), fn.out_type(frame()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,156 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+from urllib.parse import unquote
+
+import pandas as pd
+
+from tradingeconomics import functions as fn
+from tradingeconomics import glob
+from tradingeconomics import historical
+from tradingeconomics.client import TradingEconomicsClient, getClient
+
+
+COUNTRIES = ["Country %03d" % i for i in range(120)]
+
+
+def records(url, output_type=None):
+    # One record per country of the chunk, tagged with the chunk URL
+    countries = url.split("/historical/country/")[1].split("/indicator/")[0]
+    rows = [{"Country": unquote(c), "Url": url} for c in countries.split("%2C")]
+    return pd.DataFrame(rows) if output_type == "df" else rows
+
+
+class TestPlanHistorical(unittest.TestCase):
+
+    def test_small_request_is_one_chunk(self):
+        # Short lists keep the single request
+        plan = historical.planHistorical(["mexico", "sweden"], "gdp", ["2015-01-01"])
+
+        self.assertEqual(plan, [(["mexico", "sweden"], ["gdp"])])
+
+    def test_url_length_splits_countries(self):
+        # Every chunk fits the URL budget and the countries keep their order
+        plan = historical.planHistorical(COUNTRIES, ["gdp"], ["2015-01-01"], max_url=400)
+
+        self.assertGreater(len(plan), 1)
+        self.assertEqual([c for chunk, _ in plan for c in chunk], COUNTRIES)
+        for countries, indicators in plan:
+            url = glob.API_BASE_URL + fn.finalLink(
+                historical.paramCheck(countries, indicators), ["2015-01-01"]
+            )
+            self.assertLessEqual(len(url), 400)
+
+    def test_expected_rows_split_countries(self):
+        # Ten years of monthly data for 5 series per chunk stays under 600 rows
+        plan = historical.planHistorical(
+            COUNTRIES[:20], ["gdp"], ["2010-01-01", "2020-01-01"], max_rows=600
+        )
+
+        self.assertEqual([len(c) for c, _ in plan], [4] * 5)
+
+    def test_long_indicator_lists_are_split(self):
+        # Indicators are split too when they alone exceed half the budget
+        indicators = ["Indicator %03d" % i for i in range(100)]
+        plan = historical.planHistorical(["mexico"], indicators, ["2015-01-01"], max_url=600)
+
+        self.assertGreater(len(plan), 1)
+        self.assertEqual([i for _, chunk in plan for i in chunk], indicators)
+
+
+class TestHistoricalFanOut(unittest.TestCase):
+
+    def setUp(self):
+        self.patches = [
+            patch.object(glob, "MAX_URL_LENGTH", 400),
+            patch.object(glob, "apikey", "TESTKEY:SECRET"),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+
+    @patch("tradingeconomics.functions.dataRequest", side_effect=records)
+    def test_results_merged_in_order(self, mock_request):
+        # Chunks are requested separately and merged in country order
+        result = historical.getHistoricalData(
+            country=COUNTRIES, indicator="gdp", initDate="2015-01-01"
+        )
+
+        self.assertGreater(mock_request.call_count, 1)
+        self.assertEqual([r["Country"] for r in result], COUNTRIES)
+
+    @patch("tradingeconomics.functions.dataRequest", side_effect=records)
+    def test_data_frames_concatenated(self, mock_request):
+        # DataFrame chunks are concatenated with a fresh index
+        frame = historical.getHistoricalData(
+            country=COUNTRIES, indicator="gdp", initDate="2015-01-01", output_type="df"
+        )
+
+        self.assertEqual(list(frame["Country"]), COUNTRIES)
+        self.assertEqual(list(frame.index), list(range(len(COUNTRIES))))
+
+    def test_chunks_without_data_are_skipped(self):
+        # A chunk without records does not fail the whole request
+        def request(url, output_type):
+            if "Country%20000" in url:
+                raise fn.NoDataError("No data available for the provided parameters.")
+            return records(url)
+
+        with patch("tradingeconomics.functions.dataRequest", side_effect=request):
+            result = historical.getHistoricalData(
+                country=COUNTRIES, indicator="gdp", initDate="2015-01-01"
+            )
+
+        self.assertNotIn("Country 000", [r["Country"] for r in result])
+        self.assertIn("Country 119", [r["Country"] for r in result])
+
+
+class TestFetchAll(unittest.TestCase):
+
+    def test_bounded_workers(self):
+        # No more than the given number of requests run at once
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def request(url, output_type):
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+            return [url]
+
+        with patch("tradingeconomics.functions.dataRequest", side_effect=request):
+            results = fn.fetchAll(["/u%d" % i for i in range(12)], None, workers=3)
+
+        self.assertEqual(results, [["/u%d" % i] for i in range(12)])
+        self.assertEqual(running[1], 3)
+
+    def test_workers_see_the_active_client(self):
+        # Requests made by workers go through the caller's client
+        client = TradingEconomicsClient(apikey="OTHER:KEY")
+        seen = []
+
+        def request(url, output_type):
+            seen.append(getClient())
+            return [url]
+
+        with patch("tradingeconomics.functions.dataRequest", side_effect=request):
+            with client.activate():
+                fn.fetchAll(["/a", "/b", "/c"], None, workers=2)
+
+        self.assertEqual(seen, [client] * 3)
+
+    def test_all_empty(self):
+        # Merging only missing results raises like a single empty request
+        with self.assertRaises(fn.ParametersError):
+            fn.mergeResults([None, None], "df")
+
+
+if __name__ == "__main__":
+    unittest.main()
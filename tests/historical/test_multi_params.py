@@ -0,0 +1,90 @@
+import unittest
+
+import pandas as pd
+
+from tradingeconomics.historical import multiParams, multiParsedData, parseData
+
+
+def records():
+    rows = []
+    for country in ("Mexico", "Sweden"):
+        for category in ("GDP", "Population"):
+            if country == "Sweden" and category == "Population":
+                continue
+            for year in (2020, 2021, 2022):
+                rows.append(
+                    {
+                        "Country": country,
+                        "Category": category,
+                        "DateTime": "%d-12-31T00:00:00" % year,
+                        "Value": float(year) + len(country),
+                        "Frequency": "Yearly",
+                    }
+                )
+    return rows
+
+
+class TestMultiParams(unittest.TestCase):
+
+    def test_matches_parse_data_per_pair(self):
+        # Each pair holds the Series parseData builds from its dates and values
+        result = multiParams(records())
+
+        rows = [r for r in records() if r["Country"] == "Mexico" and r["Category"] == "GDP"]
+        expected = parseData(
+            {"dates": [r["DateTime"] for r in rows], "values": [r["Value"] for r in rows]}
+        ).to_dict("Series")[0]
+        (series,) = list(result["Mexico"]["GDP"][0])
+        pd.testing.assert_series_equal(series, expected)
+
+    def test_dtype_per_series(self):
+        # Integer values stay int64 when another pair has floats or gaps
+        rows = [
+            {"Country": "Mexico", "Category": "Population", "DateTime": "2020-12-31", "Value": 126},
+            {"Country": "Mexico", "Category": "Population", "DateTime": "2021-12-31", "Value": 127},
+            {"Country": "Mexico", "Category": "GDP", "DateTime": "2020-12-31", "Value": 1.09},
+            {"Country": "Mexico", "Category": "GDP", "DateTime": "2021-12-31", "Value": None},
+        ]
+        result = multiParams(rows)
+
+        (population,) = list(result["Mexico"]["Population"][0])
+        (gdp,) = list(result["Mexico"]["GDP"][0])
+        self.assertEqual(population.dtype, "int64")
+        self.assertEqual(population.tolist(), [126, 127])
+        self.assertEqual(gdp.dtype, "float64")
+
+    def test_nested_country_indicator_keys(self):
+        # Every country gets every indicator seen in the payload
+        result = multiParams(records())
+
+        self.assertEqual(set(result), {"Mexico", "Sweden"})
+        self.assertEqual(set(result["Sweden"]), {"GDP", "Population"})
+
+    def test_missing_pair_is_empty(self):
+        # A country without records for an indicator holds no Series
+        result = multiParams(records())
+
+        self.assertEqual(list(result["Sweden"]["Population"][0]), [])
+
+    def test_wide_frame(self):
+        # wide=True returns dates by (Country, Category) columns
+        frame = multiParams(records(), wide=True)
+
+        self.assertIsInstance(frame.columns, pd.MultiIndex)
+        self.assertEqual(list(frame.columns.names), ["Country", "Category"])
+        self.assertEqual(len(frame), 3)
+        self.assertEqual(frame[("Sweden", "GDP")].iloc[0], 2026.0)
+        self.assertIsInstance(frame.index, pd.DatetimeIndex)
+
+    def test_multi_parsed_data(self):
+        # multiParsedData parses each pair of a prebuilt dict
+        result = multiParsedData(
+            {"Mexico": {"GDP": {"dates": ["2020-01-01"], "values": [1.5]}}}
+        )
+
+        (series,) = list(result["Mexico"]["GDP"][0])
+        self.assertEqual(series.tolist(), [1.5])
+
+
+if __name__ == "__main__":
+    unittest.main()
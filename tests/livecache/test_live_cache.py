@@ -0,0 +1,225 @@
+import json
+import threading
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from tradingeconomics import glob
+from tradingeconomics import livecache
+from tradingeconomics import stream
+from tradingeconomics.livecache import LastValueCache
+from tradingeconomics.markets import getMarketsBySymbol, getMarketsData
+
+
+def tick(symbol, price, dt=1700000000000):
+    return {"s": symbol, "price": price, "nch": 0.5, "pch": 0.1, "dt": dt, "bid": price}
+
+
+class TestLastValueCache(unittest.TestCase):
+
+    def test_update_and_lookup(self):
+        # Stream fields are stored under the markets endpoint names
+        cache = LastValueCache()
+        cache.update(tick("AAPL:US", 185.2))
+        cache.update(tick("AAPL:US", 185.4, 1700000001000))
+
+        record = cache.get("aapl:us")
+        self.assertEqual(record["Symbol"], "AAPL:US")
+        self.assertEqual(record["Last"], 185.4)
+        self.assertEqual(record["DailyChange"], 0.5)
+        self.assertEqual(record["Date"], "2023-11-14T22:13:21")
+        self.assertNotIn("bid", record)
+        self.assertIn("AAPL:US", cache)
+        self.assertIsNone(cache.get("MSFT:US"))
+        self.assertEqual(cache.updates, 2)
+
+    def test_lookup_returns_copies(self):
+        # Changing a returned record leaves the cache untouched
+        cache = LastValueCache()
+        cache.update(tick("AAPL:US", 1.0))
+        cache.get("AAPL:US")["Last"] = 2.0
+
+        self.assertEqual(cache.get("AAPL:US")["Last"], 1.0)
+
+    def test_messages_without_symbol_are_ignored(self):
+        # Keepalives and calendar messages have no 's'
+        cache = LastValueCache()
+        cache.onMessage(None, '{"topic": "keepalive"}')
+        cache.onMessage(None, "not json")
+        cache.onMessage(None, json.dumps(tick("EURUSD:CUR", 1.1)))
+
+        self.assertEqual(cache.symbols(), ["EURUSD:CUR"])
+
+    def test_seed_keeps_newer_stream_values(self):
+        # Endpoint records add fields; streamed prices win over them
+        cache = LastValueCache()
+        cache.update(tick("AAPL:US", 190.0))
+        cache.seed(
+            [
+                {"Symbol": "AAPL:US", "Name": "Apple", "Last": 180.0},
+                {"Symbol": "MSFT:US", "Name": "Microsoft", "Last": 400.0},
+            ]
+        )
+
+        self.assertEqual(cache.get("AAPL:US")["Name"], "Apple")
+        self.assertEqual(cache.get("AAPL:US")["Last"], 190.0)
+        self.assertIsNone(cache.age("MSFT:US"))
+
+    def test_freshness(self):
+        # Symbols older than max_age, never streamed or never seeded are not fresh
+        cache = LastValueCache(max_age=5)
+        cache.seed([{"Symbol": "AAPL:US", "Name": "Apple"}])
+        cache.seed([{"Symbol": "MSFT:US", "Name": "Microsoft"}])
+        with patch("tradingeconomics.livecache.time.monotonic", return_value=100.0):
+            cache.update(tick("AAPL:US", 1.0))
+        with patch("tradingeconomics.livecache.time.monotonic", return_value=104.0):
+            self.assertEqual(len(cache.fresh(["AAPL:US"])), 1)
+            self.assertIsNone(cache.fresh(["AAPL:US", "MSFT:US"]))
+            cache.update(tick("EURUSD:CUR", 1.0))
+            self.assertIsNone(cache.fresh(["EURUSD:CUR"]))
+        with patch("tradingeconomics.livecache.time.monotonic", return_value=106.0):
+            self.assertIsNone(cache.fresh(["AAPL:US"]))
+
+    def test_snapshot(self):
+        # All records become a DataFrame indexed by symbol
+        cache = LastValueCache()
+        self.assertTrue(cache.snapshot("df").empty)
+        cache.update(tick("AAPL:US", 1.0))
+        cache.update(tick("EURUSD:CUR", 2.0))
+        df = cache.snapshot("df")
+
+        self.assertIsInstance(df, pd.DataFrame)
+        self.assertEqual(df.loc["EURUSD:CUR", "Last"], 2.0)
+        self.assertEqual(len(cache.snapshot()), 2)
+
+    def test_concurrent_updates(self):
+        # Writers on several threads leave one record per symbol
+        cache = LastValueCache()
+
+        def write(n):
+            for i in range(2000):
+                cache.update(tick("SYM%d" % (i % 50), float(n)))
+
+        threads = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(cache), 50)
+        self.assertEqual(cache.updates, 8000)
+
+
+@patch.object(glob, "apikey", "TESTKEY")
+@patch.object(glob, "_event", ["AAPL:US", "MSFT:US"])
+class TestPreferLive(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = livecache.enableLiveCache(prefer_live=True, max_age=60)
+
+    def tearDown(self):
+        livecache.disableLiveCache()
+
+    @patch("tradingeconomics.markets.fn.dataRequest")
+    def test_fresh_subscribed_symbols_are_answered_live(self, mock_request):
+        # No request when every symbol is subscribed, seeded and fresh
+        self.cache.seed(
+            [
+                {"Symbol": "AAPL:US", "Name": "Apple", "Last": 180.0},
+                {"Symbol": "MSFT:US", "Name": "Microsoft", "Last": 390.0},
+            ]
+        )
+        self.cache.update(tick("AAPL:US", 185.2))
+        self.cache.update(tick("MSFT:US", 400.1))
+        df = getMarketsBySymbol(["aapl:us", "msft:us"], output_type="df")
+
+        mock_request.assert_not_called()
+        self.assertEqual(df["Last"].tolist(), [185.2, 400.1])
+        self.assertEqual(df["Name"].tolist(), ["Apple", "Microsoft"])
+        self.assertEqual(self.cache.hits, 1)
+
+    @patch(
+        "tradingeconomics.markets.fn.dataRequest",
+        return_value=[{"Symbol": "AAPL:US", "Name": "Apple", "Last": 1.0}],
+    )
+    def test_unseeded_symbols_make_the_request(self, mock_request):
+        # Streamed records lack Name, so the first call still asks the endpoint
+        self.cache.update(tick("AAPL:US", 185.2))
+        result = getMarketsBySymbol(["AAPL:US"])
+
+        mock_request.assert_called_once_with("/markets/symbol/AAPL%3AUS", "raw")
+        self.assertEqual(result[0]["Name"], "Apple")
+        self.assertEqual(self.cache.hits, 0)
+
+        self.cache.update(tick("AAPL:US", 185.3))
+        getMarketsBySymbol(["AAPL:US"])
+        mock_request.assert_called_once()
+        self.assertEqual(self.cache.hits, 1)
+
+    @patch(
+        "tradingeconomics.markets.fn.dataRequest",
+        return_value=[{"Symbol": "AAPL:US", "Last": 1.0}, {"Symbol": "INDU:IND", "Last": 2.0}],
+    )
+    def test_unsubscribed_symbol_makes_the_request(self, mock_request):
+        # INDU:IND is not subscribed, so the endpoint answers
+        self.cache.update(tick("AAPL:US", 185.2))
+        result = getMarketsBySymbol("aapl:us,indu:ind")
+
+        mock_request.assert_called_once_with("/markets/symbol/aapl%3Aus%2Cindu%3Aind", "raw")
+        self.assertEqual(result[1]["Last"], 2.0)
+
+    @patch(
+        "tradingeconomics.markets.fn.dataRequest",
+        return_value=[{"Symbol": "AAPL:US", "Name": "Apple", "Last": 1.0}],
+    )
+    def test_markets_data_learns_its_symbols(self, mock_request):
+        # The first answer tells which symbols later calls can take from the cache
+        getMarketsData("index")
+        self.cache.update(tick("AAPL:US", 185.2))
+        result = getMarketsData("index")
+
+        mock_request.assert_called_once_with("/markets/index", "raw")
+        self.assertEqual(result[0]["Name"], "Apple")
+        self.assertEqual(result[0]["Last"], 185.2)
+
+    @patch(
+        "tradingeconomics.markets.fn.dataRequest",
+        return_value=[{"Symbol": "AAPL:US", "Name": "Apple", "Last": 1.0}],
+    )
+    def test_off_without_prefer_live(self, mock_request):
+        # Without prefer_live calls take the usual dataRequest path
+        self.cache.prefer_live = False
+        self.cache.update(tick("AAPL:US", 185.2))
+        getMarketsBySymbol("aapl:us", output_type="df")
+
+        mock_request.assert_called_once_with("/markets/symbol/aapl%3Aus", "df")
+        self.assertNotIn("Name", self.cache.get("AAPL:US"))
+
+
+@patch("builtins.print")
+@patch.object(glob, "apikey", "TESTKEY:SECRET")
+@patch("tradingeconomics.stream.websocket.WebSocketApp")
+class TestStreamFeed(unittest.TestCase):
+
+    def tearDown(self):
+        livecache.disableLiveCache()
+        stream.configureDispatch()
+
+    def test_stream_messages_update_the_cache(self, mock_app, *mocks):
+        # Ticks reach the cache as well as on_message
+        def run_forever(**kwargs):
+            on_message = mock_app.call_args.kwargs["on_message"]
+            on_message(None, json.dumps(tick("EURUSD:CUR", 1.08)))
+            on_message(None, json.dumps(tick("EURUSD:CUR", 1.09)))
+            stream.stop()
+
+        mock_app.return_value.run_forever.side_effect = run_forever
+        cache = livecache.enableLiveCache()
+        stream.run(lambda ws, message: None)
+
+        self.assertEqual(cache.get("EURUSD:CUR")["Last"], 1.09)
+
+
+if __name__ == "__main__":
+    unittest.main()
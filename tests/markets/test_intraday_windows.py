@@ -0,0 +1,116 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+from tests.stubserver import StubServer
+from tradingeconomics import functions as fn
+from tradingeconomics import glob
+from tradingeconomics import markets
+from tradingeconomics import transport
+
+
+def bars(path):
+    # Hourly bars of every day from d1 to d2, both included
+    url = urlsplit(path)
+    query = parse_qs(url.query)
+    symbol = url.path.rsplit("/", 1)[1].replace("%3A", ":").upper()
+    day = datetime.strptime(query["d1"][0], "%Y-%m-%d")
+    last = datetime.strptime(query["d2"][0], "%Y-%m-%d")
+    rows = []
+    while day <= last:
+        for hour in range(24):
+            stamp = day + timedelta(hours=hour)
+            rows.append({"Symbol": symbol, "Date": stamp.isoformat(), "Close": hour})
+        day += timedelta(days=1)
+    return rows
+
+
+class TestIntradayWindows(unittest.TestCase):
+
+    def test_window_size_follows_interval(self):
+        # 20k one-hour bars are more than a month, 20k one-minute bars 13 days
+        hourly = markets.intradayWindows("2024-01-01", "2024-03-01", "1h")
+        minutes = markets.intradayWindows("2024-01-01", "2024-03-01", "1m")
+
+        self.assertEqual(hourly, [("2024-01-01", "2024-03-01")])
+        self.assertEqual(minutes[0], ("2024-01-01", "2024-01-14"))
+        self.assertEqual(minutes[-1][1], "2024-03-01")
+        for (_, end), (start, _) in zip(minutes, minutes[1:]):
+            self.assertEqual(end, start)
+
+    def test_symbols_share_the_window(self):
+        # Several symbols in one request shorten the windows
+        windows = markets.intradayWindows("2024-01-01", "2024-01-31", "1m", symbols=13)
+
+        self.assertEqual(len(windows), 30)
+
+    def test_records_without_keys_are_kept(self):
+        # Records missing the key fields are not treated as one repeated key
+        records = [{"a": 1}, {"a": 2}, {"Date": "d", "Symbol": "s"}, {"Date": "d", "Symbol": "s"}]
+        kept, keys = fn.dropSeen(records, None, ["Date", "Symbol"], set())
+
+        self.assertEqual(kept, records[:3])
+        self.assertEqual(keys, {("d", "s")})
+
+    def test_unknown_interval_is_not_split(self):
+        # Intervals without a known bar length keep one request
+        self.assertEqual(
+            markets.intradayWindows("2024-01-01", "2024-06-01", "1d"),
+            [("2024-01-01", "2024-06-01")],
+        )
+
+
+class TestIntradayFanOut(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubServer(bars).start()
+        base_url = self.server.url
+        self.patches = [
+            patch.object(glob, "API_BASE_URL", base_url),
+            patch.object(glob, "apikey", "TESTKEY:SECRET"),
+            patch.object(glob, "INTRADAY_WINDOW_BARS", 24 * 60 * 3),
+        ]
+        for p in self.patches:
+            p.start()
+        transport.configurePool()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        transport.getPool().clear()
+        self.server.stop()
+
+    def test_merged_without_repeated_bars(self):
+        # Windows are merged in order and edge days appear once
+        frame = markets.getMarketsIntradayByInterval(
+            "aapl:us", "1m", "2024-01-01", "2024-01-20", output_type="df"
+        )
+
+        self.assertEqual(len(frame), 20 * 24)
+        self.assertTrue(frame["Date"].is_monotonic_increasing)
+        self.assertFalse(frame.duplicated(["Date", "Symbol"]).any())
+
+    def test_stream_of_frames(self):
+        # stream=True yields one frame per window
+        frames = list(
+            markets.getMarketsIntradayByInterval(
+                "aapl:us", "1m", "2024-01-01", "2024-01-10", output_type="df", stream=True
+            )
+        )
+
+        self.assertEqual(len(frames), 3)
+        self.assertEqual(sum(len(f) for f in frames), 10 * 24)
+
+    def test_records(self):
+        # Lists of dicts are de-duplicated too
+        records = markets.getMarketsIntradayByInterval(
+            "aapl:us", "1m", "2024-01-01", "2024-01-07"
+        )
+
+        self.assertEqual(len(records), 7 * 24)
+        self.assertEqual(records[0]["Date"], "2024-01-01T00:00:00")
+
+
+if __name__ == "__main__":
+    unittest.main()
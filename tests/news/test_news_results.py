@@ -0,0 +1,128 @@
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from tradingeconomics import functions as fn
+from tradingeconomics import glob
+from tradingeconomics import historical
+from tradingeconomics import news
+from tradingeconomics import schema
+from tradingeconomics.transport import Response
+
+
+def article(i, country):
+    return {
+        "id": str(i),
+        "title": "Title %d" % i,
+        "date": "2024-01-0%dT00:00:00" % (i + 1),
+        "description": "Description",
+        "content": "Content",
+        "country": country,
+        "category": "Stock Market",
+        "symbol": "INDU:IND",
+        "url": "/united-states/stock-market",
+        "importance": 1,
+    }
+
+
+class TestNewsResults(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = MagicMock()
+        self.patches = [
+            patch("tradingeconomics.transport.getPool", return_value=self.pool),
+            patch.object(glob, "apikey", "TESTKEY:SECRET"),
+        ]
+        for p in self.patches:
+            p.start()
+        schema.enableSchemas()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        schema.disableSchemas()
+
+    def respond(self, records):
+        self.pool.request.return_value = Response(200, "OK", {}, json.dumps(records).encode())
+
+    def test_news_frame(self):
+        # News frames keep every field and store repeated strings as categories
+        self.respond([article(i, "Mexico") for i in range(3)])
+        df = news.getNews(country="mexico", output_type="df")
+
+        self.assertEqual(list(df.columns), list(article(0, "Mexico")))
+        self.assertEqual(str(df["country"].dtype), "category")
+        self.assertEqual(list(df["country"].cat.categories), ["Mexico"])
+        self.assertNotEqual(str(df["title"].dtype), "category")
+        self.assertEqual(df["date"].dtype.kind, "M")
+
+    def test_article_frame(self):
+        # Article frames keep the content
+        self.respond([article(0, "Mexico")])
+        df = news.getArticleId(id="0", output_type="df")
+
+        self.assertEqual(df["content"][0], "Content")
+        self.assertEqual(str(df["category"].dtype), "category")
+
+    def test_rating_frame(self):
+        # Historical ratings have a schema of their own
+        self.respond(
+            [{"Country": "Mexico", "Date": "2024-01-10", "Agency": "S&P", "Rating": "BBB", "Outlook": "Stable"}]
+        )
+        df = historical.getHistoricalRatings(country="mexico", output_type="df")
+
+        self.assertEqual(str(df["Agency"].dtype), "category")
+        self.assertEqual(df["Date"].dtype.kind, "M")
+
+
+
+class TestFrameHelpers(unittest.TestCase):
+
+    def test_news_frame(self):
+        # The news helper returns one column per field with country stripped
+        records = [article(0, "United States "), article(1, " Mexico")]
+        df = news.getNewsResults(records, None)
+
+        self.assertEqual(
+            list(df.columns),
+            ["id", "title", "date", "description", "country", "category", "symbol", "url"],
+        )
+        self.assertEqual(list(df["country"]), ["United States", "Mexico"])
+        self.assertEqual(list(df["id"]), ["0", "1"])
+
+    def test_article_frame(self):
+        # The article helper keeps the content and strips the category
+        record = dict(article(0, "Mexico"), category=" Stock Market ")
+        df = news.getArticleResults([record], None)
+
+        self.assertEqual(df["content"][0], "Content")
+        self.assertEqual(df["category"][0], "Stock Market")
+
+    def test_categorical(self):
+        # Repeated strings can be stored with the category dtype
+        records = [article(i, "Mexico") for i in range(3)]
+        df = news.getNewsResults(records, None, categorical=True)
+
+        self.assertEqual(str(df["country"].dtype), "category")
+        self.assertEqual(list(df["country"].cat.categories), ["Mexico"])
+        self.assertNotEqual(str(df["title"].dtype), "category")
+
+    def test_rating_frame(self):
+        # The ratings helper strips the rating
+        records = [
+            {"Country": "Mexico", "Date": "2024", "Agency": "S&P", "Rating": "BBB ", "Outlook": "Stable"}
+        ]
+        df = historical.getRatingResults(records, None, categorical=True)
+
+        self.assertEqual(df["Rating"][0], "BBB")
+        self.assertEqual(str(df["Agency"].dtype), "category")
+
+    def test_single_field(self):
+        # A single field still builds a one column frame
+        df = fn.columnarFrame([{"id": 1}, {"id": 2}], ["id"])
+
+        self.assertEqual(list(df["id"]), [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlsplit
+
+from tests.stubserver import StubHandler, StubServer
+from tradingeconomics import glob
+from tradingeconomics import news
+from tradingeconomics import transport
+
+
+def item(id):
+    # Ids and dates grow together, one item per hour from 2024-01-01
+    date = datetime(2024, 1, 1) + timedelta(hours=id)
+    return {"id": str(id), "title": "news %d" % id, "date": date.isoformat()}
+
+
+class NewsHandler(StubHandler):
+    items = []
+    requested = []
+    published = []
+
+    def do_GET(self):
+        # Newest first, served by start and limit (lim for articles); items
+        # in published are added to the head after the first request
+        query = parse_qs(urlsplit(self.path).query)
+        limit = int((query.get("limit") or query.get("lim"))[0])
+        start = int(query.get("start", ["0"])[0])
+        self.requested.append((urlsplit(self.path).path, start))
+        window = self.items[start:start + limit]
+        while self.published:
+            self.items.insert(0, self.published.pop())
+        self.reply(200, window)
+
+
+class TestNewsWindows(unittest.TestCase):
+
+    def setUp(self):
+        NewsHandler.items = [item(id) for id in range(100, 0, -1)]
+        NewsHandler.requested = []
+        NewsHandler.published = []
+        self.server = StubServer(NewsHandler).start()
+        base_url = self.server.url
+        self.patches = [
+            patch.object(glob, "API_BASE_URL", base_url),
+            patch.object(glob, "apikey", "TESTKEY:SECRET"),
+        ]
+        for p in self.patches:
+            p.start()
+        transport.configurePool()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        transport.getPool().clear()
+        self.server.stop()
+
+    def ids(self, windows):
+        return [int(record["id"]) for window in windows for record in window]
+
+    def test_walks_every_window(self):
+        # Without a watermark every item is returned once, newest first
+        ids = self.ids(news.iterNews(limit=30))
+
+        self.assertEqual(ids, list(range(100, 0, -1)))
+        self.assertEqual([start for _, start in NewsHandler.requested], [0, 30, 60, 90])
+
+    def test_stops_at_id_watermark(self):
+        # Items up to since_id are not returned nor requested further
+        ids = self.ids(news.iterNews(since_id=75, limit=10))
+
+        self.assertEqual(ids, list(range(100, 75, -1)))
+        self.assertEqual(len(NewsHandler.requested), 3)
+
+    def test_stops_at_date_watermark(self):
+        # Items older than since are dropped
+        since = item(50)["date"]
+        frames = news.iterNews(since=since, limit=20, output_type="df")
+        ids = self.ids(f.to_dict("records") for f in frames)
+
+        self.assertEqual(ids, list(range(100, 49, -1)))
+
+    def test_new_items_are_not_repeated(self):
+        # Items pushed down by newer ones are returned once
+        NewsHandler.published = [item(101), item(102)]
+        ids = self.ids(news.iterNews(since_id=80, limit=10))
+
+        self.assertEqual(ids, list(range(100, 80, -1)))
+
+    def test_prefetch_keeps_order(self):
+        # Windows fetched ahead come back in order
+        frames = list(news.iterNews(country="mexico", limit=7, output_type="df", prefetch=3))
+
+        self.assertEqual(self.ids(f.to_dict("records") for f in frames), list(range(100, 0, -1)))
+        self.assertEqual(NewsHandler.requested[0][0], "/news/country/mexico")
+
+    def test_articles(self):
+        # Articles are walked with start and lim
+        ids = self.ids(news.iterArticles(country="mexico", since_id=90, lim=4))
+
+        self.assertEqual(ids, list(range(100, 90, -1)))
+        self.assertEqual(NewsHandler.requested[0], ("/articles/country/mexico", 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import subprocess
+import sys
+import unittest
+
+import tradingeconomics as te
+
+
+def run(code):
+    return subprocess.check_output([sys.executable, "-c", code], text=True).strip()
+
+
+class TestLazyImport(unittest.TestCase):
+
+    def test_import_does_not_load_pandas(self):
+        # Importing the package and using raw endpoints does not load pandas or dateutil
+        out = run(
+            "import sys, tradingeconomics as te; te.getMarketsData; te.getCalendarData;"
+            "print(sorted(m for m in ('pandas', 'dateutil', 'websocket') if m in sys.modules))"
+        )
+
+        self.assertEqual(out, "[]")
+
+    def test_stream_does_not_load_numpy(self):
+        # numpy is loaded by tick batching only, not by importing the stream
+        out = run(
+            "import sys, tradingeconomics.stream;"
+            "print(sorted(m for m in ('numpy', 'pandas') if m in sys.modules))"
+        )
+
+        self.assertEqual(out, "[]")
+
+    def test_dataframe_output_loads_pandas(self):
+        # pandas is imported once a DataFrame is built
+        out = run(
+            "import sys; from tradingeconomics import functions as fn;"
+            "fn.formatResults([{'a': 1}], 'df'); print('pandas' in sys.modules)"
+        )
+
+        self.assertEqual(out, "True")
+
+    def test_public_names_resolve(self):
+        # Every exported name resolves to its function or exception class
+        for name in te.__all__:
+            self.assertTrue(callable(getattr(te, name)), name)
+        self.assertIs(te.getMarketsData, te.markets.getMarketsData)
+        self.assertTrue(issubclass(te.WebRequestError, ValueError))
+
+    def test_dir_lists_lazy_names(self):
+        # dir() shows names that have not been loaded yet
+        self.assertIn("getWBHistorical", dir(te))
+
+    def test_unknown_attribute(self):
+        # Unknown names raise AttributeError
+        with self.assertRaises(AttributeError):
+            te.getNothing
+
+
+if __name__ == "__main__":
+    unittest.main()
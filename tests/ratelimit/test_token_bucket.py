@@ -0,0 +1,178 @@
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from email.utils import formatdate
+from unittest.mock import MagicMock, patch
+
+from tradingeconomics import functions as fn
+from tradingeconomics import glob
+from tradingeconomics import ratelimit
+from tradingeconomics.ratelimit import TokenBucket
+from tradingeconomics.transport import Response
+
+
+def take_tokens(path, count):
+    bucket = TokenBucket(rate=1, burst=10, path=path)
+    for _ in range(count):
+        bucket.reserve()
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_burst_then_steady_rate(self):
+        # The first burst tokens are free, later callers get consecutive slots
+        bucket = TokenBucket(rate=10, burst=3)
+        delays = [bucket.reserve() for _ in range(5)]
+
+        self.assertEqual(delays[:3], [0.0, 0.0, 0.0])
+        self.assertAlmostEqual(delays[3], 0.1, places=2)
+        self.assertAlmostEqual(delays[4], 0.2, places=2)
+
+    @patch("tradingeconomics.ratelimit.time")
+    def test_threads_share_the_rate(self, mock_time):
+        # Many threads together get consecutive slots at the configured rate
+        mock_time.monotonic.return_value = 100.0
+        bucket = TokenBucket(rate=50, burst=1)
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(11)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        sleeps = sorted(c.args[0] for c in mock_time.sleep.call_args_list)
+
+        self.assertEqual(len(sleeps), 10)
+        for slot, delay in enumerate(sleeps, 1):
+            self.assertAlmostEqual(delay, slot * 0.02)
+        self.assertEqual(bucket.stats()["acquired"], 11)
+
+    def test_rejects_non_positive_rate(self):
+        # A zero rate would never refill
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+    def test_retry_after_on_429(self):
+        # A 429 response holds requests back for Retry-After seconds
+        bucket = TokenBucket(rate=100, burst=100)
+        bucket.observe(429, {"Retry-After": "2"})
+
+        self.assertAlmostEqual(bucket.reserve(), 2.01, places=2)
+        self.assertEqual(bucket.stats()["throttled"], 1)
+
+    def test_exhausted_server_budget_waits_for_reset(self):
+        # A zero remaining budget pauses until the server's window resets
+        bucket = TokenBucket(rate=100, burst=100)
+        bucket.observe(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "3"})
+
+        self.assertAlmostEqual(bucket.reserve(), 3.01, places=2)
+
+    def test_remaining_budget_caps_tokens(self):
+        # The bucket never spends more than the server says is left
+        bucket = TokenBucket(rate=10, burst=100)
+        bucket.observe(200, {"RateLimit-Remaining": "2"})
+
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertGreater(bucket.reserve(), 0.0)
+
+    def test_retry_after_http_date(self):
+        # Retry-After may be an HTTP date
+        value = ratelimit.retryAfter({"Retry-After": formatdate(time.time() + 30, usegmt=True)})
+
+        self.assertTrue(28 <= value <= 30)
+        self.assertIsNone(ratelimit.retryAfter({}))
+
+
+class TestSharedBucket(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, "te", "rate")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_buckets_on_one_file_share_the_budget(self):
+        # Two buckets backed by the same file draw from one budget
+        first = TokenBucket(rate=1, burst=2, path=self.path)
+        second = TokenBucket(rate=1, burst=2, path=self.path)
+
+        self.assertEqual(first.reserve(), 0.0)
+        self.assertEqual(second.reserve(), 0.0)
+        self.assertGreater(first.reserve(), 0.9)
+
+    @unittest.skipUnless(
+        "fork" in multiprocessing.get_all_start_methods(), "requires fork"
+    )
+    def test_processes_share_the_budget(self):
+        # Tokens taken by other processes are visible to this one
+        TokenBucket(rate=1, burst=10, path=self.path).reserve(0)
+        context = multiprocessing.get_context("fork")
+        workers = [context.Process(target=take_tokens, args=(self.path, 3)) for _ in range(3)]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+
+        self.assertEqual([w.exitcode for w in workers], [0] * 3)
+        bucket = TokenBucket(rate=1, burst=10, path=self.path)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertGreater(bucket.reserve(), 0.5)
+
+
+class TestDataRequestRateLimit(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = MagicMock()
+        self.pool.request.return_value = Response(200, "OK", {}, b'[{"Country": "Mexico"}]')
+        self.patches = [
+            patch("tradingeconomics.transport.getPool", return_value=self.pool),
+            patch.object(glob, "apikey", "TESTKEY:SECRET"),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        ratelimit.disableRateLimit()
+
+    @patch("tradingeconomics.ratelimit.time.sleep")
+    def test_requests_take_tokens(self, mock_sleep):
+        # Each request sent over the network takes one token
+        limiter = ratelimit.enableRateLimit(rate=1, burst=2)
+        for _ in range(3):
+            fn.dataRequest("/country", None)
+
+        stats = limiter.stats()
+        self.assertEqual(stats["acquired"], 3)
+        self.assertGreater(stats["waited"], 0.5)
+        mock_sleep.assert_called_once()
+
+    def test_429_pauses_the_limiter(self):
+        # A throttled response makes the limiter back off before raising
+        limiter = ratelimit.enableRateLimit(rate=100, burst=100)
+        self.pool.request.return_value = Response(
+            429, "Too Many Requests", {"Retry-After": "5"}, b'{"message": "slow down"}'
+        )
+
+        with self.assertRaises(fn.ParametersError):
+            fn.dataRequest("/country", None)
+        self.assertGreater(limiter.reserve(), 4.9)
+
+    @patch("tradingeconomics.ratelimit.time.sleep")
+    def test_disabled_by_default(self, mock_sleep):
+        # Without a limiter requests are sent immediately
+        self.assertIsNone(ratelimit.getRateLimiter())
+        for _ in range(3):
+            fn.dataRequest("/country", None)
+
+        self.assertEqual(self.pool.request.call_count, 3)
+        mock_sleep.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
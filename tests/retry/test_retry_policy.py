@@ -0,0 +1,161 @@
+import asyncio
+import unittest
+from unittest.mock import MagicMock, patch
+
+from tradingeconomics import functions as fn
+from tradingeconomics import glob
+from tradingeconomics import retry
+from tradingeconomics.retry import RetryPolicy
+from tradingeconomics.transport import Response
+
+
+def response(status, headers=None):
+    return Response(status, "", headers or {}, b'[{"Country": "Mexico"}]')
+
+
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_retryable_statuses(self):
+        # Throttling and transient server errors are retried, client errors are not
+        policy = RetryPolicy(max_attempts=3)
+
+        self.assertIsNotNone(policy.nextDelay(1, response(503)))
+        self.assertIsNotNone(policy.nextDelay(1, response(429)))
+        self.assertIsNone(policy.nextDelay(1, response(404)))
+        self.assertIsNone(policy.nextDelay(1, response(200)))
+
+    def test_gives_up_after_max_attempts(self):
+        # The last attempt is never followed by another
+        policy = RetryPolicy(max_attempts=3)
+
+        self.assertIsNotNone(policy.nextDelay(2, response(503)))
+        self.assertIsNone(policy.nextDelay(3, response(503)))
+
+    @patch("tradingeconomics.retry.random.uniform", side_effect=lambda low, high: high)
+    def test_full_jitter_bound_grows_to_cap(self, _):
+        # The delay is drawn below base * 2 ** (n - 1), capped
+        policy = RetryPolicy(max_attempts=10, backoff_base=0.5, backoff_cap=3)
+
+        self.assertEqual([policy.backoff(n) for n in range(1, 6)], [0.5, 1, 2, 3, 3])
+
+    def test_retry_after_overrides_backoff(self):
+        # The server's Retry-After is waited for, unless it is too long
+        policy = RetryPolicy(max_attempts=3, max_retry_after=60)
+
+        self.assertEqual(policy.nextDelay(1, response(429, {"Retry-After": "7"})), 7.0)
+        self.assertIsNone(policy.nextDelay(1, response(503, {"Retry-After": "3600"})))
+
+    def test_network_errors(self):
+        # Connection failures are retried unless turned off
+        error = ConnectionResetError()
+
+        self.assertIsNotNone(RetryPolicy().nextDelay(1, error=error))
+        self.assertIsNone(RetryPolicy(retry_network_errors=False).nextDelay(1, error=error))
+
+    def test_rejects_zero_attempts(self):
+        # At least one attempt is always made
+        with self.assertRaises(ValueError):
+            RetryPolicy(max_attempts=0)
+
+    @patch("tradingeconomics.retry.time.sleep")
+    def test_call_records_attempts(self, mock_sleep):
+        # Every attempt is timed and retry wall time is accumulated
+        policy = RetryPolicy(max_attempts=5)
+        send = MagicMock(side_effect=[response(503), ConnectionResetError(), response(200)])
+
+        result = policy.call("/markets/index", send)
+
+        self.assertEqual(result.status, 200)
+        self.assertEqual(mock_sleep.call_count, 2)
+        self.assertEqual([a.status for a in policy.history], [503, None, 200])
+        self.assertIsInstance(policy.history[1].error, ConnectionResetError)
+        self.assertEqual(policy.history[2].delay, 0.0)
+        stats = policy.stats()
+        self.assertEqual((stats["requests"], stats["attempts"], stats["retries"]), (1, 3, 2))
+        self.assertGreaterEqual(stats["retry_time"], sum(c[0][0] for c in mock_sleep.call_args_list))
+
+    @patch("tradingeconomics.retry.time.sleep")
+    def test_call_raises_last_network_error(self, _):
+        # When attempts run out the last connection error is raised
+        policy = RetryPolicy(max_attempts=2)
+
+        with self.assertRaises(ConnectionRefusedError):
+            policy.call("/markets/index", MagicMock(side_effect=ConnectionRefusedError()))
+
+    @patch("asyncio.sleep")
+    def test_call_async(self, mock_sleep):
+        # The awaitable variant retries the same way
+        policy = RetryPolicy(max_attempts=3)
+        responses = iter([response(502), response(200)])
+
+        async def send():
+            return next(responses)
+
+        async def no_wait(delay):
+            pass
+
+        mock_sleep.side_effect = no_wait
+        result = asyncio.run(policy.callAsync("/markets/index", send))
+
+        self.assertEqual(result.status, 200)
+        self.assertEqual(policy.stats()["retries"], 1)
+
+
+class TestDataRequestRetry(unittest.TestCase):
+
+    def setUp(self):
+        self.pool = MagicMock()
+        self.patches = [
+            patch("tradingeconomics.transport.getPool", return_value=self.pool),
+            patch.object(glob, "apikey", "TESTKEY:SECRET"),
+            patch("tradingeconomics.retry.time.sleep"),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        retry.setRetryPolicy(None)
+
+    def test_no_retries_by_default(self):
+        # Without a policy a server error fails straight away
+        self.pool.request.side_effect = [response(503), response(200)]
+
+        with self.assertRaises(fn.WebRequestError):
+            fn.dataRequest("/markets/index", None)
+        self.assertEqual(self.pool.request.call_count, 1)
+
+    def test_global_policy(self):
+        # A global policy retries transient failures of every request
+        retry.setRetryPolicy(RetryPolicy(max_attempts=3))
+        self.pool.request.side_effect = [response(500), OSError("reset"), response(200)]
+
+        result = fn.dataRequest("/markets/index", None)
+
+        self.assertEqual(result, [{"Country": "Mexico"}])
+        self.assertEqual(self.pool.request.call_count, 3)
+
+    def test_per_call_policy(self):
+        # retrying() applies a policy to the calls inside the block only
+        self.pool.request.side_effect = [response(429), response(200), response(429)]
+
+        with retry.retrying(RetryPolicy(max_attempts=2)) as policy:
+            fn.dataRequest("/markets/index", None)
+        with self.assertRaises(fn.ParametersError):
+            fn.dataRequest("/markets/index", None)
+        self.assertEqual(policy.stats()["retries"], 1)
+
+    def test_exhausted_network_errors_are_mapped(self):
+        # A connection that keeps failing raises the usual WebRequestError
+        retry.setRetryPolicy(RetryPolicy(max_attempts=2))
+        self.pool.request.side_effect = OSError("unreachable")
+
+        with self.assertRaises(fn.WebRequestError) as ctx:
+            fn.dataRequest("/markets/index", None)
+        self.assertIn("Network error", str(ctx.exception))
+        self.assertEqual(self.pool.request.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from tradingeconomics import functions as fn
+from tradingeconomics import glob
+from tradingeconomics import schema
+from tradingeconomics.transport import Response
+
+
+def historical(count):
+    return [
+        {
+            "Country": "Mexico",
+            "Category": "GDP",
+            "DateTime": "%d-12-31T00:00:00" % (1900 + i),
+            "Value": float(i),
+            "Frequency": "Yearly",
+            "HistoricalDataSymbol": "MXNGDP",
+            "LastUpdate": "2024-01-01T10:00:00",
+        }
+        for i in range(count)
+    ]
+
+
+class TestSchema(unittest.TestCase):
+
+    def tearDown(self):
+        schema.disableSchemas()
+
+    def test_longest_prefix_applies(self):
+        # Markets history uses its own schema, not the one of /historical
+        url = "https://api.tradingeconomics.com/markets/historical/aapl:us?d1=2020-01-01"
+
+        self.assertIs(schema.getSchema(url), schema._registry["/markets/historical"])
+        self.assertIs(
+            schema.getSchema("/historical/country/mexico/indicator/gdp"),
+            schema._registry["/historical"],
+        )
+        self.assertIsNone(schema.getSchema("/markets/index"))
+
+    def test_apply_converts_columns(self):
+        # Dates are parsed, repeated strings become categoricals
+        frame = schema.getSchema("/historical/country/mexico").apply(
+            pd.DataFrame(historical(3)), float32=True
+        )
+
+        self.assertEqual(frame["DateTime"].dtype.kind, "M")
+        self.assertEqual(frame["DateTime"][1], pd.Timestamp("1901-12-31"))
+        self.assertEqual(str(frame["Country"].dtype), "category")
+        self.assertEqual(frame["Value"].dtype, "float32")
+
+    def test_unexpected_format_is_kept(self):
+        # A date column in another format is left as it is
+        frame = pd.DataFrame([{"Symbol": "AAPL:US", "Date": "not a date", "Close": 1.0}])
+        schema.getSchema("/markets/historical").apply(frame)
+
+        self.assertEqual(frame["Date"][0], "not a date")
+        self.assertEqual(frame["Close"].dtype, "float64")
+
+    def test_register(self):
+        # Custom schemas can be added and removed
+        schema.register("/custom/path/", schema.Schema(categories=["Name"]))
+        self.assertIsNotNone(schema.getSchema("/custom/path/x"))
+        schema.register("/custom/path", None)
+        self.assertIsNone(schema.getSchema("/custom/path/x"))
+
+
+class TestDataRequestSchema(unittest.TestCase):
+
+    def setUp(self):
+        pool = MagicMock()
+        pool.request.return_value = Response(200, "OK", {}, json.dumps(historical(5)).encode())
+        self.patches = [
+            patch("tradingeconomics.transport.getPool", return_value=pool),
+            patch.object(glob, "apikey", "TESTKEY:SECRET"),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        schema.disableSchemas()
+
+    def test_off_by_default(self):
+        # Without enableSchemas frames keep the dtypes inferred by pandas
+        frame = fn.dataRequest("/historical/country/mexico", "df")
+
+        self.assertNotEqual(frame["DateTime"].dtype.kind, "M")
+
+    def test_enabled(self):
+        # With schemas enabled dataRequest returns typed frames
+        schema.enableSchemas()
+        frame = fn.dataRequest("/historical/country/mexico", "df")
+        records = fn.dataRequest("/historical/country/mexico", None)
+
+        self.assertEqual(frame["DateTime"].dtype.kind, "M")
+        self.assertEqual(str(frame["Frequency"].dtype), "category")
+        self.assertEqual(frame["Value"].dtype, "float64")
+        self.assertEqual(records[0]["DateTime"], "1900-12-31T00:00:00")
+
+
+if __name__ == "__main__":
+    unittest.main()
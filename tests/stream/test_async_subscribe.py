@@ -0,0 +1,253 @@
+import asyncio
+import base64
+import hashlib
+import json
+import unittest
+
+from tradingeconomics import aiostream
+from tradingeconomics import stream
+from tradingeconomics.aiostream import CLOSE, PING, PONG, TEXT, encodeFrame, readFrame
+
+
+class StubStream(object):
+    # Websocket server answering each subscription with script(event),
+    # a list of (opcode, payload, fin) frames, then closing unless told not
+    # to, and recording the frames of the client
+
+    def __init__(self, script, close_after=True):
+        self.script = script
+        self.close_after = close_after
+        self.received = []
+        self.paths = []
+
+    async def start(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        return "ws://127.0.0.1:%d/?client=KEY" % port
+
+    async def handle(self, reader, writer):
+        head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1").split("\r\n")
+        self.paths.append(head[0].split(" ")[1])
+        headers = dict(line.split(": ", 1) for line in head[1:] if line)
+        accept = base64.b64encode(
+            hashlib.sha1(headers["Sec-WebSocket-Key"].encode() + aiostream._GUID).digest()
+        ).decode()
+        writer.write(
+            (
+                "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n"
+                "Connection: Upgrade\r\nSec-WebSocket-Accept: %s\r\n\r\n" % accept
+            ).encode()
+        )
+        try:
+            while True:
+                fin, opcode, payload = await readFrame(reader)
+                self.received.append((opcode, payload))
+                if opcode == TEXT:
+                    event = json.loads(payload)["to"]
+                    for opcode, data, fin in self.script(event):
+                        frame = bytearray(encodeFrame(opcode, data, mask=False))
+                        if not fin:
+                            frame[0] &= 0x7F
+                        writer.write(bytes(frame))
+                    await writer.drain()
+                    if self.close_after:
+                        writer.write(encodeFrame(CLOSE, b"\x03\xe8", mask=False))
+                        await writer.drain()
+                        writer.close()
+                        return
+        except asyncio.IncompleteReadError:
+            writer.close()
+
+    async def stop(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+
+def ticks(event, count=3):
+    return [
+        (TEXT, json.dumps({"s": event, "price": price}).encode(), True)
+        for price in range(count)
+    ]
+
+
+class TestAsyncSubscribe(unittest.IsolatedAsyncioTestCase):
+
+    async def test_messages_are_decoded(self):
+        # Subscriptions use the on_open protocol and messages arrive as dicts
+        server = StubStream(ticks)
+        url = await server.start()
+        messages = [m async for m in stream.subscribe(["eurusd:cur"], url=url)]
+        await server.stop()
+
+        self.assertEqual(messages, [{"s": "EURUSD:CUR", "price": p} for p in range(3)])
+        self.assertEqual(
+            server.received[0], (TEXT, b'{"topic": "subscribe", "to": "EURUSD:CUR"}')
+        )
+        self.assertEqual(server.paths, ["/?client=KEY"])
+
+    async def test_heartbeats_and_pings(self):
+        # Keepalive messages are skipped and pings answered with pongs
+        def script(event):
+            return [
+                (TEXT, b'{"topic": "keepalive"}', True),
+                (PING, b"hi", True),
+                (TEXT, b'{"s": "AAPL:US", "price": 1}', True),
+            ]
+
+        server = StubStream(script, close_after=False)
+        url = await server.start()
+        async with stream.subscribe("AAPL:US", url=url) as subscription:
+            message = await subscription.__anext__()
+            await asyncio.sleep(0.05)
+
+        self.assertEqual(message, {"s": "AAPL:US", "price": 1})
+        self.assertEqual(subscription.heartbeats, 1)
+        self.assertIn((PONG, b"hi"), server.received)
+        await server.stop()
+
+    async def test_fragmented_message(self):
+        # Continuation frames are joined before decoding
+        def script(event):
+            return [(TEXT, b'{"s": "AAPL:US", ', False), (0x0, b'"price": 2}', True)]
+
+        server = StubStream(script)
+        url = await server.start()
+        messages = [m async for m in stream.subscribe("AAPL:US", url=url)]
+        await server.stop()
+
+        self.assertEqual(messages, [{"s": "AAPL:US", "price": 2}])
+
+    async def test_batches(self):
+        # Buffered messages are handed out in lists of at most size
+        server = StubStream(lambda event: ticks(event, 10))
+        url = await server.start()
+        subscription = stream.subscribe(["AAPL:US"], url=url)
+        await subscription.connect()
+        await asyncio.sleep(0.05)
+        batches = [batch async for batch in subscription.batches(size=4)]
+        await server.stop()
+
+        self.assertEqual([len(batch) for batch in batches], [4, 4, 2])
+
+    async def test_batch_waits_for_more(self):
+        # A timeout lets a batch collect messages arriving shortly after the first
+        server = StubStream(lambda event: ticks(event, 5))
+        url = await server.start()
+        async with stream.subscribe(["AAPL:US"], url=url) as subscription:
+            batch = await subscription.batch(size=100, timeout=0.2)
+        await server.stop()
+
+        self.assertEqual(len(batch), 5)
+
+    async def test_fragments_around_a_ping_then_close(self):
+        # A ping between fragments does not break the message, and a server
+        # CLOSE ends the iteration after the buffered messages
+        def script(event):
+            return [
+                (TEXT, b'{"s": "AAPL:US", ', False),
+                (PING, b"mid", True),
+                (0x0, b'"price": ', False),
+                (0x0, b"3}", True),
+                (TEXT, b'{"s": "AAPL:US", "price": 4}', True),
+            ]
+
+        server = StubStream(script)
+        url = await server.start()
+        messages = [m async for m in stream.subscribe("AAPL:US", url=url)]
+        await server.stop()
+
+        self.assertEqual(messages, [{"s": "AAPL:US", "price": 3}, {"s": "AAPL:US", "price": 4}])
+
+    async def test_reader_error_ends_the_iterator(self):
+        # A failure in the reader task reaches a consumer behind a full queue
+        def script(event):
+            return [(TEXT, b"first", True), (TEXT, b"\xff\xfe", True)]
+
+        server = StubStream(script, close_after=False)
+        url = await server.start()
+        subscription = stream.subscribe("AAPL:US", url=url, decode=False, queue_size=1)
+        await subscription.connect()
+        await asyncio.sleep(0.05)
+        first = await asyncio.wait_for(subscription.__anext__(), 2)
+        with self.assertRaises(stream.StreamError) as caught:
+            await asyncio.wait_for(subscription.__anext__(), 2)
+        await server.stop()
+
+        self.assertEqual(first, "first")
+        self.assertIsInstance(caught.exception.__cause__, UnicodeDecodeError)
+
+    async def test_close_from_another_task(self):
+        # A consumer waiting for a message ends when another task closes
+        server = StubStream(lambda event: [], close_after=False)
+        url = await server.start()
+        subscription = await stream.subscribe("AAPL:US", url=url).connect()
+
+        async def consume():
+            return [m async for m in subscription]
+
+        consumer = asyncio.ensure_future(consume())
+        await asyncio.sleep(0.05)
+        await subscription.close()
+        self.assertEqual(await asyncio.wait_for(consumer, 2), [])
+        await server.stop()
+
+    async def test_status_line_without_reason(self):
+        # A bare status line is refused instead of failing to parse
+        async def handle(reader, writer):
+            await reader.readuntil(b"\r\n\r\n")
+            writer.write(b"HTTP/1.1\r\n\r\n")
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        url = "ws://127.0.0.1:%d/" % server.sockets[0].getsockname()[1]
+        with self.assertRaises(stream.StreamError):
+            await stream.subscribe(["AAPL:US"], url=url).connect()
+        server.close()
+        await server.wait_closed()
+
+    async def test_silent_connection_is_lost(self):
+        # Two heartbeats without data end the iterator with StreamError
+        server = StubStream(lambda event: [], close_after=False)
+        url = await server.start()
+        with self.assertRaises(stream.StreamError):
+            async for _ in stream.subscribe(["AAPL:US"], url=url, heartbeat=0.05):
+                pass
+        await server.stop()
+
+    async def test_refused_upgrade(self):
+        # A server that does not switch protocols raises StreamError
+        async def handle(reader, writer):
+            await reader.readuntil(b"\r\n\r\n")
+            writer.write(b"HTTP/1.1 403 Forbidden\r\nContent-Length: 0\r\n\r\n")
+            await writer.drain()
+            writer.close()
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        url = "ws://127.0.0.1:%d/" % server.sockets[0].getsockname()[1]
+        with self.assertRaises(stream.StreamError):
+            await stream.subscribe(["AAPL:US"], url=url).connect()
+        server.close()
+        await server.wait_closed()
+
+    def test_events_are_normalized(self):
+        # Symbols are upper case and other topics lower case
+        self.assertEqual(
+            aiostream.normalizeEvents("aapl:us,Calendar"), ["AAPL:US", "calendar"]
+        )
+
+    def test_frames_round_trip(self):
+        # Masked frames of every length class decode to their payload
+        async def roundTrip(payload):
+            reader = asyncio.StreamReader()
+            reader.feed_data(encodeFrame(TEXT, payload))
+            reader.feed_eof()
+            return await readFrame(reader)
+
+        for size in (0, 125, 126, 70000):
+            payload = bytes(range(256)) * (size // 256) + bytes(size % 256)
+            self.assertEqual(asyncio.run(roundTrip(payload)), (True, TEXT, payload))
+
+
+if __name__ == "__main__":
+    unittest.main()
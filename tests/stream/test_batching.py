@@ -0,0 +1,179 @@
+import json
+import threading
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+
+from tradingeconomics import glob
+from tradingeconomics import stream
+from tradingeconomics.batching import Columns, TickBatcher, columnarBatch
+
+
+def tick(symbol, price, dt=1700000000000):
+    return json.dumps({"s": symbol, "price": price, "dt": dt})
+
+
+class TestColumns(unittest.TestCase):
+
+    def test_typed_columns(self):
+        # Ints, floats and strings get int64, float64 and object arrays
+        batch = columnarBatch(
+            [{"s": "A", "price": 1.5, "dt": 1}, {"s": "B", "price": 2.0, "dt": 2}]
+        )
+
+        self.assertEqual(list(batch), ["s", "price", "dt"])
+        self.assertEqual(batch["s"].dtype, object)
+        self.assertEqual(batch["price"].dtype, np.float64)
+        self.assertEqual(batch["dt"].dtype, np.int64)
+        np.testing.assert_array_equal(batch["price"], [1.5, 2.0])
+
+    def test_columns_are_widened(self):
+        # A float or a missing value turns an int column into floats
+        batch = columnarBatch([{"p": 1}, {"p": 2.5}, {}, {"p": None}, {"p": 4}])
+
+        np.testing.assert_array_equal(batch["p"], [1.0, 2.5, np.nan, np.nan, 4.0])
+
+    def test_string_in_numeric_column(self):
+        # The column becomes objects and its missing values None
+        batch = columnarBatch([{"p": 1.5}, {"q": 1}, {"p": "n/a"}])
+
+        self.assertEqual(list(batch["p"]), [1.5, None, "n/a"])
+        np.testing.assert_array_equal(batch["q"], [np.nan, 1.0, np.nan])
+
+    def test_fields(self):
+        # Only the fields asked for are kept, in their order
+        batch = columnarBatch([{"s": "A", "price": 1, "dt": 3}], fields=["price", "s"])
+
+        self.assertEqual(list(batch), ["price", "s"])
+
+    def test_buffers_grow_and_restart(self):
+        # Appending past size grows the arrays, take() starts with fresh ones
+        columns = Columns(2)
+        for price in range(5):
+            columns.append({"price": price})
+        first = columns.take()
+        columns.append({"price": 9})
+        second = columns.take()
+
+        np.testing.assert_array_equal(first["price"], [0, 1, 2, 3, 4])
+        np.testing.assert_array_equal(second["price"], [9])
+
+    def test_output_types(self):
+        # Batches can be DataFrames or Arrow record batches
+        messages = [{"s": "A", "price": 1.5}, {"s": "B", "price": None}]
+        df = columnarBatch(messages, "df")
+
+        self.assertIsInstance(df, pd.DataFrame)
+        self.assertEqual(df.shape, (2, 2))
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            return
+        batch = columnarBatch(messages, "arrow")
+        self.assertEqual(batch.num_rows, 2)
+        self.assertEqual(batch.column("s").to_pylist(), ["A", "B"])
+
+        # A field holding numbers and strings becomes text
+        batch = columnarBatch([{"s": "A", "state": 1}, {"s": "B", "state": "closed"}], "arrow")
+        self.assertEqual(batch.column("state").to_pylist(), ["1", "closed"])
+
+
+class TestTickBatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.batches = []
+
+    def test_full_batches(self):
+        # Every size messages make a batch; close() hands over the rest
+        batcher = TickBatcher(self.batches.append, size=3, interval=0)
+        for i in range(7):
+            batcher.onMessage(None, tick("A", i))
+        self.assertEqual([len(b["price"]) for b in self.batches], [3, 3])
+        batcher.close()
+
+        self.assertEqual([len(b["price"]) for b in self.batches], [3, 3, 1])
+        self.assertEqual(batcher.messages, 7)
+
+    @patch("tradingeconomics.batching.time")
+    def test_interval(self, mock_time):
+        # An incomplete batch is handed over once its first message is interval old
+        delivered = threading.Event()
+
+        def on_batch(batch):
+            self.batches.append(batch)
+            delivered.set()
+
+        mock_time.monotonic.return_value = 100.0
+        batcher = TickBatcher(on_batch, size=100, interval=0.05)
+        batcher.onMessage(None, tick("A", 1))
+        batcher.onMessage(None, tick("B", 2))
+        self.assertFalse(delivered.wait(0.2))
+
+        mock_time.monotonic.return_value = 100.1
+        self.assertTrue(delivered.wait(5))
+        batcher.close()
+
+        self.assertEqual(list(self.batches[0]["s"]), ["A", "B"])
+
+    def test_unknown_output_type(self):
+        # Only dict, df and arrow batches exist
+        with self.assertRaises(ValueError):
+            TickBatcher(self.batches.append, output_type="json")
+
+
+@patch("builtins.print")
+@patch.object(glob, "apikey", "TESTKEY:SECRET")
+@patch("tradingeconomics.stream.websocket.WebSocketApp")
+class TestRunBatches(unittest.TestCase):
+
+    def tearDown(self):
+        stream.configureDispatch()
+
+    def test_stream_ticks_reach_on_batch(self, mock_app, *mocks):
+        # Messages of the socket arrive in batches, the last one when the stream stops
+        def run_forever(**kwargs):
+            on_message = mock_app.call_args.kwargs["on_message"]
+            for i in range(10):
+                on_message(None, tick("AAPL:US", float(i), i))
+            stream.stop()
+
+        mock_app.return_value.run_forever.side_effect = run_forever
+        batches = []
+        stream.runBatches(batches.append, size=4, interval=0, output_type="df")
+
+        prices = pd.concat(batches, ignore_index=True)["price"].tolist()
+        self.assertEqual(prices, [float(i) for i in range(10)])
+        self.assertEqual([len(b) for b in batches], [4, 4, 2])
+
+    def test_rows_keep_arrival_order_and_decode_once(self, mock_app, *mocks):
+        # Ticks of many symbols stay in order, keepalives are skipped and each
+        # message is decoded once even with the live cache on
+        from tradingeconomics import decoder, livecache
+
+        messages = [tick("SYM%d" % (i % 7), float(i), i) for i in range(50)]
+
+        def run_forever(**kwargs):
+            on_message = mock_app.call_args.kwargs["on_message"]
+            for message in messages[:25] + ['{"topic": "keepalive"}'] + messages[25:]:
+                on_message(None, message)
+            stream.stop()
+
+        mock_app.return_value.run_forever.side_effect = run_forever
+        batches = []
+        livecache.enableLiveCache()
+        try:
+            with patch.object(decoder, "loads", wraps=decoder.loads) as loads:
+                stream.runBatches(batches.append, size=8, interval=0)
+        finally:
+            livecache.disableLiveCache()
+
+        self.assertEqual(
+            [p for b in batches for p in b["price"]], [float(i) for i in range(50)]
+        )
+        self.assertEqual(loads.call_count, 51)
+
+
+if __name__ == "__main__":
+    unittest.main()
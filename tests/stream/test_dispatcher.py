@@ -0,0 +1,230 @@
+import json
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from tradingeconomics import stream
+from tradingeconomics.dispatch import Dispatcher, messageSymbol
+
+
+def tick(symbol, price):
+    return json.dumps({"s": symbol, "price": price})
+
+
+class Recorder(object):
+    # Collects (symbol, price) per call; gate holds every call until set
+
+    def __init__(self, gate=None):
+        self.calls = []
+        self.lock = threading.Lock()
+        self.gate = gate
+        self.started = threading.Event()
+
+    def __call__(self, ws, message):
+        self.started.set()
+        if self.gate is not None:
+            self.gate.wait()
+        decoded = json.loads(message)
+        with self.lock:
+            self.calls.append((decoded["s"], decoded["price"]))
+
+
+class TestDispatcher(unittest.TestCase):
+
+    def test_symbol_order_is_kept(self):
+        # Messages of a symbol reach the callback in order across workers
+        recorder = Recorder()
+        dispatcher = Dispatcher(recorder, workers=4, queue_size=100)
+        for price in range(200):
+            for symbol in ("AAPL:US", "EURUSD:CUR", "CL1:COM"):
+                dispatcher.submit(None, tick(symbol, price))
+        dispatcher.close()
+
+        for symbol in ("AAPL:US", "EURUSD:CUR", "CL1:COM"):
+            prices = [p for s, p in recorder.calls if s == symbol]
+            self.assertEqual(prices, list(range(200)))
+        self.assertEqual(dispatcher.stats()["delivered"], 600)
+
+    def test_block_waits_for_room(self):
+        # A full queue holds the submitting thread back without losing messages
+        gate = threading.Event()
+        recorder = Recorder(gate)
+        dispatcher = Dispatcher(recorder, workers=1, queue_size=2, policy="block")
+        dispatcher.submit(None, tick("AAPL:US", 0))
+        recorder.started.wait(1)
+        dispatcher.submit(None, tick("AAPL:US", 1))
+        dispatcher.submit(None, tick("AAPL:US", 2))
+        producer = threading.Thread(target=dispatcher.submit, args=(None, tick("AAPL:US", 3)))
+        producer.start()
+        time.sleep(0.05)
+
+        self.assertTrue(producer.is_alive())
+        self.assertEqual(dispatcher.depth(), 2)
+        gate.set()
+        producer.join(1)
+        dispatcher.close()
+        self.assertEqual([p for _, p in recorder.calls], [0, 1, 2, 3])
+
+    def test_drop_oldest(self):
+        # The oldest waiting message makes room for a new one
+        gate = threading.Event()
+        recorder = Recorder(gate)
+        dispatcher = Dispatcher(recorder, workers=1, queue_size=2, policy="drop_oldest")
+        dispatcher.submit(None, tick("AAPL:US", 0))
+        recorder.started.wait(1)
+        for price in range(1, 5):
+            dispatcher.submit(None, tick("AAPL:US", price))
+        gate.set()
+        dispatcher.close()
+
+        self.assertEqual([p for _, p in recorder.calls], [0, 3, 4])
+        self.assertEqual(dispatcher.stats()["dropped"], 2)
+
+    def test_coalesce_keeps_latest_per_symbol(self):
+        # In a full queue waiting ticks of a symbol are replaced by the newest one in place
+        gate = threading.Event()
+        recorder = Recorder(gate)
+        dispatcher = Dispatcher(recorder, workers=1, queue_size=2, policy="coalesce")
+        dispatcher.submit(None, tick("AAPL:US", 0))
+        recorder.started.wait(1)
+        for price in range(1, 4):
+            dispatcher.submit(None, tick("AAPL:US", price))
+            dispatcher.submit(None, tick("MSFT:US", price))
+        gate.set()
+        dispatcher.close()
+
+        self.assertEqual(recorder.calls, [("AAPL:US", 0), ("AAPL:US", 3), ("MSFT:US", 3)])
+        stats = dispatcher.stats()
+        self.assertEqual(stats["coalesced"], 4)
+        self.assertEqual(stats["max_depth"], 2)
+
+    def test_coalesce_only_under_pressure(self):
+        # Below capacity every tick is queued and delivered
+        gate = threading.Event()
+        recorder = Recorder(gate)
+        dispatcher = Dispatcher(recorder, workers=1, queue_size=10, policy="coalesce")
+        dispatcher.submit(None, tick("AAPL:US", 0))
+        recorder.started.wait(1)
+        for price in range(1, 4):
+            dispatcher.submit(None, tick("AAPL:US", price))
+            dispatcher.submit(None, tick("MSFT:US", price))
+        gate.set()
+        dispatcher.close()
+
+        self.assertEqual([p for s, p in recorder.calls if s == "AAPL:US"], [0, 1, 2, 3])
+        self.assertEqual([p for s, p in recorder.calls if s == "MSFT:US"], [1, 2, 3])
+        stats = dispatcher.stats()
+        self.assertEqual(stats["coalesced"], 0)
+        self.assertEqual(stats["max_depth"], 6)
+
+    @patch("builtins.print")
+    def test_callback_errors_are_counted(self, mock_print):
+        # An exception in the callback does not stop the worker
+        callback = MagicMock(side_effect=[ValueError("bad tick"), None])
+        dispatcher = Dispatcher(callback, workers=1)
+        dispatcher.submit(None, tick("AAPL:US", 0))
+        dispatcher.submit(None, tick("AAPL:US", 1))
+        dispatcher.close()
+
+        self.assertEqual(callback.call_count, 2)
+        self.assertEqual(dispatcher.stats()["errors"], 1)
+
+    def test_unknown_policy(self):
+        # Policies are checked when the dispatcher is built
+        with self.assertRaises(ValueError):
+            Dispatcher(print, policy="latest")
+
+    def test_message_symbol(self):
+        # Messages that are not JSON objects have no symbol
+        self.assertEqual(messageSymbol(tick("AAPL:US", 1)), "AAPL:US")
+        self.assertIsNone(messageSymbol("not json"))
+        self.assertIsNone(messageSymbol('{"topic": "keepalive"}'))
+
+
+class TestStreamDispatch(unittest.TestCase):
+
+    def tearDown(self):
+        stream.configureDispatch()
+
+    @patch("tradingeconomics.glob.apikey", "TESTKEY:SECRET")
+    @patch("tradingeconomics.stream.websocket.WebSocketApp")
+    def test_socket_messages_go_through_the_dispatcher(self, mock_app):
+        # start_socket hands messages to worker threads instead of new threads
+        recorder = Recorder()
+
+        def run_forever(**kwargs):
+            mock_app.call_args.kwargs["on_message"](None, tick("AAPL:US", 1))
+            stream.stop()
+
+        mock_app.return_value.run_forever.side_effect = run_forever
+        stream.configureDispatch(workers=2, policy="drop_oldest")
+        stream.start_socket(recorder)
+        dispatcher = stream.getDispatcher()
+
+        self.assertEqual(recorder.calls, [("AAPL:US", 1)])
+        self.assertEqual(dispatcher.policy, "drop_oldest")
+        self.assertEqual(dispatcher.stats()["workers"], 2)
+
+    @patch("tradingeconomics.glob.apikey", "TESTKEY:SECRET")
+    @patch("tradingeconomics.stream.websocket.WebSocketApp")
+    def test_configure_while_running(self, mock_app):
+        # Messages after configureDispatch() go to the new dispatcher, none are lost
+        recorder = Recorder()
+        used = []
+
+        def run_forever(**kwargs):
+            on_message = mock_app.call_args.kwargs["on_message"]
+            on_message(None, tick("AAPL:US", 1))
+            used.append(stream.getDispatcher())
+            stream.configureDispatch(workers=2)
+            on_message(None, tick("AAPL:US", 2))
+            used.append(stream.getDispatcher())
+            stream.stop()
+
+        mock_app.return_value.run_forever.side_effect = run_forever
+        stream.start_socket(recorder)
+
+        self.assertEqual(sorted(recorder.calls), [("AAPL:US", 1), ("AAPL:US", 2)])
+        self.assertIsNot(used[0], used[1])
+        self.assertEqual(used[1].stats()["workers"], 2)
+        self.assertEqual(used[0].stats()["dropped"] + used[1].stats()["dropped"], 0)
+
+    @patch("tradingeconomics.glob.apikey", "TESTKEY:SECRET")
+    @patch("tradingeconomics.stream.websocket.WebSocketApp")
+    def test_messages_are_decoded_once(self, mock_app):
+        # The dispatcher key and the live cache share one decode per message
+        from tradingeconomics import decoder, livecache
+
+        def run_forever(**kwargs):
+            mock_app.call_args.kwargs["on_message"](None, tick("AAPL:US", 1))
+            stream.stop()
+
+        mock_app.return_value.run_forever.side_effect = run_forever
+        recorder = Recorder()
+        cache = livecache.enableLiveCache()
+        try:
+            with patch.object(decoder, "loads", wraps=decoder.loads) as loads:
+                stream.start_socket(recorder)
+        finally:
+            livecache.disableLiveCache()
+
+        self.assertEqual(loads.call_count, 1)
+        self.assertEqual(recorder.calls, [("AAPL:US", 1)])
+        self.assertEqual(cache.get("AAPL:US")["Last"], 1)
+
+    @patch("tradingeconomics.glob.apikey", "TESTKEY:SECRET")
+    @patch("tradingeconomics.stream.websocket.WebSocketApp")
+    def test_workers_stop_with_the_stream(self, mock_app):
+        # Returning from start_socket closes the dispatcher and its threads
+        mock_app.return_value.run_forever.side_effect = lambda **kwargs: stream.stop()
+        stream.start_socket(Recorder())
+        dispatcher = stream.getDispatcher()
+
+        self.assertTrue(dispatcher.closed)
+        self.assertFalse(
+            any(worker.thread.is_alive() for worker in dispatcher._workers)
+        )
+
+if __name__ == "__main__":
+    unittest.main()
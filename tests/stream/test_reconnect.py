@@ -0,0 +1,139 @@
+import datetime as dt
+import inspect
+import json
+import threading
+import unittest
+from unittest.mock import patch
+
+from tradingeconomics import glob
+from tradingeconomics import stream
+
+
+class FakeApp(object):
+    # Stands in for websocket.WebSocketApp; each run_forever plays the next
+    # plan: None fails to connect, a list of messages is delivered before
+    # the connection drops, and running out of plans stops the stream
+
+    plans = []
+    apps = []
+
+    def __init__(self, url, on_message=None, on_error=None, on_close=None):
+        self.on_message = on_message
+        self.on_close = on_close
+        self.on_open = None
+        self.sent = []
+        FakeApp.apps.append(self)
+
+    def send(self, data):
+        self.sent.append(json.loads(data))
+
+    def run_forever(self, **kwargs):
+        if not FakeApp.plans:
+            stream.stop()
+            return
+        plan = FakeApp.plans.pop(0)
+        if plan is None:
+            return
+        self.on_open(self)
+        for message in plan:
+            self.on_message(self, message)
+        self.on_close(self, 1006, "")
+
+    def close(self):
+        pass
+
+
+@patch("builtins.print")
+@patch.object(glob, "apikey", "TESTKEY:SECRET")
+@patch.object(glob, "_event", ["EURUSD:CUR", "calendar"])
+@patch("tradingeconomics.stream.reconnectDelay", return_value=0)
+@patch("tradingeconomics.stream.websocket.WebSocketApp", FakeApp)
+class TestReconnect(unittest.TestCase):
+
+    def setUp(self):
+        FakeApp.apps = []
+        stream.gaps.clear()
+        self.messages = []
+        self.lock = threading.Lock()
+
+    def tearDown(self):
+        dispatcher = stream.getDispatcher()
+        if dispatcher is not None:
+            dispatcher.close()
+        stream.configureDispatch()
+
+    def on_message(self, ws, message):
+        with self.lock:
+            self.messages.append(message)
+
+    def test_reconnects_in_a_loop(self, mock_delay, *mocks):
+        # Drops and failed attempts do not grow the stack
+        FakeApp.plans = [['{"s": "A"}']] + [None] * 50 + [['{"s": "B"}']]
+        depth = []
+
+        def on_open(ws):
+            depth.append(len(inspect.stack()))
+
+        with patch("tradingeconomics.stream.on_open", on_open):
+            stream.start_socket(self.on_message)
+
+        self.assertEqual(len(depth), 2)
+        self.assertEqual(depth[0], depth[1])
+        self.assertEqual(len(FakeApp.apps), 53)
+
+    def test_subscriptions_are_sent_again(self, mock_delay, *mocks):
+        # Every connection subscribes to all of glob._event
+        FakeApp.plans = [[], None, []]
+        stream.start_socket(self.on_message)
+
+        opened = [app.sent for app in FakeApp.apps if app.sent]
+        expected = [
+            {"topic": "subscribe", "to": "EURUSD:CUR"},
+            {"topic": "subscribe", "to": "calendar"},
+        ]
+        self.assertEqual(opened, [expected, expected])
+
+    def test_gap_is_reported(self, mock_delay, *mocks):
+        # The outage since the last message and its attempts reach on_gap
+        FakeApp.plans = [['{"s": "A", "n": 1}'], None, None, ['{"s": "A", "n": 2}']]
+        reported = []
+        stream.run(self.on_message, on_gap=reported.append)
+
+        self.assertEqual(len(reported), 1)
+        gap = reported[0]
+        self.assertEqual(gap.attempts, 3)
+        self.assertGreaterEqual(gap.duration, 0)
+        self.assertEqual(list(stream.gaps), reported)
+        stream.getDispatcher().close()
+        self.assertEqual(self.messages, ['{"s": "A", "n": 1}', '{"s": "A", "n": 2}'])
+
+    def test_backoff_restarts_after_data(self, mock_delay, *mocks):
+        # Failed attempts grow the backoff, a connection with data resets it
+        FakeApp.plans = [None, None, ['{"s": "A"}'], None]
+        stream.start_socket(self.on_message)
+
+        self.assertEqual([c.args[0] for c in mock_delay.call_args_list], [1, 2, 1, 2])
+
+
+class TestBackoff(unittest.TestCase):
+
+    @patch("tradingeconomics.stream.random.uniform", side_effect=lambda low, high: high)
+    def test_delay_doubles_up_to_the_cap(self, mock_uniform):
+        # Bounds start at reconnect_base and stop at reconnect_timeout
+        with patch.object(stream, "reconnect_base", 0.5), patch.object(stream, "reconnect_timeout", 3):
+            bounds = [stream.reconnectDelay(attempt) for attempt in range(1, 6)]
+
+        self.assertEqual(bounds, [0.5, 1, 2, 3, 3])
+
+    def test_gap_windows(self):
+        # An outage from 10:00:30 to 10:03:10 misses four one-minute bars
+        start = dt.datetime(2024, 1, 2, 10, 0, 30, tzinfo=dt.timezone.utc)
+        gap = stream.Gap(start, start + dt.timedelta(seconds=160), 2)
+
+        self.assertEqual(gap.duration, 160)
+        self.assertEqual(gap.windows(60), 4)
+        self.assertEqual(gap.windows(3600), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Local HTTP/1.1 keep-alive server used by the tests and the benchmarks.
+
+    class Handler(StubHandler):
+        def do_GET(self):
+            self.reply(200, [{"path": self.path}])
+
+    server = StubServer(Handler).start()
+    ...
+    server.stop()
+
+StubServer also takes a function of the request path returning the JSON
+body, and serves a fixed payload for every GET when given neither.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def reply(self, status, payload, headers=None):
+        """Send payload, JSON encoded unless bytes, with a Content-Length."""
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def pathHandler(handler):
+    """Return a StubHandler class answering 200 with handler(path)."""
+
+    class Handler(StubHandler):
+        def do_GET(self):
+            self.reply(200, handler(self.path))
+
+    return Handler
+
+
+class StubServer(object):
+    """
+    Threaded stub API on 127.0.0.1 on a random free port.
+
+    handler: StubHandler subclass, or callable(path) -> JSON body.
+    payload: body of every GET when handler is None.
+    ssl_context: server SSLContext to serve https.
+    """
+
+    def __init__(self, handler=None, payload=None, ssl_context=None):
+        if handler is None:
+            body = json.dumps(payload or [{"Symbol": "INDU:IND", "Last": 1.0}]).encode()
+            handler = lambda path: body
+        if not isinstance(handler, type):
+            handler = pathHandler(handler)
+        self.handler = handler
+        self.ssl_context = ssl_context
+
+    def start(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self.handler)
+        self.server.daemon_threads = True
+        if self.ssl_context is not None:
+            self.server.socket = self.ssl_context.wrap_socket(
+                self.server.socket, server_side=True
+            )
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.port = self.server.server_address[1]
+        scheme = "http" if self.ssl_context is None else "https"
+        self.url = "%s://127.0.0.1:%d" % (scheme, self.port)
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
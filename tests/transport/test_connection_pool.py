@@ -0,0 +1,130 @@
+import gzip
+import json
+import multiprocessing
+import socket
+import threading
+import unittest
+
+from tests.stubserver import StubHandler, StubServer
+from tradingeconomics.transport import ConnectionPool
+
+
+class PoolHandler(StubHandler):
+
+    def do_GET(self):
+        if self.path.startswith("/redirect"):
+            self.reply(302, b"", {"Location": "/markets/index"})
+            return
+        payload = {"path": self.path, "client_port": self.client_address[1]}
+        if self.path.startswith("/gzip"):
+            body = gzip.compress(json.dumps(payload).encode("utf-8"))
+            self.reply(200, body, {"Content-Encoding": "gzip"})
+        else:
+            self.reply(200, payload)
+
+
+def idle_connections(pool, queue):
+    queue.put(sum(len(connections) for connections in pool._idle.values()))
+
+
+class TestConnectionPool(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubServer(PoolHandler).start()
+        self.base_url = self.server.url
+
+    def tearDown(self):
+        self.server.stop()
+
+    def test_connection_is_reused(self):
+        # Consecutive requests to the same host use one keep-alive connection
+        pool = ConnectionPool(maxsize=2)
+        first = json.loads(pool.request(self.base_url + "/markets/index").body)
+        second = json.loads(pool.request(self.base_url + "/markets/bond").body)
+
+        self.assertEqual(first["client_port"], second["client_port"])
+        self.assertEqual(second["path"], "/markets/bond")
+        self.assertEqual(pool.created, 1)
+        self.assertEqual(pool.reused, 1)
+        pool.clear()
+
+    @unittest.skipUnless(
+        "fork" in multiprocessing.get_all_start_methods(), "requires fork"
+    )
+    def test_forked_child_drops_idle_connections(self):
+        # Client pools do not hand the parent's sockets to a child process
+        pool = ConnectionPool(maxsize=2)
+        pool.request(self.base_url + "/markets/index")
+        context = multiprocessing.get_context("fork")
+        queue = context.Queue()
+        child = context.Process(target=idle_connections, args=(pool, queue))
+        child.start()
+        child.join()
+
+        self.assertEqual(queue.get(timeout=5), 0)
+        self.assertEqual(len(pool._idle[("http", "127.0.0.1", self.server.port)]), 1)
+        pool.clear()
+
+    def test_concurrent_requests_are_bounded_by_maxsize(self):
+        # Extra connections opened under load are closed when the pool is full
+        pool = ConnectionPool(maxsize=2)
+        results = []
+        lock = threading.Lock()
+
+        def worker():
+            for _ in range(5):
+                response = pool.request(self.base_url + "/markets/index")
+                with lock:
+                    results.append(response.status)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(results, [200] * 40)
+        self.assertLessEqual(len(pool._idle[("http", "127.0.0.1", self.server.port)]), 2)
+        self.assertEqual(pool.created + pool.reused, 40)
+        pool.clear()
+
+    def test_gzip_body_is_decompressed(self):
+        # Gzip encoded responses are returned decoded
+        pool = ConnectionPool()
+        response = pool.request(self.base_url + "/gzip")
+
+        self.assertEqual(json.loads(response.body)["path"], "/gzip")
+        pool.clear()
+
+    def test_redirect_is_followed(self):
+        # Redirects are followed like urlopen does
+        pool = ConnectionPool()
+        response = pool.request(self.base_url + "/redirect")
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(json.loads(response.body)["path"], "/markets/index")
+        pool.clear()
+
+    def test_stale_connection_is_replaced(self):
+        # A pooled connection closed by the server is transparently reopened
+        pool = ConnectionPool()
+        pool.request(self.base_url + "/markets/index")
+        for connections in pool._idle.values():
+            for conn in connections:
+                conn.sock.shutdown(socket.SHUT_RDWR)
+
+        response = pool.request(self.base_url + "/markets/index")
+
+        self.assertEqual(response.status, 200)
+        self.assertEqual(pool.created, 2)
+        pool.clear()
+
+    def test_unsupported_scheme(self):
+        # Only http and https URLs are accepted
+        pool = ConnectionPool()
+        with self.assertRaises(ValueError):
+            pool.request("ftp://127.0.0.1/markets")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+from unittest.mock import patch
+
+from tests.stubserver import StubHandler, StubServer
+from tradingeconomics import functions as fn
+from tradingeconomics import glob
+from tradingeconomics import transport
+
+
+class RoutesHandler(StubHandler):
+
+    routes = {
+        "/markets/index": (200, [{"Symbol": "INDU:IND", "Last": 1.0}]),
+        "/empty": (200, []),
+        "/unauthorized": (401, {"message": "bad key"}),
+        "/missing": (404, {"message": "no route"}),
+        "/broken": (500, {"message": "boom"}),
+    }
+
+    def do_GET(self):
+        if self.path == "/echo":
+            self.reply(200, [{"Authorization": self.headers.get("Authorization")}])
+        elif self.path == "/invalid":
+            self.reply(200, b"not json")
+        elif self.path == "/badgzip":
+            self.reply(200, b"\x1f\x8b\x08\x00" + b"\x00" * 10, {"Content-Encoding": "gzip"})
+        else:
+            self.reply(*self.routes[self.path])
+
+
+class TestDataRequest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubServer(RoutesHandler).start()
+        self.patches = [
+            patch.object(glob, "API_BASE_URL", self.server.url),
+            patch.object(glob, "apikey", "TESTKEY:SECRET"),
+        ]
+        for p in self.patches:
+            p.start()
+        transport.configurePool()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        transport.getPool().clear()
+        self.server.stop()
+
+    def test_returns_parsed_json(self):
+        # Successful responses are parsed and returned as a list of dicts
+        result = fn.dataRequest("/markets/index", None)
+
+        self.assertEqual(result, [{"Symbol": "INDU:IND", "Last": 1.0}])
+
+    def test_returns_dataframe(self):
+        # output_type='df' builds a DataFrame
+        result = fn.dataRequest("/markets/index", "df")
+
+        self.assertEqual(list(result.columns), ["Symbol", "Last"])
+
+    def test_sends_authorization_header(self):
+        # The api key is sent in the Authorization header
+        result = fn.dataRequest("echo", "raw")
+
+        self.assertEqual(result, [{"Authorization": "TESTKEY:SECRET"}])
+
+    def test_reuses_pooled_connection(self):
+        # Consecutive calls reuse the keep-alive connection
+        fn.dataRequest("/markets/index", None)
+        fn.dataRequest("/markets/index", None)
+
+        self.assertEqual(transport.getPool().created, 1)
+        self.assertEqual(transport.getPool().reused, 1)
+
+    def test_http_errors_are_mapped(self):
+        # HTTP status codes map to the SDK exceptions
+        with self.assertRaises(fn.AuthenticationError):
+            fn.dataRequest("/unauthorized", None)
+        with self.assertRaises(fn.ParametersError) as ctx:
+            fn.dataRequest("/missing", None)
+        self.assertIn("no route", str(ctx.exception))
+        with self.assertRaises(fn.WebRequestError):
+            fn.dataRequest("/broken", None)
+
+    def test_empty_and_invalid_payloads(self):
+        # Empty results and invalid JSON raise errors
+        with self.assertRaises(fn.ParametersError):
+            fn.dataRequest("/empty", None)
+        with self.assertRaises(fn.WebRequestError):
+            fn.dataRequest("/invalid", None)
+
+    def test_network_error(self):
+        # Connection failures raise WebRequestError
+        port = self.server.port
+        self.server.stop()
+        transport.getPool().clear()
+
+        with self.assertRaises(fn.WebRequestError) as ctx:
+            fn.dataRequest("http://127.0.0.1:%d/markets/index" % port, None)
+        self.assertIn("Network error", str(ctx.exception))
+
+    def test_corrupt_gzip_body(self):
+        # A body that fails to decompress is a WebRequestError
+        with self.assertRaises(fn.WebRequestError):
+            fn.dataRequest("/badgzip", None)
+
+    def test_programming_errors_are_not_wrapped(self):
+        # Errors other than network and decoding ones propagate unchanged
+        with patch.object(fn, "send", side_effect=KeyError("bug")):
+            with self.assertRaises(KeyError):
+                fn.dataRequest("/markets/index", None)
+
+
+if __name__ == "__main__":
+    unittest.main()
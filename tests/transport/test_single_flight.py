@@ -0,0 +1,170 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from tests.stubserver import StubHandler, StubServer
+from tradingeconomics import functions as fn
+from tradingeconomics import glob
+from tradingeconomics import transport
+
+
+class SlowHandler(StubHandler):
+
+    hits = []
+
+    def do_GET(self):
+        SlowHandler.hits.append(self.path)
+        time.sleep(0.2)
+        status = 500 if self.path == "/broken" else 200
+        self.reply(status, [{"Path": self.path}])
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_concurrent_calls_share_one_execution(self):
+        # Callers arriving while a key is in flight wait for the leader's result
+        flight = transport.SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+        runs = []
+
+        def work():
+            runs.append(1)
+            started.set()
+            release.wait()
+            return "value"
+
+        results = []
+        leader = threading.Thread(target=lambda: results.append(flight.do("k", work)))
+        leader.start()
+        started.wait()
+        followers = [
+            threading.Thread(target=lambda: results.append(flight.do("k", work)))
+            for _ in range(4)
+        ]
+        for t in followers:
+            t.start()
+        while flight.stats()["coalesced"] < 4:
+            time.sleep(0.001)
+        release.set()
+        for t in [leader] + followers:
+            t.join()
+
+        self.assertEqual(len(runs), 1)
+        self.assertEqual(sorted(results), [("value", False)] + [("value", True)] * 4)
+        self.assertEqual(flight.stats(), {"calls": 1, "coalesced": 4, "in_flight": 0})
+
+    def test_errors_reach_every_caller(self):
+        # An exception raised by the leader is raised in the waiting callers too
+        flight = transport.SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def work():
+            started.set()
+            release.wait()
+            raise ValueError("boom")
+
+        errors = []
+
+        def caller():
+            try:
+                flight.do("k", work)
+            except ValueError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=caller)]
+        threads[0].start()
+        started.wait()
+        threads.append(threading.Thread(target=caller))
+        threads[1].start()
+        while flight.stats()["coalesced"] < 1:
+            time.sleep(0.001)
+        release.set()
+        for t in threads:
+            t.join()
+
+        self.assertEqual(len(errors), 2)
+        self.assertIs(errors[0], errors[1])
+
+    def test_sequential_calls_are_not_coalesced(self):
+        # Completed calls are forgotten, the next caller runs the function again
+        flight = transport.SingleFlight()
+
+        self.assertEqual(flight.do("k", lambda: 1), (1, False))
+        self.assertEqual(flight.do("k", lambda: 2), (2, False))
+        self.assertEqual(flight.stats()["coalesced"], 0)
+
+
+class TestDataRequestCoalescing(unittest.TestCase):
+
+    def setUp(self):
+        SlowHandler.hits = []
+        self.server = StubServer(SlowHandler).start()
+        self.patches = [
+            patch.object(glob, "API_BASE_URL", self.server.url),
+            patch.object(glob, "apikey", "TESTKEY:SECRET"),
+            patch.object(transport, "inflight", transport.SingleFlight()),
+        ]
+        for p in self.patches:
+            p.start()
+        transport.configurePool()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        transport.getPool().clear()
+        self.server.stop()
+
+    def fanOut(self, paths):
+        results = [None] * len(paths)
+
+        def worker(i, path):
+            try:
+                results[i] = fn.dataRequest(path, None)
+            except Exception as e:
+                results[i] = e
+
+        threads = [threading.Thread(target=worker, args=item) for item in enumerate(paths)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return results
+
+    def test_identical_requests_hit_the_server_once(self):
+        # Concurrent calls for the same URL share one download
+        results = self.fanOut(["/markets/index"] * 8)
+
+        self.assertEqual(SlowHandler.hits, ["/markets/index"])
+        self.assertEqual(transport.inflight.stats()["coalesced"], 7)
+        for result in results:
+            self.assertEqual(result, [{"Path": "/markets/index"}])
+
+    def test_callers_get_independent_copies(self):
+        # Each caller decodes its own copy of the shared body
+        results = self.fanOut(["/markets/index"] * 3)
+
+        results[0][0]["Path"] = "changed"
+        self.assertEqual(results[1], [{"Path": "/markets/index"}])
+        self.assertIsNot(results[1], results[2])
+
+    def test_different_urls_are_not_coalesced(self):
+        # Only identical URLs share a download
+        self.fanOut(["/markets/index", "/markets/bond"])
+
+        self.assertEqual(sorted(SlowHandler.hits), ["/markets/bond", "/markets/index"])
+        self.assertEqual(transport.inflight.stats()["coalesced"], 0)
+
+    def test_errors_are_shared(self):
+        # A failed download raises the SDK exception in every waiting caller
+        results = self.fanOut(["/broken"] * 4)
+
+        self.assertEqual(SlowHandler.hits, ["/broken"])
+        for result in results:
+            self.assertIsInstance(result, fn.WebRequestError)
+
+
+if __name__ == "__main__":
+    unittest.main()
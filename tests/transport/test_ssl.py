@@ -0,0 +1,91 @@
+import os
+import shutil
+import ssl
+import subprocess
+import tempfile
+import unittest
+
+from tests.stubserver import StubServer
+from tradingeconomics import functions as fn
+from tradingeconomics import transport
+
+
+class TestSslContext(unittest.TestCase):
+
+    def test_contexts_are_cached_per_setting(self):
+        # One SSLContext is built per verify setting and then reused
+        self.assertIs(transport.sslContext(True), transport.sslContext(True))
+        self.assertIsNot(transport.sslContext(True), transport.sslContext(False))
+        self.assertEqual(transport.sslContext(True).verify_mode, ssl.CERT_REQUIRED)
+        self.assertEqual(transport.sslContext(False).verify_mode, ssl.CERT_NONE)
+
+    def test_global_ssl_state_is_untouched(self):
+        # The deprecated helper no longer rebinds the ssl module default
+        default = ssl._create_default_https_context
+        fn.setup_ssl_context()
+
+        self.assertIs(ssl._create_default_https_context, default)
+
+
+@unittest.skipUnless(shutil.which("openssl"), "requires the openssl command")
+class TestHttpsPool(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.mkdtemp()
+        cls.cert = os.path.join(cls.directory, "cert.pem")
+        key = os.path.join(cls.directory, "key.pem")
+        subprocess.run(
+            [
+                "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+                "-keyout", key, "-out", cls.cert, "-days", "1",
+                "-subj", "/CN=localhost", "-addext", "subjectAltName=IP:127.0.0.1",
+            ],
+            check=True,
+            capture_output=True,
+        )
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(cls.cert, key)
+        cls.server = StubServer(lambda path: b'[{"ok": true}]', ssl_context=context).start()
+        cls.url = cls.server.url + "/markets/index"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+        shutil.rmtree(cls.directory)
+
+    def test_unverified_accepts_self_signed(self):
+        # verify=False connects to a server with an unknown certificate
+        pool = transport.ConnectionPool(verify=False)
+
+        self.assertEqual(pool.request(self.url).body, b'[{"ok": true}]')
+        pool.clear()
+
+    def test_verified_rejects_unknown_certificate(self):
+        # verify=True checks the certificate against the system CA store
+        pool = transport.ConnectionPool(verify=True)
+
+        with self.assertRaises(ssl.SSLCertVerificationError):
+            pool.request(self.url)
+
+    def test_verified_with_ca_bundle(self):
+        # verify may name a CA bundle file
+        pool = transport.ConnectionPool(verify=self.cert)
+
+        self.assertEqual(pool.request(self.url).status, 200)
+        pool.clear()
+
+    def test_new_connections_resume_the_session(self):
+        # A fresh connection to the same host resumes the saved TLS session
+        pool = transport.ConnectionPool(verify=False)
+        pool.request(self.url)
+        pool.clear()
+        pool.request(self.url)
+        pool.clear()
+
+        self.assertEqual(pool.created, 2)
+        self.assertEqual(pool.resumed, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,236 +2,141 @@
 This package allows Trading Economics clients to easily query the Trading Economics API to get data into their Python code.
 """
 
+import importlib
 import sys
 
 PY3 = sys.version_info[0] == 3
 
 
-if PY3:  # Python 3+
-    from .functions import (
-        AuthenticationError,
-        CredentialsError,
-        ParametersError,
-        WebRequestError,
-        DateError,
-    )
-    from .historicalDB import getHistorical
-    from .historical import (
-        getHistoricalData,
-        getHistoricalRatings,
-        getHistoricalByTicker,
-        getHistoricalLatest,
-        getHistoricalUpdates,
-    )
-    from .calendar import (  # pyright: ignore[reportAttributeAccessIssue]  # Conflicts with Python builtin
-        getCalendarData,  # pyright: ignore[reportAttributeAccessIssue]
-        getCalendarId,  # pyright: ignore[reportAttributeAccessIssue]
-        getCalendarUpdates,  # pyright: ignore[reportAttributeAccessIssue]
-        getCalendarEventsByGroup,  # pyright: ignore[reportAttributeAccessIssue]
-        getCalendarEvents,  # pyright: ignore[reportAttributeAccessIssue]
-    )
-    from .forecasts import getForecastData, getForecastByTicker, getForecastUpdates
-    from .indicators import (
-        getIndicatorData,
-        getRatings,
-        getLatestUpdates,
-        getDiscontinuedIndicator,
-        getIndicatorByCategoryGroup,
-        getIndicatorByTicker,
-        getPeers,
-        getAllCountries,
-        getIndicatorChanges,
-        getCreditRatingsUpdates,
-    )
-    from .markets import (
-        getMarketsData,
-        getMarketsBySymbol,
-        getMarketsIntraday,
-        getMarketsPeers,
-        getMarketsComponents,
-        getMarketsSearch,
-        getMarketsForecasts,
-        getCurrencyCross,
-        getMarketsIntradayByInterval,
-        getMarketsStockDescriptions,
-        getMarketsSymbology,
-        getStocksByCountry,
-        getMarketsByCountry,
-        getMarketsDiscontinued
-    )
-    from .historical import (
-        getHistoricalData,
-        getHistoricalRatings,
-        getHistoricalByTicker,
-        getHistoricalLatest,
-        getHistoricalUpdates,
-    )
-    from .calendar import (  # pyright: ignore[reportAttributeAccessIssue]  # Conflicts with Python builtin
-        getCalendarData,  # pyright: ignore[reportAttributeAccessIssue]
-        getCalendarId,  # pyright: ignore[reportAttributeAccessIssue]
-        getCalendarUpdates,  # pyright: ignore[reportAttributeAccessIssue]
-        getCalendarEventsByGroup,  # pyright: ignore[reportAttributeAccessIssue]
-        getCalendarEvents,  # pyright: ignore[reportAttributeAccessIssue]
-    )
-    from .forecasts import getForecastData, getForecastByTicker, getForecastUpdates
-    from .indicators import (
-        getIndicatorData,
-        getRatings,
-        getLatestUpdates,
-        getDiscontinuedIndicator,
-        getIndicatorByCategoryGroup,
-        getIndicatorByTicker,
-        getPeers,
-        getAllCountries,
-        getIndicatorChanges,
-        getCreditRatingsUpdates,
-    )
-    from .markets import (
-        getMarketsData,
-        getMarketsBySymbol,
-        getMarketsIntraday,
-        getMarketsPeers,
-        getMarketsComponents,
-        getMarketsSearch,
-        getMarketsForecasts,
-        getCurrencyCross,
-        getMarketsIntradayByInterval,
-        getMarketsStockDescriptions,
-        getMarketsSymbology,
-        getStocksByCountry,
-        getMarketsByCountry,
-    )
-    from .historicalMarkets import fetchMarkets
-    from .glob import (  # pyright: ignore[reportAttributeAccessIssue]  # Conflicts with Python builtin
-        login,  # pyright: ignore[reportAttributeAccessIssue]
-        subscribe,  # pyright: ignore[reportAttributeAccessIssue]
-    )
-    from .stream import run
-    from .earnings import getEarnings, getEarningsType
-    from .news import getNews, getArticles, getArticleId
-    from .worldBank import (
-        getWBCategories,
-        getWBIndicator,
-        getWBCountry,
-        getWBHistorical,
-    )
-    from .comtrade import (
-        getCmtCategories,
-        getCmtCountry,
-        getCmtHistorical,
-        getCmtTwoCountries,
-        getCmtUpdates,
-        getCmtCountryByCategory,
-        getCmtTotalByType,
-        getCmtCountryFilterByType,
-        getCmtSnapshotByType,
-        getCmtLastUpdates,
-    )
-    from .federalReserve import (
-        getFedRStates,
-        getFedRSnaps,
-        getFedRHistorical,
-        getFedRCounty,
-    )
-    from .eurostat import (
-        getEurostatData,
-        getEurostatCountries,
-        getEurostatCategoryGroups,
-    )
-    from .historicalEurostat import getHistoricalEurostat
-    from .financials import (
-        getFinancialsData,
-        getFinancialsCategoryList,
-        getFinancialsDataByCategory,
-        getSectors,
-    )
-    from .historicalFinancials import getFinancialsHistorical
-    from .search import getSearch
-    from .dividends import getDividends
-    from .credit_ratings import getCreditRatings, getHistoricalCreditRatings
-    from .ipo import getIpo
-    from .stock_splits import getStockSplits
+# Public names and the module defining them. Modules are imported on first
+# access (PEP 562), so `import tradingeconomics` stays cheap and pandas is only
+# loaded once a DataFrame is built.
+_EXPORTS = {
+    "functions": (
+        "AuthenticationError",
+        "CredentialsError",
+        "ParametersError",
+        "WebRequestError",
+        "DateError",
+    ),
+    "historicalDB": ("getHistorical",),
+    "historical": (
+        "getHistoricalData",
+        "getHistoricalRatings",
+        "getHistoricalByTicker",
+        "getHistoricalLatest",
+        "getHistoricalUpdates",
+    ),
+    "calendar": (
+        "getCalendarData",
+        "getCalendarId",
+        "getCalendarUpdates",
+        "getCalendarEventsByGroup",
+        "getCalendarEvents",
+    ),
+    "forecasts": ("getForecastData", "getForecastByTicker", "getForecastUpdates"),
+    "indicators": (
+        "getIndicatorData",
+        "getRatings",
+        "getLatestUpdates",
+        "getDiscontinuedIndicator",
+        "getIndicatorByCategoryGroup",
+        "getIndicatorByTicker",
+        "getPeers",
+        "getAllCountries",
+        "getIndicatorChanges",
+        "getCreditRatingsUpdates",
+    ),
+    "markets": (
+        "getMarketsData",
+        "getMarketsBySymbol",
+        "getMarketsIntraday",
+        "getMarketsPeers",
+        "getMarketsComponents",
+        "getMarketsSearch",
+        "iterMarketsSearch",
+        "getMarketsForecasts",
+        "getCurrencyCross",
+        "getMarketsIntradayByInterval",
+        "getMarketsStockDescriptions",
+        "getMarketsSymbology",
+        "getStocksByCountry",
+        "getMarketsByCountry",
+        "getMarketsDiscontinued",
+    ),
+    "historicalMarkets": ("fetchMarkets",),
+    "glob": ("login", "subscribe"),
+    "stream": ("run", "runBatches"),
+    "earnings": ("getEarnings", "getEarningsType"),
+    "news": ("getNews", "getArticles", "getArticleId", "iterNews", "iterArticles"),
+    "worldBank": (
+        "getWBCategories",
+        "getWBIndicator",
+        "getWBCountry",
+        "iterWBCategories",
+        "iterWBCountry",
+        "getWBHistorical",
+    ),
+    "comtrade": (
+        "getCmtCategories",
+        "getCmtCountry",
+        "getCmtHistorical",
+        "getCmtTwoCountries",
+        "iterCmtCountry",
+        "iterCmtTwoCountries",
+        "getCmtUpdates",
+        "getCmtCountryByCategory",
+        "getCmtTotalByType",
+        "getCmtCountryFilterByType",
+        "getCmtSnapshotByType",
+        "getCmtLastUpdates",
+    ),
+    "federalReserve": (
+        "getFedRStates",
+        "getFedRSnaps",
+        "iterFedRSnaps",
+        "getFedRHistorical",
+        "getFedRCounty",
+    ),
+    "eurostat": (
+        "getEurostatData",
+        "getEurostatCountries",
+        "getEurostatCategoryGroups",
+    ),
+    "historicalEurostat": ("getHistoricalEurostat",),
+    "financials": (
+        "getFinancialsData",
+        "getFinancialsCategoryList",
+        "getFinancialsDataByCategory",
+        "getSectors",
+    ),
+    "historicalFinancials": ("getFinancialsHistorical",),
+    "search": ("getSearch",),
+    "dividends": ("getDividends",),
+    "credit_ratings": ("getCreditRatings", "getHistoricalCreditRatings"),
+    "ipo": ("getIpo",),
+    "stock_splits": ("getStockSplits",),
+}
 
+_ATTRIBUTES = {name: module for module, names in _EXPORTS.items() for name in names}
 
-else:  # Python 2.X
-    from historicalDB import getHistorical
-    from historical import (
-        getHistoricalData,
-        getHistoricalRatings,
-        getHistoricalByTicker,
-    )
-    from calendar import (  # pyright: ignore[reportAttributeAccessIssue]  # Conflicts with Python builtin
-        getCalendarData,  # pyright: ignore[reportAttributeAccessIssue]
-        getCalendarId,  # pyright: ignore[reportAttributeAccessIssue]
-        getCalendarUpdates,  # pyright: ignore[reportAttributeAccessIssue]
-        getCalendarEventsByGroup,  # pyright: ignore[reportAttributeAccessIssue]
-        getCalendarEvents,  # pyright: ignore[reportAttributeAccessIssue]
-    )
-    from forecasts import getForecastData, getForecastByTicker, getForecastUpdates
-    from indicators import (
-        getIndicatorData,
-        getRatings,
-        getLatestUpdates,
-        getDiscontinuedIndicator,
-        getIndicatorByCategoryGroup,
-        getIndicatorByTicker,
-        getPeers,
-        getIndicatorChanges,
-        getCreditRatingsUpdates,
-    )
-    from markets import (
-        getMarketsData,
-        getMarketsBySymbol,
-        getMarketsIntraday,
-        getMarketsPeers,
-        getMarketsComponents,
-        getMarketsSearch,
-        getMarketsForecasts,
-        getCurrencyCross,
-        getMarketsIntradayByInterval,
-        getMarketsStockDescriptions,
-    )
-    from historicalMarkets import fetchMarkets
-    from glob import (  # pyright: ignore[reportAttributeAccessIssue]  # Conflicts with Python builtin
-        login,  # pyright: ignore[reportAttributeAccessIssue]
-        subscribe,  # pyright: ignore[reportAttributeAccessIssue]
-    )
-    from stream import run
-    from earnings import getEarnings, getEarningsType
-    from news import getNews, getArticles, getArticleId
-    from worldBank import getWBCategories, getWBIndicator, getWBCountry, getWBHistorical
-    from comtrade import (
-        getCmtCategories,
-        getCmtCountry,
-        getCmtHistorical,
-        getCmtTwoCountries,
-        getCmtUpdates,
-        getCmtCountryByCategory,
-        getCmtTotalByType,
-        getCmtCountryFilterByType,
-        getCmtSnapshotByType,
-        getCmtLastUpdates,
-    )
-    from federalReserve import (
-        getFedRStates,
-        getFedRSnaps,
-        getFedRHistorical,
-        getFedRCounty,
-    )
-    from eurostat import (
-        getEurostatData,
-        getEurostatCountries,
-        getEurostatCategoryGroups,
-    )
-    from historicalEurostat import getHistoricalEurostat
-    from financials import (
-        getFinancialsData,
-        getFinancialsCategoryList,
-        getFinancialsDataByCategory,
-    )
-    from historicalFinancials import getFinancialsHistorical
-    from search import getSearch
-    from dividends import getDividends
-    from credit_ratings import getCreditRatings
-    from ipo import getIpo
-    from stock_splits import getStockSplits
+__all__ = sorted(_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module = _ATTRIBUTES.get(name)
+    if module is None:
+        # Submodules such as tradingeconomics.markets are loaded on access too
+        try:
+            return importlib.import_module("." + name, __name__)
+        except ModuleNotFoundError as e:
+            if e.name != __name__ + "." + name:
+                raise
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    value = getattr(importlib.import_module("." + module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,419 @@
+"""
+Awaitable versions of the public get*/fetch* functions.
+
+    import asyncio
+    from tradingeconomics import aio
+
+    async def main():
+        return await asyncio.gather(
+            aio.getHistoricalData(country='mexico', indicator='gdp'),
+            aio.getMarketsBySymbol(symbols=['aapl:us', 'indu:ind']),
+        )
+
+Each coroutine runs the matching blocking function only to build and
+validate its request (paramCheck, checkDates, stringOrList, ...), then sends
+the request through one asyncio connection pool per event loop. The pool
+keeps connections alive and caps in-flight requests at glob.AIO_LIMIT, so
+hundreds of calls can be fanned out from one loop without a thread each.
+Keys, caches, rate limiter and retry policy are those of the active client:
+await the coroutines inside `with client.activate():` to use another one.
+"""
+
+import asyncio
+import functools
+import gzip
+import http.client
+import io
+import types
+import weakref
+from urllib.parse import urljoin, urlsplit
+
+import tradingeconomics
+from . import functions as fn
+from . import glob
+from .client import getClient
+from .transport import (
+    DEFAULT_PORTS,
+    MAX_REDIRECTS,
+    REDIRECT_CODES,
+    USER_AGENT,
+    Response,
+    proxyFor,
+    proxyHeaders,
+    sslContext,
+)
+
+
+class AsyncConnectionPool(object):
+    """
+    Keep-alive HTTP(S) connection pool for one asyncio event loop.
+    =================================================================
+    Parameters:
+    -----------
+    limit: int.
+             Maximum number of requests in flight at once.
+             Defaults to glob.AIO_LIMIT.
+    maxsize: int.
+             Idle connections kept per host. Defaults to limit.
+    timeout: float.
+             Seconds allowed for each request. Defaults to glob.TIMEOUT.
+    verify: bool or string.
+             Certificate verification, see transport.sslContext.
+             Defaults to glob.VERIFY_SSL.
+    """
+
+    def __init__(self, limit=None, maxsize=None, timeout=None, verify=None):
+        self.limit = glob.AIO_LIMIT if limit is None else limit
+        self.maxsize = self.limit if maxsize is None else maxsize
+        self.timeout = glob.TIMEOUT if timeout is None else timeout
+        self.ssl_context = sslContext(verify)
+        self._semaphore = asyncio.Semaphore(self.limit)
+        self._idle = {}
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def request(self, url, headers=None):
+        """
+        Send a GET request and return a transport.Response.
+        Redirects are followed.
+        """
+        async with self._semaphore:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            try:
+                for _ in range(MAX_REDIRECTS + 1):
+                    if self.timeout is None:
+                        response = await self._send(url, headers)
+                    else:
+                        response = await asyncio.wait_for(
+                            self._send(url, headers), self.timeout
+                        )
+                    location = response.getheader("Location")
+                    if response.status not in REDIRECT_CODES or not location:
+                        return response
+                    url = urljoin(url, location)
+                raise http.client.HTTPException("Too many redirects: " + url)
+            finally:
+                self.in_flight -= 1
+
+    async def _open(self, scheme, host, port, proxy):
+        context = self.ssl_context if scheme == "https" else None
+        if proxy is None:
+            return await asyncio.open_connection(host, port, ssl=context)
+        reader, writer = await asyncio.open_connection(proxy.hostname, proxy.port or 80)
+        if context is None:
+            return reader, writer
+        try:
+            # Tunnel TLS through the proxy with CONNECT
+            await self._tunnel(reader, writer, host, port, proxy)
+        except BaseException:
+            writer.close()
+            raise
+        return reader, writer
+
+    async def _tunnel(self, reader, writer, host, port, proxy):
+        authority = "%s:%d" % (host, port)
+        data = "CONNECT %s HTTP/1.1\r\nHost: %s\r\n" % (authority, authority)
+        data += "".join("%s: %s\r\n" % item for item in proxyHeaders(proxy).items())
+        writer.write((data + "\r\n").encode("latin-1"))
+        await writer.drain()
+
+        line = await reader.readline()
+        status_line = line.decode("iso-8859-1").rstrip("\r\n").split(" ", 2)
+        if len(status_line) < 2 or not status_line[0].startswith("HTTP/"):
+            raise http.client.BadStatusLine(line)
+        while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+            pass
+        if status_line[1] != "200":
+            raise OSError("Tunnel connection failed: " + " ".join(status_line[1:]))
+
+        if hasattr(writer, "start_tls"):
+            await writer.start_tls(self.ssl_context, server_hostname=host)
+            return
+        # StreamWriter.start_tls is Python 3.11+, swap the transport like it does
+        writer._transport = await asyncio.get_running_loop().start_tls(
+            writer.transport,
+            writer.transport.get_protocol(),
+            self.ssl_context,
+            server_hostname=host,
+        )
+
+    def _release(self, key, conn):
+        idle = self._idle.setdefault(key, [])
+        if len(idle) < self.maxsize:
+            idle.append(conn)
+        else:
+            self.discarded += 1
+            conn[1].close()
+
+    async def _send(self, url, headers):
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in DEFAULT_PORTS:
+            raise ValueError("Unsupported URL scheme: " + parts.scheme)
+        port = parts.port or DEFAULT_PORTS[scheme]
+        key = (scheme, parts.hostname, port)
+
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+        proxy = proxyFor(scheme, parts.hostname)
+        host = parts.hostname
+        if port != DEFAULT_PORTS[scheme]:
+            host += ":%d" % port
+        send_headers = {
+            "Host": host,
+            "Accept-Encoding": "gzip",
+            "User-Agent": USER_AGENT,
+        }
+        if headers:
+            send_headers.update(headers)
+        if proxy is not None and scheme == "http":
+            # Plain HTTP through a proxy sends the absolute URL
+            target = url
+            send_headers.update(proxyHeaders(proxy))
+        data = "GET %s HTTP/1.1\r\n" % target
+        data += "".join("%s: %s\r\n" % item for item in send_headers.items())
+        data = (data + "\r\n").encode("latin-1")
+
+        while True:
+            idle = self._idle.get(key)
+            if idle:
+                conn, reused = idle.pop(), True
+                self.reused += 1
+            else:
+                conn, reused = await self._open(*key, proxy), False
+                self.created += 1
+            reader, writer = conn
+            try:
+                writer.write(data)
+                await writer.drain()
+                response, keep_alive = await _readResponse(reader)
+            except (ConnectionError, EOFError, http.client.BadStatusLine):
+                writer.close()
+                if reused:
+                    # The server dropped an idle connection, retry on a new one
+                    continue
+                raise
+            except BaseException:
+                writer.close()
+                raise
+            break
+
+        if keep_alive:
+            self._release(key, conn)
+        else:
+            writer.close()
+
+        if response.getheader("Content-Encoding", "").lower() == "gzip":
+            response.body = gzip.decompress(response.body)
+        return response
+
+    def clear(self):
+        """Close every idle connection."""
+        idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for reader, writer in connections:
+                writer.close()
+
+
+async def _readResponse(reader):
+    line = await reader.readline()
+    if not line:
+        raise http.client.RemoteDisconnected(
+            "Remote end closed connection without response"
+        )
+    status_line = line.decode("iso-8859-1").rstrip("\r\n").split(" ", 2)
+    if len(status_line) < 2 or not status_line[0].startswith("HTTP/"):
+        raise http.client.BadStatusLine(line)
+    version = status_line[0]
+    status = int(status_line[1])
+    reason = status_line[2] if len(status_line) > 2 else ""
+
+    header_lines = []
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        header_lines.append(line)
+    headers = http.client.parse_headers(io.BytesIO(b"".join(header_lines) + b"\r\n"))
+
+    connection = headers.get("Connection", "").lower()
+    if version == "HTTP/1.1":
+        keep_alive = "close" not in connection
+    else:
+        keep_alive = "keep-alive" in connection
+
+    if "chunked" in headers.get("Transfer-Encoding", "").lower():
+        chunks = []
+        while True:
+            size = int((await reader.readline()).split(b";")[0].strip(), 16)
+            if size == 0:
+                break
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)
+        # Skip trailers
+        while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+            pass
+        body = b"".join(chunks)
+    elif headers.get("Content-Length") is not None:
+        body = await reader.readexactly(int(headers["Content-Length"]))
+    elif status in (204, 304) or 100 <= status < 200:
+        body = b""
+    else:
+        body = await reader.read()
+        keep_alive = False
+
+    return Response(status, reason, headers, body), keep_alive
+
+
+_pools = weakref.WeakKeyDictionary()
+_settings = {}
+
+
+def getPool():
+    """Return the connection pool of the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = _pools[loop] = AsyncConnectionPool(**_settings)
+    return pool
+
+
+def configurePool(limit=None, pool_size=None, timeout=None, verify=None):
+    """
+    Set the concurrency limit, idle connections per host, timeout and
+    certificate verification of the asyncio pools. Pools created afterwards use these settings; when
+    called inside an event loop its current pool is replaced.
+    =================================================================
+    Example
+    -------
+    configurePool(limit = 200, pool_size = 50, timeout = 30)
+    """
+    _settings.clear()
+    _settings.update(limit=limit, maxsize=pool_size, timeout=timeout, verify=verify)
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    old = _pools.pop(loop, None)
+    if old is not None:
+        old.clear()
+
+
+async def close():
+    """Close the idle connections of the running event loop."""
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        pool.clear()
+
+
+async def _send(url, headers, client):
+    limiter = client.rate_limiter
+    if limiter is not None:
+        delay = limiter.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    response = await getPool().request(url, headers)
+    if limiter is not None:
+        limiter.observe(response.status, response.headers)
+    return response
+
+
+async def _fetch(url, headers):
+    client = getClient()
+    body = client.lookup(url)
+    if body is not None:
+        return fn.decodeBody(body)
+    conditional = client.validators(url)
+    policy = client.retryPolicy()
+    try:
+        response = await policy.callAsync(
+            url, lambda: _send(url, dict(headers, **conditional), client)
+        )
+        if response.getcode() == 304:
+            body = client.revalidated(url)
+            if body is not None:
+                return fn.decodeBody(body)
+            response = await policy.callAsync(url, lambda: _send(url, headers, client))
+    except (OSError, EOFError, asyncio.TimeoutError, http.client.HTTPException) as e:
+        raise fn.WebRequestError(
+            f"Network error: Unable to connect to Trading Economics API. "
+            f"Please check your internet connection. Details: {str(e)}"
+        )
+    webResults = fn.parseResponse(response)
+    client.store(url, response.body, response.headers)
+    return webResults
+
+
+async def _prefetch(url, headers):
+    try:
+        return await _fetch(url, headers)
+    except (fn.WebRequestError, fn.ParametersError, fn.AuthenticationError) as e:
+        # Re-raised from inside the endpoint, like a failed blocking call
+        return e
+
+
+async def call(func, *args, **kwargs):
+    """
+    Await a blocking endpoint function with its requests sent through
+    the asyncio pool. The function runs to collect the requests it makes,
+    which are fetched concurrently, and once more with the fetched
+    payloads, so validation, output formatting and any post-processing
+    stay exactly as in the blocking API. Functions splitting a call into
+    several requests (fn.iterAll) defer them all in one round; only
+    requests that depend on earlier answers, like the next page, take
+    another. A lazy result, like getMarketsIntradayByInterval with
+    stream=True, is read to the end here, since its requests could not be
+    deferred once the call has returned, and an iterator over it is
+    returned.
+
+    Example
+    -------
+    await call(te.getMarketsData, marketsField = 'index', output_type = 'df')
+    """
+    prefetched = {}
+    while True:
+        token = fn._prefetched.set(prefetched)
+        try:
+            result = func(*args, **kwargs)
+            if isinstance(result, types.GeneratorType):
+                return iter(list(result))
+            return result
+        except fn.DeferredRequest as deferred:
+            requests = deferred.requests
+        finally:
+            fn._prefetched.reset(token)
+        results = await asyncio.gather(
+            *[_prefetch(url, headers) for url, headers in requests]
+        )
+        prefetched.update(zip([url for url, _ in requests], results))
+
+
+def _asyncEndpoint(func):
+    @functools.wraps(func)
+    async def endpoint(*args, **kwargs):
+        return await call(func, *args, **kwargs)
+
+    return endpoint
+
+
+def _isEndpoint(name):
+    return name.startswith(("get", "fetch")) and callable(
+        getattr(tradingeconomics, name, None)
+    )
+
+
+def __getattr__(name):
+    if _isEndpoint(name):
+        endpoint = _asyncEndpoint(getattr(tradingeconomics, name))
+        globals()[name] = endpoint
+        return endpoint
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | {n for n in dir(tradingeconomics) if _isEndpoint(n)})
@@ -0,0 +1,381 @@
+"""
+Asyncio client of the Trading Economics stream.
+
+    from tradingeconomics import stream
+
+    async def main():
+        async for message in stream.subscribe(['EURUSD:CUR', 'AAPL:US']):
+            print(message['s'], message['price'])
+
+        async with stream.subscribe('calendar') as subscription:
+            async for batch in subscription.batches(size = 500, timeout = 0.05):
+                store(batch)
+
+The websocket runs on asyncio streams in the consumer's event loop: no
+thread is started and messages are decoded once, with the JSON decoder of
+decoder.py, before they are handed out. Subscriptions are sent with the
+same {"topic": "subscribe", "to": event} messages as stream.run().
+
+Keepalive messages of the server are counted and skipped, pings are
+answered, and the client pings the server every heartbeat seconds; a
+connection silent for two heartbeats is considered lost and raises
+StreamError from the iterator.
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import struct
+from urllib.parse import urlsplit
+
+from . import decoder
+from . import glob
+from . import livecache
+from .transport import USER_AGENT, sslContext
+
+
+class StreamError(ConnectionError):
+    pass
+
+
+# Frame opcodes (RFC 6455).
+CONTINUATION, TEXT, BINARY, CLOSE, PING, PONG = 0x0, 0x1, 0x2, 0x8, 0x9, 0xA
+
+# Topics of the messages the server sends to keep idle connections open.
+HEARTBEAT_TOPICS = frozenset(("keepalive", "heartbeat"))
+
+_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+_DEFAULT_PORTS = {"ws": 80, "wss": 443}
+
+
+def normalizeEvents(events):
+    """
+    Return the list of events to subscribe to, with symbols upper case and
+    other topics lower case like glob.subscribe.
+    """
+    if isinstance(events, str):
+        events = events.split(",")
+    return [ev.upper() if ":" in ev else ev.lower() for ev in events]
+
+
+def _mask(payload, key):
+    # XOR with the key repeated, on one big integer rather than per byte
+    if not payload:
+        return payload
+    size = len(payload)
+    repeated = (key * (size // 4 + 1))[:size]
+    return (int.from_bytes(payload, "big") ^ int.from_bytes(repeated, "big")).to_bytes(
+        size, "big"
+    )
+
+
+def encodeFrame(opcode, payload, mask=True):
+    """Return a final frame; frames sent by clients must be masked."""
+    head = bytearray([0x80 | opcode])
+    size = len(payload)
+    bit = 0x80 if mask else 0
+    if size < 126:
+        head.append(bit | size)
+    elif size < 1 << 16:
+        head.append(bit | 126)
+        head += struct.pack("!H", size)
+    else:
+        head.append(bit | 127)
+        head += struct.pack("!Q", size)
+    if mask:
+        key = os.urandom(4)
+        head += key
+        payload = _mask(payload, key)
+    return bytes(head) + payload
+
+
+async def readFrame(reader):
+    """Read one frame and return (fin, opcode, payload)."""
+    first, second = await reader.readexactly(2)
+    size = second & 0x7F
+    if size == 126:
+        size = struct.unpack("!H", await reader.readexactly(2))[0]
+    elif size == 127:
+        size = struct.unpack("!Q", await reader.readexactly(8))[0]
+    key = await reader.readexactly(4) if second & 0x80 else None
+    payload = await reader.readexactly(size)
+    if key is not None:
+        payload = _mask(payload, key)
+    return bool(first & 0x80), first & 0x0F, payload
+
+
+async def connect(url, verify=None, timeout=None):
+    """
+    Open a websocket connection to a ws:// or wss:// url and return its
+    (reader, writer) streams once the server accepted the upgrade.
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    if scheme not in _DEFAULT_PORTS:
+        raise ValueError("Unsupported URL scheme: " + parts.scheme)
+    port = parts.port or _DEFAULT_PORTS[scheme]
+    context = sslContext(verify) if scheme == "wss" else None
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_connection(parts.hostname, port, ssl=context), timeout
+    )
+
+    target = parts.path or "/"
+    if parts.query:
+        target += "?" + parts.query
+    host = parts.hostname
+    if port != _DEFAULT_PORTS[scheme]:
+        host += ":%d" % port
+    key = base64.b64encode(os.urandom(16))
+    request = (
+        "GET %s HTTP/1.1\r\nHost: %s\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+        "Sec-WebSocket-Key: %s\r\nSec-WebSocket-Version: 13\r\nUser-Agent: %s\r\n\r\n"
+        % (target, host, key.decode(), USER_AGENT)
+    )
+    writer.write(request.encode("latin-1"))
+    try:
+        head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), timeout)
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError) as e:
+        writer.close()
+        raise StreamError("Invalid websocket handshake response") from e
+    lines = head.decode("latin-1").split("\r\n")
+    headers = {}
+    for line in lines[1:]:
+        name, _, value = line.partition(":")
+        headers[name.strip().lower()] = value.strip()
+    accept = base64.b64encode(hashlib.sha1(key + _GUID).digest()).decode()
+    if lines[0].split(" ")[1:2] != ["101"] or headers.get("sec-websocket-accept") != accept:
+        writer.close()
+        raise StreamError("Websocket upgrade refused: " + lines[0])
+    return reader, writer
+
+
+class _Closed(object):
+    # Queued by the reader task when the connection ends
+
+    def __init__(self, error=None):
+        self.error = error
+
+
+class Subscription(object):
+    """
+    Async iterator over the messages of a stream subscription.
+    =================================================================
+    Parameters:
+    -----------
+    events: string or list.
+             Symbols and topics to subscribe to, for example
+             ['EURUSD:CUR', 'calendar']. Defaults to the ones added with
+             te.subscribe().
+    heartbeat: float.
+             Seconds between pings to the server; 0 turns them off.
+             Defaults to glob.STREAM_HEARTBEAT.
+    queue_size: int.
+             Decoded messages buffered for the consumer before the socket
+             stops being read. Defaults to glob.STREAM_QUEUE_SIZE.
+    decode: bool.
+             Hand out decoded JSON messages; False hands out the text.
+    url: string.
+             Stream URL. Defaults to the one of stream.build_url().
+
+    Example
+    -------
+    async for message in Subscription(['EURUSD:CUR']):
+        print(message)
+    """
+
+    def __init__(
+        self, events=None, heartbeat=None, queue_size=None, decode=True, url=None
+    ):
+        self.events = normalizeEvents(glob._event if events is None else events)
+        self.heartbeat = glob.STREAM_HEARTBEAT if heartbeat is None else heartbeat
+        self.queue_size = glob.STREAM_QUEUE_SIZE if queue_size is None else queue_size
+        self.decode = decode
+        self.url = url
+        self.received = 0
+        self.heartbeats = 0
+        self._reader = self._writer = None
+        self._queue = None
+        self._tasks = []
+        self._closing = None
+        self._last = 0.0
+
+    async def connect(self):
+        """Open the connection and send the subscriptions."""
+        if self.url is None:
+            from .stream import build_url
+
+            self.url = build_url()
+        self._reader, self._writer = await connect(self.url, timeout=glob.TIMEOUT)
+        for ev in self.events:
+            await self._send(TEXT, json.dumps({"topic": "subscribe", "to": ev}).encode())
+        loop = asyncio.get_running_loop()
+        self._last = loop.time()
+        self._queue = asyncio.Queue(self.queue_size)
+        self._tasks = [loop.create_task(self._read())]
+        if self.heartbeat:
+            self._tasks.append(loop.create_task(self._ping()))
+        return self
+
+    async def _send(self, opcode, payload):
+        self._writer.write(encodeFrame(opcode, payload))
+        await self._writer.drain()
+
+    def _message(self, payload):
+        if not self.decode:
+            return payload.decode("utf-8")
+        try:
+            message = decoder.loads(payload)
+        except ValueError:
+            return payload.decode("utf-8", "replace")
+        if isinstance(message, dict) and message.get("topic") in HEARTBEAT_TOPICS:
+            self.heartbeats += 1
+            return None
+        cache = livecache.getLiveCache()
+        if cache is not None and isinstance(message, dict):
+            cache.update(message)
+        return message
+
+    async def _read(self):
+        loop = asyncio.get_running_loop()
+        fragments = []
+        error = None
+        try:
+            while True:
+                fin, opcode, payload = await readFrame(self._reader)
+                self._last = loop.time()
+                if opcode == PING:
+                    await self._send(PONG, payload)
+                    continue
+                if opcode == PONG:
+                    continue
+                if opcode == CLOSE:
+                    break
+                fragments.append(payload)
+                if not fin:
+                    continue
+                payload = b"".join(fragments)
+                fragments = []
+                message = self._message(payload)
+                if message is not None:
+                    self.received += 1
+                    await self._queue.put(message)
+        except (asyncio.IncompleteReadError, OSError) as e:
+            error = StreamError("Stream connection lost: %s" % (e or type(e).__name__))
+        except Exception as e:
+            error = StreamError("Stream reader failed: %r" % (e,))
+            error.__cause__ = e
+        finally:
+            # Also on cancellation, so a waiting consumer always wakes up
+            self._finish(_Closed(error))
+
+    def _finish(self, closed):
+        try:
+            self._queue.put_nowait(closed)
+        except asyncio.QueueFull:
+            # Queued once the consumer makes room
+            self._closing = asyncio.get_running_loop().create_task(self._queue.put(closed))
+
+    async def _ping(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(self.heartbeat)
+            if loop.time() - self._last > 2 * self.heartbeat:
+                # Ends the reader, which reports the lost connection
+                self._writer.close()
+                return
+            try:
+                await self._send(PING, b"")
+            except OSError:
+                return
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._queue is None:
+            await self.connect()
+        message = await self._queue.get()
+        if isinstance(message, _Closed):
+            return await self._end(message)
+        return message
+
+    async def _end(self, closed):
+        # Every later call ends the same way
+        self._queue.put_nowait(closed)
+        await self.close()
+        if closed.error is not None:
+            raise closed.error
+        raise StopAsyncIteration
+
+    async def batch(self, size=100, timeout=0.0):
+        """
+        Wait for one message, then return a list of up to size messages,
+        waiting at most timeout seconds for more than the ones buffered.
+        """
+        messages = [await self.__anext__()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while len(messages) < size:
+            if self._queue.empty():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    message = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            else:
+                message = self._queue.get_nowait()
+            if isinstance(message, _Closed):
+                # Reported by the next call
+                self._queue.put_nowait(message)
+                break
+            messages.append(message)
+        return messages
+
+    async def batches(self, size=100, timeout=0.0):
+        """Yield the lists returned by batch(size, timeout) until the stream ends."""
+        while True:
+            try:
+                yield await self.batch(size, timeout)
+            except StopAsyncIteration:
+                return
+
+    async def close(self):
+        """Cancel the background tasks and close the connection."""
+        tasks, self._tasks = self._tasks, []
+        current = asyncio.current_task()
+        for task in tasks:
+            if task is not current:
+                task.cancel()
+        writer, self._writer = self._writer, None
+        if writer is None:
+            return
+        try:
+            if not writer.is_closing():
+                writer.write(encodeFrame(CLOSE, struct.pack("!H", 1000)))
+            writer.close()
+            await writer.wait_closed()
+        except OSError:
+            pass
+
+    async def __aenter__(self):
+        return await self.connect()
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+def subscribe(events=None, heartbeat=None, queue_size=None, decode=True, url=None):
+    """
+    Return a Subscription to iterate over with async for.
+    =================================================================
+    Example
+    -------
+    async for message in subscribe(['EURUSD:CUR', 'AAPL:US']):
+        print(message)
+    """
+    return Subscription(events, heartbeat, queue_size, decode, url)
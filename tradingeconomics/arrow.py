@@ -0,0 +1,125 @@
+"""
+Apache Arrow and Polars output without pandas.
+
+    te.fetchMarkets(symbol = 'aapl:us', initDate = '2020-01-01', output_type = 'arrow')
+    te.getMarketsIntradayByInterval(symbol = 'aapl:us', interval = '1m', initDate = '2024-01-02', output_type = 'polars')
+
+output_type='arrow' returns a pyarrow.Table built column by column from
+the decoded JSON, and output_type='polars' a polars.DataFrame wrapping that
+table without copying it. The dtype schema of the endpoint (schema.py) is
+always applied: dates become timestamps, low-cardinality strings are
+dictionary encoded, and price and value columns are float32 when
+schema.enableSchemas(float32 = True) is on. Timestamps with a zone offset
+are converted to UTC, and columns mixing values Arrow cannot hold in one
+type are kept as JSON text.
+
+pyarrow and polars are optional: pip install tradingeconomics[arrow] or
+tradingeconomics[polars].
+"""
+
+import importlib
+import itertools
+import json
+
+from . import schema
+
+
+def _require(module, extra):
+    try:
+        return importlib.import_module(module)
+    except ImportError:
+        raise ImportError(
+            "output_type=%r requires the %s package: pip install tradingeconomics[%s]"
+            % (extra, module, extra)
+        )
+
+
+def _columns(records):
+    # One list per key, in the order keys first appear; missing keys are null
+    if isinstance(records, dict):
+        records = [records]
+    keys = dict.fromkeys(itertools.chain.from_iterable(records))
+    return {key: [record.get(key) for record in records] for key in keys}
+
+
+def _array(pa, values):
+    # A column mixing types Arrow cannot unify (numbers and strings, bools
+    # and numbers, objects and scalars) is kept as JSON text
+    try:
+        return pa.array(values)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array(
+            [v if v is None or isinstance(v, str) else json.dumps(v) for v in values],
+            pa.string(),
+        )
+
+
+def _timestamps(pa, pc, column, fmt):
+    if fmt == schema.ISO:
+        try:
+            return pc.cast(column, pa.timestamp("us"))
+        except pa.ArrowInvalid:
+            # Timestamps with a zone offset are converted to UTC
+            return pc.cast(column, pa.timestamp("us", "UTC"))
+    return pc.strptime(column, format=fmt, unit="s")
+
+
+def toTable(webResults, api_request=None):
+    """
+    Build a pyarrow.Table from decoded JSON records, typed with the schema
+    registered for api_request.
+    =================================================================
+    Parameters:
+    -----------
+    webResults: list of dict.
+             Decoded JSON records.
+    api_request: string.
+             URL or path of the request, selecting the schema.
+
+    Example
+    -------
+    toTable([{'Symbol': 'AAPL:US', 'Close': 185.2}], '/markets/historical/aapl:us')
+    """
+    pa = _require("pyarrow", "arrow")
+    import pyarrow.compute as pc
+
+    columns = _columns(webResults)
+    table = pa.table({name: _array(pa, values) for name, values in columns.items()})
+    found = schema.getSchema(api_request) if api_request else None
+    if found is None:
+        return table
+
+    names = table.column_names
+    for name, fmt in found.datetimes.items():
+        if name in names and pa.types.is_string(table[name].type):
+            try:
+                column = _timestamps(pa, pc, table[name], fmt)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError):
+                # Values in an unexpected format are left untouched
+                continue
+            table = table.set_column(names.index(name), name, column)
+    for name in found.categories:
+        if name in names and pa.types.is_string(table[name].type):
+            table = table.set_column(
+                names.index(name), name, pc.dictionary_encode(table[name])
+            )
+    if schema._float32:
+        for name in found.floats:
+            if name in names and pa.types.is_float64(table[name].type):
+                table = table.set_column(
+                    names.index(name), name, table[name].cast(pa.float32())
+                )
+    return table
+
+
+def toPolars(webResults, api_request=None):
+    """
+    Build a polars.DataFrame from decoded JSON records through toTable,
+    without copying the Arrow columns.
+    =================================================================
+    Example
+    -------
+    toPolars([{'Symbol': 'AAPL:US', 'Close': 185.2}], '/markets/historical/aapl:us')
+    """
+    pl = _require("polars", "polars")
+    return pl.from_arrow(toTable(webResults, api_request))
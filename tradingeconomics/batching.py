@@ -0,0 +1,289 @@
+"""
+Micro-batching of stream messages into columnar batches.
+
+    from tradingeconomics import stream
+
+    def on_batch(batch):
+        prices = batch['price']          # numpy array of the batch's prices
+
+    stream.runBatches(on_batch, size = 1000, interval = 0.1)
+
+Messages are decoded and written straight into one preallocated numpy
+array per field. A batch is handed to the callback when it holds size
+messages or when its first message is interval seconds old, as a dict of
+arrays, a DataFrame (output_type='df') or a pyarrow.RecordBatch
+(output_type='arrow'). Consumers that work on whole columns then do one
+vectorized operation per batch instead of one Python call per tick, and
+appending batches to a frame is no longer quadratic.
+
+Numbers are stored as int64 or float64 (ints become floats when a float or
+a missing value shows up), everything else as objects. Fields that appear
+in the middle of a batch are missing (NaN or None) in the earlier rows.
+numpy is only imported once a batch is built, so importing the stream
+module does not load it.
+"""
+
+import threading
+import time
+
+from . import decoder
+from . import glob
+from .aiostream import HEARTBEAT_TOPICS
+
+
+OUTPUT_TYPES = ("dict", "df", "arrow")
+
+
+def _kind(value):
+    if isinstance(value, bool):
+        return "O"
+    if isinstance(value, int):
+        return "i"
+    if isinstance(value, float):
+        return "f"
+    return "O"
+
+
+def _empty(kind, size):
+    import numpy as np
+
+    if kind == "i":
+        return np.empty(size, np.int64)
+    if kind == "f":
+        return np.full(size, np.nan)
+    return np.full(size, None, object)
+
+
+class Columns(object):
+    """
+    Preallocated columns filled one record at a time.
+    =================================================================
+    Parameters:
+    -----------
+    size: int.
+             Rows preallocated; appending more grows the arrays.
+    fields: list of string.
+             Fields kept, in column order. Defaults to every field, in
+             the order they are first seen.
+
+    Example
+    -------
+    columns = Columns(1000)
+    columns.append({'s': 'AAPL:US', 'price': 185.2})
+    columns.take('df')
+    """
+
+    def __init__(self, size, fields=None):
+        self.size = size
+        self.fields = list(fields) if fields is not None else None
+        self._reset()
+
+    def _reset(self):
+        self.count = 0
+        self.started = None
+        self._columns = {}
+        self._kinds = {}
+        for field in self.fields or ():
+            self._add(field, "f")
+
+    def _add(self, field, kind):
+        if kind == "i" and self.count:
+            kind = "f"
+        column = _empty(kind, self.size)
+        self._columns[field] = column
+        self._kinds[field] = kind
+
+    def _convert(self, field, kind):
+        # Widen a column so a value of kind fits: int to float, else object
+        column = self._columns[field]
+        count = self.count
+        if kind == "f" and self._kinds[field] == "i":
+            column = column.astype(float)
+            column[count:] = float("nan")
+        else:
+            missing = column[:count] != column[:count] if self._kinds[field] == "f" else None
+            column = column.astype(object)
+            column[count:] = None
+            if missing is not None:
+                column[:count][missing] = None
+            kind = "O"
+        self._columns[field] = column
+        self._kinds[field] = kind
+
+    def _missing(self, field):
+        # Unwritten float and object rows already hold NaN and None
+        if self._kinds[field] == "i":
+            self._convert(field, "f")
+
+    def append(self, record):
+        """Write the fields of a decoded message into the next row."""
+        row = self.count
+        if row == self.size:
+            self.size *= 2
+            for field, column in self._columns.items():
+                grown = _empty(self._kinds[field], self.size)
+                grown[:row] = column[:row]
+                self._columns[field] = grown
+        if self.started is None:
+            self.started = time.monotonic()
+        seen = 0
+        for field, value in record.items():
+            if field not in self._columns:
+                if self.fields is not None:
+                    continue
+                self._add(field, _kind(value))
+            seen += 1
+            if value is None:
+                self._missing(field)
+                continue
+            kind = self._kinds[field]
+            if kind != "O" and _kind(value) not in (kind, "i"):
+                self._convert(field, _kind(value))
+            self._columns[field][row] = value
+        if seen < len(self._columns):
+            for field in list(self._columns):
+                if field not in record:
+                    self._missing(field)
+        self.count = row + 1
+
+    def take(self, output_type="dict"):
+        """
+        Return the rows written so far as a batch of output_type and start
+        a new batch with fresh buffers.
+        """
+        count = self.count
+        columns = {field: column[:count] for field, column in self._columns.items()}
+        self._reset()
+        if output_type == "df":
+            import pandas as pd
+
+            return pd.DataFrame(columns, copy=False)
+        if output_type == "arrow":
+            from .arrow import _array, _require
+
+            pa = _require("pyarrow", "arrow")
+            return pa.RecordBatch.from_arrays(
+                [_array(pa, column) for column in columns.values()], list(columns)
+            )
+        return columns
+
+
+def columnarBatch(messages, output_type="dict", fields=None):
+    """
+    Return a list of decoded messages, e.g. one from the batch() of
+    stream.subscribe, as one columnar batch of output_type.
+    =================================================================
+    Example
+    -------
+    columnarBatch(await subscription.batch(size = 1000, timeout = 0.1), 'df')
+    """
+    columns = Columns(max(1, len(messages)), fields)
+    for message in messages:
+        columns.append(message)
+    return columns.take(output_type)
+
+
+class TickBatcher(object):
+    """
+    Collect stream messages into columnar batches for a callback.
+    =================================================================
+    Parameters:
+    -----------
+    callback: callable.
+             Called with each batch.
+    size: int.
+             Messages per batch. Defaults to glob.STREAM_BATCH_SIZE.
+    interval: float.
+             Longest time in seconds a message waits in a batch. Defaults
+             to glob.STREAM_BATCH_INTERVAL.
+    output_type: string.
+             'dict' (default) for a dict of numpy arrays, 'df' for a
+             DataFrame, 'arrow' for a pyarrow.RecordBatch.
+    fields: list of string.
+             Fields kept. Defaults to all of them.
+
+    Example
+    -------
+    batcher = TickBatcher(on_batch, size = 1000, interval = 0.1, output_type = 'df')
+    te.run(batcher.onMessage)
+    """
+
+    def __init__(self, callback, size=None, interval=None, output_type=None, fields=None):
+        self.callback = callback
+        self.size = size or glob.STREAM_BATCH_SIZE
+        self.interval = glob.STREAM_BATCH_INTERVAL if interval is None else interval
+        self.output_type = output_type or "dict"
+        if self.output_type not in OUTPUT_TYPES:
+            raise ValueError(
+                "output_type must be one of %s, not %r"
+                % (", ".join(OUTPUT_TYPES), self.output_type)
+            )
+        self.batches = 0
+        self.messages = 0
+        self._columns = Columns(self.size, fields)
+        self._lock = threading.Condition()
+        self._closed = False
+        self._timer = None
+        if self.interval:
+            self._timer = threading.Thread(
+                target=self._flushOld, name="tradingeconomics-batching", daemon=True
+            )
+            self._timer.start()
+
+    def onMessage(self, ws, message):
+        """on_message function for stream.run(): adds one JSON message."""
+        record = decoder.loads(message)
+        if isinstance(record, dict):
+            self.add(record)
+
+    def add(self, record):
+        """
+        Add a decoded message, handing the batch over once it is full.
+        Keepalive messages of the server are skipped.
+        """
+        if record.get("topic") in HEARTBEAT_TOPICS:
+            return
+        with self._lock:
+            self._columns.append(record)
+            self.messages += 1
+            if self._columns.count == 1:
+                self._lock.notify()
+            if self._columns.count >= self.size:
+                self._deliver()
+
+    def _deliver(self):
+        # Called with the lock held, so batches reach the callback in order
+        batch = self._columns.take(self.output_type)
+        self.batches += 1
+        try:
+            self.callback(batch)
+        except Exception as e:
+            print(e)
+
+    def flush(self):
+        """Hand over the messages waiting in the current batch, if any."""
+        with self._lock:
+            if self._columns.count:
+                self._deliver()
+
+    def _flushOld(self):
+        with self._lock:
+            while not self._closed:
+                started = self._columns.started
+                if started is None:
+                    self._lock.wait()
+                    continue
+                remaining = started + self.interval - time.monotonic()
+                if remaining > 0:
+                    self._lock.wait(remaining)
+                elif self._columns.count:
+                    self._deliver()
+
+    def close(self):
+        """Flush the last batch and stop the timer."""
+        self.flush()
+        with self._lock:
+            self._closed = True
+            self._lock.notify_all()
+        if self._timer is not None and self._timer is not threading.current_thread():
+            self._timer.join()
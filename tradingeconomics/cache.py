@@ -0,0 +1,488 @@
+"""
+Opt-in response caches used by functions.dataRequest.
+
+    from tradingeconomics import cache
+    cache.enableCache(max_entries = 2048, ttls = {'/markets/symbol/*': 30})
+    cache.enableDiskCache(ttls = {'/historical/*': 6 * 3600})
+
+Entries are the raw JSON bodies of successful responses, keyed by the
+canonical request URL with the API key removed, so every caller decodes its
+own copy and the byte budget is exact. Entries are shared by every API key
+using the cache. The in-memory tier is per process; the SQLite tier is shared
+by all processes pointing at the same file.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+
+# Query parameters that carry credentials and are dropped from cache keys.
+CREDENTIAL_PARAMS = ("c", "client", "key")
+
+# Default time-to-live in seconds per request path pattern (fnmatch syntax,
+# longest matching pattern wins). Reference lists change rarely, prices often.
+DEFAULT_TTLS = {
+    "/country": 86400,
+    "/comtrade/categories": 86400,
+    "/financials/categories": 86400,
+    "/sectors": 86400,
+    "/eurostat/countries": 86400,
+    # Market snapshots only; historical and intraday prices do not change
+    "/markets/commodities": 60,
+    "/markets/currency": 60,
+    "/markets/index": 60,
+    "/markets/bond": 60,
+    "/markets/crypto": 60,
+    "/markets/symbol/*": 60,
+    "/markets/country/*": 60,
+    "/markets/stocks/country/*": 60,
+    "/markets/components/*": 60,
+    "/markets/peers/*": 60,
+}
+
+
+def canonicalUrl(url):
+    """
+    Return url with a lower-case scheme and host, sorted query parameters
+    and credential parameters removed.
+    """
+    parts = urlsplit(url)
+    query = sorted(
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in CREDENTIAL_PARAMS
+    )
+    return urlunsplit(
+        (parts.scheme.lower(), parts.netloc.lower(), parts.path, urlencode(query), "")
+    )
+
+
+def requestPath(url):
+    path = urlsplit(url).path
+    if len(path) > 1:
+        path = path.rstrip("/")
+    return path
+
+
+class TtlPolicy(object):
+    """Per-path time-to-live rules shared by the memory and disk caches."""
+
+    def __init__(self, default_ttl, ttls):
+        self.default_ttl = default_ttl
+        self.ttls = dict(DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self._patterns = sorted(self.ttls, key=len, reverse=True)
+
+    def ttlFor(self, url):
+        path = requestPath(url)
+        for pattern in self._patterns:
+            if fnmatchcase(path, pattern):
+                return self.ttls[pattern]
+        return self.default_ttl
+
+
+class ResponseCache(TtlPolicy):
+    """
+    Thread-safe LRU cache of response bodies with per-path TTLs.
+    =================================================================
+    Parameters:
+    -----------
+    max_entries: int.
+             Maximum number of cached responses.
+    max_bytes: int.
+             Maximum total size of cached bodies.
+    default_ttl: float.
+             Seconds a response stays fresh when no pattern in ttls matches.
+             0 disables caching for those paths.
+    ttls: dict.
+             Path pattern -> seconds, merged over DEFAULT_TTLS.
+             For example, ttls = {'/markets/symbol/*': 30, '/historical/*': 3600}
+
+    Example
+    -------
+    cache = ResponseCache(max_entries = 512, max_bytes = 32 * 1024 * 1024)
+    cache.stats()
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=64 * 1024 * 1024, default_ttl=300, ttls=None):
+        TtlPolicy.__init__(self, default_ttl, ttls)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, url):
+        """Return the cached body for url, or None."""
+        key = canonicalUrl(url)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            body, expires = entry
+            if expires <= now:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def set(self, url, body):
+        """Store body for url unless its TTL is 0 or it exceeds max_bytes."""
+        ttl = self.ttlFor(url)
+        key = canonicalUrl(url)
+        size = len(body) + len(key)
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (body, time.monotonic() + ttl)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key):
+        body, expires = self._entries.pop(key)
+        self._bytes -= len(body) + len(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self):
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+class DiskCache(TtlPolicy):
+    """
+    SQLite response cache shared by every process on the machine.
+    =================================================================
+    Bodies are stored zlib-compressed together with their ETag and
+    Last-Modified validators. Expired entries are kept so the next request
+    can be revalidated with If-None-Match / If-Modified-Since, and the least
+    recently used entries are evicted once max_bytes is exceeded. Readers
+    and writers in different processes are coordinated by SQLite (WAL mode).
+
+    Parameters:
+    -----------
+    path: string.
+             Database file. Defaults to responses.sqlite in glob.CACHE_DIR.
+    max_bytes: int.
+             Maximum total size of the compressed bodies.
+    default_ttl: float.
+             Seconds a response stays fresh when no pattern in ttls matches.
+    ttls: dict.
+             Path pattern -> seconds, merged over DEFAULT_TTLS.
+
+    Example
+    -------
+    disk = DiskCache(max_bytes = 1024 ** 3, ttls = {'/historical/*': 6 * 3600})
+    disk.entries('/historical/*')
+    disk.purge('/markets/historical/*')
+    """
+
+    # Access times closer together than this are not written back
+    ACCESS_RESOLUTION = 60
+
+    def __init__(self, path=None, max_bytes=512 * 1024 * 1024, default_ttl=3600, ttls=None):
+        from . import glob
+
+        TtlPolicy.__init__(self, default_ttl, ttls)
+        if path is None:
+            path = os.path.join(glob.CACHE_DIR, "responses.sqlite")
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revalidations = 0
+        # usage holds the total size of the bodies, kept up to date by
+        # triggers so set() does not sum the whole table
+        self._connect().executescript(
+            """
+            BEGIN IMMEDIATE;
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                stored REAL NOT NULL,
+                expires REAL NOT NULL,
+                accessed REAL NOT NULL,
+                etag TEXT,
+                last_modified TEXT
+            );
+            CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+            CREATE TABLE IF NOT EXISTS usage (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                size INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO usage (id, size)
+                SELECT 0, COALESCE(SUM(size), 0) FROM responses;
+            CREATE TRIGGER IF NOT EXISTS responses_insert AFTER INSERT ON responses
+            BEGIN
+                UPDATE usage SET size = size + NEW.size WHERE id = 0;
+            END;
+            CREATE TRIGGER IF NOT EXISTS responses_delete AFTER DELETE ON responses
+            BEGIN
+                UPDATE usage SET size = size - OLD.size WHERE id = 0;
+            END;
+            CREATE TRIGGER IF NOT EXISTS responses_update AFTER UPDATE OF size ON responses
+            BEGIN
+                UPDATE usage SET size = size - OLD.size + NEW.size WHERE id = 0;
+            END;
+            COMMIT;
+            """
+        )
+
+    def _connect(self):
+        # sqlite3 connections are bound to one thread and must not cross fork()
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # Rows replaced by INSERT OR REPLACE fire the delete trigger
+            conn.execute("PRAGMA recursive_triggers=ON")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def _read(self, url):
+        return self._connect().execute(
+            "SELECT body, expires, accessed, etag, last_modified FROM responses WHERE key = ?",
+            (canonicalUrl(url),),
+        ).fetchone()
+
+    def _touch(self, url, accessed, expires=None):
+        now = time.time()
+        if expires is None:
+            if now - accessed < self.ACCESS_RESOLUTION:
+                return
+            self._connect().execute(
+                "UPDATE responses SET accessed = ? WHERE key = ?", (now, canonicalUrl(url))
+            )
+        else:
+            self._connect().execute(
+                "UPDATE responses SET accessed = ?, expires = ? WHERE key = ?",
+                (now, expires, canonicalUrl(url)),
+            )
+
+    def get(self, url):
+        """Return the fresh cached body for url, or None."""
+        row = self._read(url)
+        if row is None or row[1] <= time.time():
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        self._touch(url, row[2])
+        return zlib.decompress(row[0])
+
+    def validators(self, url):
+        """Return conditional request headers for a stored (stale) entry."""
+        row = self._read(url)
+        headers = {}
+        if row is not None:
+            if row[3]:
+                headers["If-None-Match"] = row[3]
+            if row[4]:
+                headers["If-Modified-Since"] = row[4]
+        return headers
+
+    def revalidated(self, url):
+        """Mark a stored entry fresh again after a 304 and return its body."""
+        row = self._read(url)
+        if row is None:
+            return None
+        with self._lock:
+            self.revalidations += 1
+        self._touch(url, row[2], time.time() + self.ttlFor(url))
+        return zlib.decompress(row[0])
+
+    def set(self, url, body, headers=None):
+        """Store body for url unless its TTL is 0."""
+        ttl = self.ttlFor(url)
+        if ttl <= 0:
+            return
+        compressed = zlib.compress(body, 6)
+        if len(compressed) > self.max_bytes:
+            return
+        headers = headers or {}
+        now = time.time()
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses "
+            "(key, path, body, size, stored, expires, accessed, etag, last_modified) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                canonicalUrl(url),
+                requestPath(url),
+                compressed,
+                len(compressed),
+                now,
+                now + ttl,
+                now,
+                headers.get("ETag"),
+                headers.get("Last-Modified"),
+            ),
+        )
+        self._evict(conn)
+
+    def _evict(self, conn):
+        excess = conn.execute("SELECT size FROM usage").fetchone()[0] - self.max_bytes
+        if excess <= 0:
+            return
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+        with self._lock:
+            self.evictions += len(victims)
+
+    def entries(self, pattern="*"):
+        """
+        List stored responses whose request path matches pattern
+        (fnmatch syntax), most recently used first.
+        """
+        rows = self._connect().execute(
+            "SELECT key, size, stored, expires, accessed FROM responses "
+            "WHERE path GLOB ? ORDER BY accessed DESC",
+            (pattern,),
+        )
+        now = time.time()
+        return [
+            {
+                "url": key,
+                "size": size,
+                "stored": stored,
+                "expires": expires,
+                "accessed": accessed,
+                "fresh": expires > now,
+            }
+            for key, size, stored, expires, accessed in rows
+        ]
+
+    def purge(self, pattern="*", expired_only=False):
+        """
+        Delete stored responses whose request path matches pattern and
+        return how many were removed.
+        """
+        query = "DELETE FROM responses WHERE path GLOB ?"
+        params = [pattern]
+        if expired_only:
+            query += " AND expires <= ?"
+            params.append(time.time())
+        return self._connect().execute(query, params).rowcount
+
+    def clear(self):
+        self.purge()
+
+    def stats(self):
+        entries, size = self._connect().execute(
+            "SELECT (SELECT COUNT(*) FROM responses), size FROM usage"
+        ).fetchone()
+        with self._lock:
+            return {
+                "entries": entries,
+                "bytes": size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "revalidations": self.revalidations,
+            }
+
+
+_cache = None
+_disk = None
+
+
+def enableCache(max_entries=1024, max_bytes=64 * 1024 * 1024, default_ttl=300, ttls=None):
+    """
+    Turn on the process-wide response cache and return it.
+    =================================================================
+    Parameters:
+    -----------
+    See ResponseCache.
+
+    Example
+    -------
+    enableCache()
+    enableCache(default_ttl = 0, ttls = {'/country': 86400, '/sectors': 86400})
+    """
+    global _cache
+    _cache = ResponseCache(max_entries, max_bytes, default_ttl, ttls)
+    return _cache
+
+
+def disableCache():
+    global _cache
+    _cache = None
+
+
+def getCache():
+    """Return the active ResponseCache, or None when caching is off."""
+    return _cache
+
+
+def enableDiskCache(path=None, max_bytes=512 * 1024 * 1024, default_ttl=3600, ttls=None):
+    """
+    Turn on the on-disk response cache shared across processes and return it.
+    It sits below the in-memory cache when both are enabled.
+    =================================================================
+    Parameters:
+    -----------
+    See DiskCache.
+
+    Example
+    -------
+    enableDiskCache()
+    enableDiskCache(path = '/var/cache/te/responses.sqlite', ttls = {'/historical/*': 6 * 3600})
+    """
+    global _disk
+    _disk = DiskCache(path, max_bytes, default_ttl, ttls)
+    return _disk
+
+
+def disableDiskCache():
+    global _disk
+    _disk = None
+
+
+def getDiskCache():
+    """Return the active DiskCache, or None when it is off."""
+    return _disk
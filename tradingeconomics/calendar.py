@@ -113,8 +113,6 @@ def getCalendarId(id=None, output_type=None):
 
     """
 
-    fn.setup_ssl_context()
-
     if id == None:
         linkAPI = "/calendar"
     else:
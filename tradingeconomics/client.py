@@ -0,0 +1,222 @@
+"""
+Isolated API clients.
+
+    from tradingeconomics.client import TradingEconomicsClient
+
+    acme = TradingEconomicsClient(apikey = 'key:secret', timeout = 30)
+    acme.getMarketsData(marketsField = 'index', output_type = 'df')
+
+Every client owns its API key, base URL, connection pool, response caches,
+rate limiter and retry policy, so one process can serve several keys at the
+same time from any number of threads. The module functions (te.getX) go
+through the default client, which follows te.login() and the process-wide
+settings of transport, cache, ratelimit and retry as before.
+"""
+
+import contextvars
+import functools
+from contextlib import contextmanager
+
+import tradingeconomics
+from . import cache
+from . import functions as fn
+from . import glob
+from . import ratelimit
+from . import retry
+from . import transport
+
+
+class TradingEconomicsClient(object):
+    """
+    API client with its own credentials, connections, caches and limits.
+    =================================================================
+    Parameters:
+    -----------
+    apikey: string.
+             API key as 'key:secret'. Requests carry no key when omitted.
+    base_url: string.
+             API base URL. Defaults to glob.API_BASE_URL.
+    pool_size: int.
+             Idle keep-alive connections kept per host. Defaults to glob.POOL_SIZE.
+    timeout: float.
+             Socket timeout in seconds. Defaults to glob.TIMEOUT.
+    verify: bool or string.
+             Certificate verification, see transport.sslContext.
+             Defaults to glob.VERIFY_SSL.
+    memory_cache: cache.ResponseCache.
+             In-memory response cache. Defaults to none.
+    disk_cache: cache.DiskCache.
+             On-disk response cache, may be shared with other clients.
+             Defaults to none.
+    rate_limiter: ratelimit.TokenBucket.
+             Rate limiter, may be shared with other clients using the same
+             key. Defaults to none.
+    retry_policy: retry.RetryPolicy.
+             Retry policy. Defaults to glob.RETRY_ATTEMPTS attempts.
+
+    Example
+    -------
+    client = TradingEconomicsClient(apikey = 'key:secret')
+    client.getCalendarData(country = 'united states')
+    client.call(te.getHistoricalData, country = 'mexico', indicator = 'gdp')
+
+    with client.activate():
+        te.getMarketsBySymbol(symbols = 'aapl:us')
+    """
+
+    def __init__(
+        self,
+        apikey=None,
+        base_url=None,
+        pool_size=None,
+        timeout=None,
+        verify=None,
+        memory_cache=None,
+        disk_cache=None,
+        rate_limiter=None,
+        retry_policy=None,
+    ):
+        if apikey:
+            fn.credCheck(apikey)
+        self.apikey = apikey
+        self.base_url = base_url or glob.API_BASE_URL
+        self.pool = transport.ConnectionPool(pool_size, timeout, verify)
+        self.memory_cache = memory_cache
+        self.disk_cache = disk_cache
+        self.rate_limiter = rate_limiter
+        self.retry_policy = (
+            retry.RetryPolicy(max_attempts=glob.RETRY_ATTEMPTS)
+            if retry_policy is None
+            else retry_policy
+        )
+        self.inflight = transport.SingleFlight()
+
+    def __repr__(self):
+        key = (self.apikey or "").split(":")[0]
+        return "TradingEconomicsClient(%r, %r)" % (key, self.base_url)
+
+    @contextmanager
+    def activate(self):
+        """
+        Send the requests of module functions called inside the with block
+        through this client, in this thread or asyncio task only.
+        """
+        token = _active.set(self)
+        try:
+            yield self
+        finally:
+            _active.reset(token)
+
+    def call(self, func, *args, **kwargs):
+        """Call an endpoint function with its requests sent by this client."""
+        with self.activate():
+            return func(*args, **kwargs)
+
+    def close(self):
+        """Close the idle connections of this client."""
+        self.pool.clear()
+
+    def __getattr__(self, name):
+        if not _isEndpoint(name):
+            raise AttributeError(
+                "%r object has no attribute %r" % (type(self).__name__, name)
+            )
+        func = getattr(tradingeconomics, name)
+
+        @functools.wraps(func)
+        def endpoint(*args, **kwargs):
+            return self.call(func, *args, **kwargs)
+
+        return endpoint
+
+    def __dir__(self):
+        names = set(super(TradingEconomicsClient, self).__dir__())
+        return sorted(names | {n for n in dir(tradingeconomics) if _isEndpoint(n)})
+
+    def headers(self):
+        """Return the headers that authenticate a request."""
+        if self.apikey:
+            return {"Authorization": self.apikey}
+        return {}
+
+    def lookup(self, url):
+        """Return a fresh cached body for url from memory, then disk, or None."""
+        memory, disk = self.memory_cache, self.disk_cache
+        if memory is not None:
+            body = memory.get(url)
+            if body is not None:
+                return body
+        if disk is not None:
+            body = disk.get(url)
+            if body is not None:
+                if memory is not None:
+                    memory.set(url, body)
+                return body
+        return None
+
+    def validators(self, url):
+        """Return conditional request headers for a stale disk entry of url."""
+        disk = self.disk_cache
+        if disk is None:
+            return {}
+        return disk.validators(url)
+
+    def revalidated(self, url):
+        """Return the stored body of url after a 304 Not Modified, or None."""
+        disk = self.disk_cache
+        if disk is None:
+            return None
+        body = disk.revalidated(url)
+        if body is not None:
+            self.store(url, body, disk_too=False)
+        return body
+
+    def store(self, url, body, headers=None, disk_too=True):
+        memory, disk = self.memory_cache, self.disk_cache
+        if memory is not None:
+            memory.set(url, body)
+        if disk is not None and disk_too:
+            disk.set(url, body, headers)
+
+    def retryPolicy(self):
+        """Return the policy of the current call: retry.retrying() wins."""
+        return retry.getRetryPolicy(self.retry_policy)
+
+
+class DefaultClient(TradingEconomicsClient):
+    """
+    Client behind the module functions. Its settings are read on every
+    request from te.login() (glob.apikey), glob.API_BASE_URL and the
+    process-wide transport, cache, ratelimit and retry settings.
+    """
+
+    def __init__(self):
+        pass
+
+    def __repr__(self):
+        return "DefaultClient()"
+
+    apikey = property(lambda self: glob.apikey)
+    base_url = property(lambda self: glob.API_BASE_URL)
+    pool = property(lambda self: transport.getPool())
+    memory_cache = property(lambda self: cache.getCache())
+    disk_cache = property(lambda self: cache.getDiskCache())
+    rate_limiter = property(lambda self: ratelimit.getRateLimiter())
+    retry_policy = property(lambda self: retry._policy)
+    inflight = property(lambda self: transport.inflight)
+
+
+def _isEndpoint(name):
+    return name.startswith(("get", "fetch", "iter")) and callable(
+        getattr(tradingeconomics, name, None)
+    )
+
+
+_default = DefaultClient()
+_active = contextvars.ContextVar("tradingeconomics_client", default=None)
+
+
+def getClient():
+    """Return the client of the current call, or the default client."""
+    client = _active.get()
+    return _default if client is None else client
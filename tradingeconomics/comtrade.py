@@ -1,6 +1,5 @@
 import json
 import urllib
-import pandas as pd
 import sys
 from . import functions as fn
 from . import glob
@@ -78,8 +77,6 @@ def getCmtLastUpdates(output_type=None, country=None, start_date=None):
     getCmtLastUpdates(country = 'portugal', start_date='2022-01-01', output_type='df')
     """
 
-    fn.setup_ssl_context()
-
     if country:
         linkAPI = "/comtrade/updates/country/" + quote(country)
     else:
@@ -111,8 +108,6 @@ def getCmtUpdates(output_type=None):
     getCmtUpdates(output_type = None)
 
     """
-    fn.setup_ssl_context()
-
     linkAPI = "/comtrade/updates"
 
     return fn.dataRequest(api_request=linkAPI, output_type=output_type)
@@ -138,14 +133,12 @@ def getCmtCategories(output_type=None):
     getCmtCategories(category = None, output_type = None)
 
     """
-    fn.setup_ssl_context()
-
     linkAPI = "/comtrade/categories"
 
     return fn.dataRequest(api_request=linkAPI, output_type=output_type)
 
 
-def getCmtCountry(country=None, page_number=None, output_type=None):
+def getCmtCountry(country=None, page_number=None, output_type=None, all_pages=False):
     """
     Get detailed information about Comtrade countries.
     =================================================================================
@@ -160,6 +153,8 @@ def getCmtCountry(country=None, page_number=None, output_type=None):
     output_type: string.
              'dict'(default) for dictionary format output, 'df' for data frame,
              'raw' for list of dictionaries directly from the web.
+    all_pages: bool.
+             Fetch every page and return them merged; page_number is ignored.
 
     Notes
     -----
@@ -173,15 +168,13 @@ def getCmtCountry(country=None, page_number=None, output_type=None):
 
     getCmtCountry(country = ['china', 'portugal'], page_number = 3, output_type = None)
 
-    """
-    fn.setup_ssl_context()
+    getCmtCountry(country = 'china', output_type = 'df', all_pages = True)
 
-    linkAPI = "/comtrade/countries"
+    """
+    if all_pages:
+        return fn.mergeResults(iterCmtCountry(country, output_type), output_type)
 
-    if country is None:
-        linkAPI = "/comtrade/countries"
-    else:
-        linkAPI = checkCmtCountry(country)
+    linkAPI = cmtCountryLink(country)
 
     if page_number != None:
         linkAPI = checkCmtPage(linkAPI, page_number)
@@ -189,6 +182,36 @@ def getCmtCountry(country=None, page_number=None, output_type=None):
     return fn.dataRequest(api_request=linkAPI, output_type=output_type)
 
 
+def cmtCountryLink(country):
+    if country is None:
+        return "/comtrade/countries"
+    return checkCmtCountry(country)
+
+
+def iterCmtCountry(country=None, output_type=None, prefetch=None):
+    """
+    Iterate over the pages of getCmtCountry, one result per page.
+    =================================================================================
+
+    Parameters:
+    -----------
+    prefetch: int.
+             Pages fetched concurrently ahead of the one being read.
+             Defaults to TE_PAGE_PREFETCH (1).
+
+    Example
+    -------
+    for page in iterCmtCountry(country = 'china', output_type = 'df', prefetch = 4):
+        store(page)
+
+    """
+    linkAPI = cmtCountryLink(country)
+
+    return fn.iterPages(
+        lambda page: checkCmtPage(linkAPI, page), output_type, prefetch
+    )
+
+
 def getCmtHistorical(symbol=None, output_type=None):
     """
     Get Historical data.
@@ -213,8 +236,6 @@ def getCmtHistorical(symbol=None, output_type=None):
     getCmtHistorical(symbol = 'PRTESP24031', output_type = None)
 
     """
-    fn.setup_ssl_context()
-
     linkAPI = "/comtrade/historical/"
 
     if symbol == None:
@@ -226,7 +247,7 @@ def getCmtHistorical(symbol=None, output_type=None):
 
 
 def getCmtTwoCountries(
-    country1=None, country2=None, page_number=None, output_type=None
+    country1=None, country2=None, page_number=None, output_type=None, all_pages=False
 ):
     """
     Get detailed information about Comtrade between two countries.
@@ -240,22 +261,24 @@ def getCmtTwoCountries(
     output_type: string.
              'dict'(default) for dictionary format output, 'df' for data frame,
              'raw' for list of dictionaries directly from the web.
+    all_pages: bool.
+             Fetch every page and return them merged; page_number is ignored.
 
     Example
     -------
     getCmtTwoCountries(country1 = 'portugal', country2 = 'spain', page_number = 3, output_type = None)
 
-    """
-    fn.setup_ssl_context()
-
-    linkAPI = "/comtrade/country"
+    getCmtTwoCountries(country1 = 'portugal', country2 = 'spain', output_type = 'df', all_pages = True)
 
-    if country1 is not None and country2 is None:
-        linkAPI = f"/comtrade/country/{quote(country1)}"
-    elif country1 is not None and country2 is not None:
-        linkAPI = f"/comtrade/country/{quote(country1)}/{quote(country2)}"
-    else:
+    """
+    if country1 is None:
         return "country1 is required"
+    if all_pages:
+        return fn.mergeResults(
+            iterCmtTwoCountries(country1, country2, output_type), output_type
+        )
+
+    linkAPI = cmtTwoCountriesLink(country1, country2)
 
     if page_number != None:
         linkAPI = checkCmtPage(linkAPI, page_number)
@@ -263,6 +286,38 @@ def getCmtTwoCountries(
     return fn.dataRequest(api_request=linkAPI, output_type=output_type)
 
 
+def cmtTwoCountriesLink(country1, country2=None):
+    if country2 is None:
+        return f"/comtrade/country/{quote(country1)}"
+    return f"/comtrade/country/{quote(country1)}/{quote(country2)}"
+
+
+def iterCmtTwoCountries(country1=None, country2=None, output_type=None, prefetch=None):
+    """
+    Iterate over the pages of getCmtTwoCountries, one result per page.
+    =================================================================================
+
+    Parameters:
+    -----------
+    prefetch: int.
+             Pages fetched concurrently ahead of the one being read.
+             Defaults to TE_PAGE_PREFETCH (1).
+
+    Example
+    -------
+    for page in iterCmtTwoCountries(country1 = 'portugal', country2 = 'spain', output_type = 'df'):
+        store(page)
+
+    """
+    if country1 is None:
+        raise ParametersError("country1 is required")
+    linkAPI = cmtTwoCountriesLink(country1, country2)
+
+    return fn.iterPages(
+        lambda page: checkCmtPage(linkAPI, page), output_type, prefetch
+    )
+
+
 def getCmtCountryByCategory(country=None, type=None, category=None, output_type=None):
     """
     Get detailed information about Comtrade Country by Imports or Exports and by Category
@@ -28,8 +28,6 @@ def getCreditRatings(
     getCreditRatings(country=['mexico', 'sweden'])
     """
 
-    fn.setup_ssl_context()
-
     linkAPI = "/credit-ratings"
 
     if country != None:
@@ -71,8 +69,6 @@ def getHistoricalCreditRatings(
     getHistoricalCreditRatings(country='mexico', initDate='2010-08-01', endDate='2012-01-01')
     """
 
-    fn.setup_ssl_context()
-
     # Validate that at least one date parameter is provided when country is specified
     if country is not None and initDate is None and endDate is None:
         raise ValueError(
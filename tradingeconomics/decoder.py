@@ -0,0 +1,170 @@
+"""
+JSON decoding of API responses.
+
+    from tradingeconomics import decoder
+    decoder.setDecoder('orjson')
+
+Response bodies are decoded straight from bytes by the fastest installed
+backend: orjson, then simdjson, then ujson, falling back to the standard
+library json module. Which one is used can be forced with setDecoder() or
+the TE_JSON_DECODER environment variable.
+
+Large bodies requested with output_type='df' are decoded by loadsFrame()
+a slice of records at a time into typed columns, which keeps the list of
+dicts of the whole response from being built first.
+"""
+
+import importlib
+import re
+
+from . import glob
+
+
+# Decoders tried in order when none is chosen.
+BACKENDS = ("orjson", "simdjson", "ujson", "json")
+
+
+def _orjson(module):
+    return module.loads
+
+
+def _simdjson(module):
+    parser = module.Parser
+
+    def loads(body):
+        # A parser's documents are only valid until its next parse, so
+        # every body gets its own parser and a plain Python copy
+        return parser().parse(body, True)
+
+    return loads
+
+
+def _ujson(module):
+    return module.loads
+
+
+def _json(module):
+    return module.loads
+
+
+_FACTORIES = {
+    "orjson": _orjson,
+    "simdjson": _simdjson,
+    "ujson": _ujson,
+    "json": _json,
+}
+
+
+def _load(name):
+    if name not in _FACTORIES:
+        raise ValueError(
+            "unknown JSON decoder %r, expected one of %s" % (name, ", ".join(BACKENDS))
+        )
+    return _FACTORIES[name](importlib.import_module(name))
+
+
+def _find():
+    for name in BACKENDS:
+        try:
+            return name, _load(name)
+        except ImportError:
+            continue
+
+
+_backend = None
+
+
+def setDecoder(name=None):
+    """
+    Choose the JSON decoder used for responses.
+    =================================================================
+    Parameters:
+    -----------
+    name: string.
+             One of 'orjson', 'simdjson', 'ujson' or 'json'. None or
+             'auto' picks the first one installed.
+
+    Example
+    -------
+    setDecoder('json')
+    """
+    global _backend
+    if name in (None, "", "auto"):
+        _backend = _find()
+    else:
+        _backend = (name, _load(name))
+    return _backend[0]
+
+
+def getDecoder():
+    """Return the name of the JSON decoder in use."""
+    if _backend is None:
+        setDecoder(glob.JSON_DECODER)
+    return _backend[0]
+
+
+def loads(body):
+    """Decode a JSON document from bytes or str."""
+    if _backend is None:
+        setDecoder(glob.JSON_DECODER)
+    return _backend[1](body)
+
+
+# Possible boundary between two records of a top level array.
+_BOUNDARY = re.compile(rb"\}\s*,\s*\{")
+
+
+def loadsFrame(body, chunk=None):
+    """
+    Decode a JSON array of records into a DataFrame.
+    =================================================================
+    Bodies larger than chunk bytes are cut between records and decoded a
+    slice at a time by the active decoder, each slice becoming a frame of
+    typed columns before the next one is read, so the list of dicts of
+    the whole response never exists at once.
+
+    A cut that falls inside a record leaves a slice that is not valid
+    JSON; the rest of the body is then decoded in one go.
+
+    Parameters:
+    -----------
+    body: bytes.
+             JSON response body.
+    chunk: int.
+             Bytes per slice. Defaults to glob.JSON_FRAME_CHUNK; 0 always
+             decodes in one go.
+
+    Example
+    -------
+    loadsFrame(response.body)
+    """
+    import pandas as pd
+
+    chunk = glob.JSON_FRAME_CHUNK if chunk is None else chunk
+    body = bytes(body)
+    if not chunk or len(body) <= chunk or body.lstrip()[:1] != b"[":
+        return pd.DataFrame(loads(body))
+
+    frames = []
+    start = body.index(b"[") + 1
+    end = body.rindex(b"]")
+    while True:
+        cut = _BOUNDARY.search(body, start + chunk, end)
+        stop = end if cut is None else cut.start() + 1
+        try:
+            records = loads(b"[" + body[start:stop] + b"]")
+        except ValueError:
+            if cut is None:
+                raise
+            # The cut was inside a record
+            records = loads(b"[" + body[start:end] + b"]")
+            cut = None
+        frames.append(pd.DataFrame(records))
+        del records
+        if cut is None:
+            break
+        start = cut.end() - 1
+    if len(frames) == 1:
+        return frames[0]
+    # Slices may disagree on a column's dtype, e.g. all null in one slice
+    return pd.concat(frames, ignore_index=True).infer_objects()
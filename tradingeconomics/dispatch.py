@@ -0,0 +1,235 @@
+"""
+Dispatch of stream messages to a fixed pool of worker threads.
+
+    from tradingeconomics import stream
+    stream.configureDispatch(workers = 8, queue_size = 50000, policy = 'coalesce')
+    te.run(on_message)
+
+Messages are routed by symbol to one of the workers, so the callback sees
+the messages of a symbol in the order they arrived while different symbols
+are handled concurrently. Each worker has a bounded queue; when it is full
+the policy decides what happens to a new message:
+
+    'block'        the socket thread waits for room, slowing the reader
+                   down instead of losing messages.
+    'drop_oldest'  the oldest waiting message of the worker is discarded.
+    'coalesce'     a waiting message of the same symbol is replaced by the
+                   new one, so slow callbacks only see the latest tick; when
+                   the queue is full of other symbols the oldest is dropped.
+
+Queue depths and counters are available with dispatcher.stats().
+"""
+
+import itertools
+import threading
+from collections import OrderedDict
+
+from . import decoder
+from . import glob
+
+
+POLICIES = ("block", "drop_oldest", "coalesce")
+
+
+# Stands for a symbol submit() has to find with the key function.
+_UNKNOWN = object()
+
+
+def decodeMessage(message):
+    """Return a JSON stream message decoded, or None unless it is an object."""
+    try:
+        decoded = decoder.loads(message)
+    except (ValueError, TypeError):
+        return None
+    return decoded if isinstance(decoded, dict) else None
+
+
+def messageSymbol(message):
+    """Return the symbol ('s') of a JSON stream message, or None."""
+    decoded = decodeMessage(message)
+    return None if decoded is None else decoded.get("s")
+
+
+class _Worker(object):
+    # One thread and its queue; counters are guarded by the queue's lock
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.pending = OrderedDict()
+        # Key of the newest waiting message of each symbol, for 'coalesce'
+        self.latest = {}
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+        self.submitted = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.thread = None
+
+    def forget(self, key, entry):
+        # Called with the lock held when a message leaves the queue
+        symbol = entry[2]
+        if self.latest.get(symbol) == key:
+            del self.latest[symbol]
+
+
+class Dispatcher(object):
+    """
+    Call callback(ws, message) for every submitted message on a fixed pool
+    of worker threads with bounded queues.
+    =================================================================
+    Parameters:
+    -----------
+    callback: callable.
+             Called as callback(ws, message), like the on_message function
+             passed to run().
+    workers: int.
+             Worker threads. Defaults to glob.STREAM_WORKERS.
+    queue_size: int.
+             Messages waiting across all workers. Defaults to
+             glob.STREAM_QUEUE_SIZE.
+    policy: string.
+             'block', 'drop_oldest' or 'coalesce' (see the module
+             docstring). Defaults to glob.STREAM_POLICY.
+    key: callable.
+             Returns the symbol of a message, used for routing and
+             coalescing. Defaults to messageSymbol.
+
+    Example
+    -------
+    dispatcher = Dispatcher(on_message, workers = 8, policy = 'drop_oldest')
+    dispatcher.submit(ws, message)
+    dispatcher.stats()
+    """
+
+    def __init__(self, callback, workers=None, queue_size=None, policy=None, key=None):
+        workers = workers or glob.STREAM_WORKERS
+        queue_size = queue_size or glob.STREAM_QUEUE_SIZE
+        policy = policy or glob.STREAM_POLICY
+        if policy not in POLICIES:
+            raise ValueError(
+                "unknown policy %r, expected one of %s" % (policy, ", ".join(POLICIES))
+            )
+        self.callback = callback
+        self.policy = policy
+        self.key = key or messageSymbol
+        self.closed = False
+        self._sequence = itertools.count()
+        capacity = max(1, -(-queue_size // workers))
+        self._workers = [_Worker(capacity) for _ in range(workers)]
+        for number, worker in enumerate(self._workers):
+            worker.thread = threading.Thread(
+                target=self._work,
+                args=(worker,),
+                name="tradingeconomics-dispatch-%d" % number,
+                daemon=True,
+            )
+            worker.thread.start()
+
+    def submit(self, ws, message, symbol=_UNKNOWN):
+        """
+        Queue message for the worker of its symbol, applying the policy
+        when that worker's queue is full. Callers that decoded the message
+        already pass its symbol (or None) so it is not decoded again.
+        """
+        if self.closed:
+            raise RuntimeError("the dispatcher is closed")
+        if symbol is _UNKNOWN:
+            symbol = self.key(message)
+        worker = self._workers[hash(symbol) % len(self._workers)]
+        coalesce = self.policy == "coalesce" and symbol is not None
+        with worker.lock:
+            worker.submitted += 1
+            full = len(worker.pending) >= worker.capacity
+            if full and coalesce and symbol in worker.latest:
+                # Keeps the queue position of the replaced message
+                worker.pending[worker.latest[symbol]] = (ws, message, symbol)
+                worker.coalesced += 1
+                return
+            if self.policy == "block":
+                while len(worker.pending) >= worker.capacity and not self.closed:
+                    worker.not_full.wait()
+                if self.closed:
+                    worker.dropped += 1
+                    return
+            elif full:
+                worker.forget(*worker.pending.popitem(last=False))
+                worker.dropped += 1
+            key = next(self._sequence)
+            worker.pending[key] = (ws, message, symbol)
+            if coalesce:
+                worker.latest[symbol] = key
+            worker.max_depth = max(worker.max_depth, len(worker.pending))
+            worker.not_empty.notify()
+
+    def _work(self, worker):
+        while True:
+            with worker.lock:
+                while not worker.pending and not self.closed:
+                    worker.not_empty.wait()
+                if not worker.pending:
+                    return
+                key, entry = worker.pending.popitem(last=False)
+                worker.forget(key, entry)
+                ws, message = entry[:2]
+                worker.not_full.notify()
+            try:
+                self.callback(ws, message)
+            except Exception as e:
+                print(e)
+                with worker.lock:
+                    worker.errors += 1
+            with worker.lock:
+                worker.delivered += 1
+
+    def depth(self):
+        """Return the number of messages waiting for a worker."""
+        return sum(len(worker.pending) for worker in self._workers)
+
+    def stats(self):
+        """
+        Return counters summed over the workers: messages submitted,
+        delivered to the callback, dropped and coalesced by the policy,
+        callback errors, the current depth of the queues and the largest
+        depth one worker's queue reached.
+        """
+        totals = dict.fromkeys(
+            ("submitted", "delivered", "dropped", "coalesced", "errors", "depth"), 0
+        )
+        max_depth = 0
+        for worker in self._workers:
+            with worker.lock:
+                totals["submitted"] += worker.submitted
+                totals["delivered"] += worker.delivered
+                totals["dropped"] += worker.dropped
+                totals["coalesced"] += worker.coalesced
+                totals["errors"] += worker.errors
+                totals["depth"] += len(worker.pending)
+                max_depth = max(max_depth, worker.max_depth)
+        totals["max_depth"] = max_depth
+        totals["workers"] = len(self._workers)
+        totals["capacity"] = self._workers[0].capacity * len(self._workers)
+        return totals
+
+    def close(self, wait=True, drain=True):
+        """
+        Stop accepting messages. Waiting messages are still delivered
+        unless drain is False; wait joins the worker threads.
+        """
+        self.closed = True
+        for worker in self._workers:
+            with worker.lock:
+                if not drain:
+                    worker.dropped += len(worker.pending)
+                    worker.pending.clear()
+                    worker.latest.clear()
+                worker.not_empty.notify_all()
+                worker.not_full.notify_all()
+        if wait:
+            current = threading.current_thread()
+            for worker in self._workers:
+                if worker.thread is not current:
+                    worker.thread.join()
@@ -37,8 +37,6 @@ def getDividends(
 
     """
 
-    fn.setup_ssl_context()
-
     linkAPI = "/dividends"
 
     if symbols and fn.stringOrList(symbols):
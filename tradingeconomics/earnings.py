@@ -1,11 +1,9 @@
 import json
 import urllib
-import pandas as pd
 import sys
 from . import glob
 import ssl
 from . import functions as fn
-from dateutil.relativedelta import relativedelta
 from typing import List, Union, Optional
 
 PY3 = sys.version_info[0] == 3
@@ -81,8 +79,6 @@ def getEarnings(
     getEarnings(country = 'united states')
     """
 
-    fn.setup_ssl_context()
-
     linkAPI = "/earnings-revenues"
     # Symbols must NOT be URL-encoded; TE API expects literal format like "msft:us"
     if symbols:
@@ -112,8 +108,6 @@ def getEarnings(
 
 
 def getEarningsType(type=None, output_type=None):
-    fn.setup_ssl_context()
-
     linkAPI = "/earnings?type="
     if type:
         linkAPI += quote((type), safe="")
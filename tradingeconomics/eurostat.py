@@ -1,6 +1,5 @@
 import json
 import urllib
-import pandas as pd
 from datetime import datetime, date, timedelta
 import sys
 from . import functions as fn
@@ -152,8 +151,6 @@ def getEurostatData(
 
     getEurostatData(lists='countries',output_type='df')
     """
-    fn.setup_ssl_context()
-
     linkAPI = ""
     if (
         country == None
@@ -1,9 +1,7 @@
 import json
 import itertools
 import urllib
-import pandas as pd
 import sys
-from dateutil.relativedelta import relativedelta
 from . import functions as fn
 from . import glob
 import ssl
@@ -117,8 +115,6 @@ def getFedRStates(county=None, output_type=None):
     getFedRStates(county = 'arkansas', output_type = None)
     """
     name = ""
-    fn.setup_ssl_context()
-
     linkAPI = "/fred/states"
 
     if county != None:
@@ -130,6 +126,20 @@ def getFedRStates(county=None, output_type=None):
     return fn.dataRequest(api_request=linkAPI, output_type=output_type)
 
 
+def fedRSnapLink(symbol=None, country=None, state=None, county=None):
+    linkAPI = "/fred/snapshot/"
+
+    if symbol != None:
+        return checkFedRSymbol(linkAPI, symbol)
+    elif country != None:
+        return checkFedRCountry(linkAPI, country)
+    elif state != None:
+        return checkFedRState(linkAPI, state)
+    elif county != None:
+        return checkFedRCounty(linkAPI, county)
+    return None
+
+
 def getFedRSnaps(
     symbol=None,
     url=None,
@@ -138,6 +148,7 @@ def getFedRSnaps(
     county=None,
     page_number=None,
     output_type=None,
+    all_pages=False,
 ):
     """
     Snapshots can be accessed through symbol, url, country, state or county. All have pagination.
@@ -168,6 +179,8 @@ def getFedRSnaps(
     output_type: string.
              'dict'(default) for dictionary format output, 'df' for data frame,
              'raw' for list of dictionaries directly from the web.
+    all_pages: bool.
+             Fetch every page and return them merged; page_number is ignored.
 
     Notes
     -----
@@ -185,32 +198,71 @@ def getFedRSnaps(
 
     getFedRSnaps(symbol = None, url = None, country = None, state = None, county = 'arkansas', output_type = None)
 
-    """
-
-    fn.setup_ssl_context()
+    getFedRSnaps(state = 'tennessee', output_type = 'df', all_pages = True)
 
-    linkAPI = "/fred/snapshot/"
+    """
 
-    if symbol != None:
-        linkAPI = checkFedRSymbol(linkAPI, symbol)
-    elif url != None:
+    if symbol == None and url != None:
         linkAPI = "/fred/snapshot/url/" + "?url=" + quote(str(url))
         return fn.dataRequest(api_request=linkAPI, output_type=output_type)
-    elif country != None:
-        linkAPI = checkFedRCountry(linkAPI, country)
-    elif state != None:
-        linkAPI = checkFedRState(linkAPI, state)
-    elif county != None:
-        linkAPI = checkFedRCounty(linkAPI, county)
-    else:
+
+    linkAPI = fedRSnapLink(symbol, country, state, county)
+    if linkAPI == None:
         return "A parameter must be provided!"
 
+    if all_pages:
+        return fn.mergeResults(
+            iterFedRSnaps(symbol, url, country, state, county, output_type), output_type
+        )
     if page_number != None:
         linkAPI = checkFedRPage(linkAPI, page_number)
 
     return fn.dataRequest(api_request=linkAPI, output_type=output_type)
 
 
+def iterFedRSnaps(
+    symbol=None,
+    url=None,
+    country=None,
+    state=None,
+    county=None,
+    output_type=None,
+    prefetch=None,
+):
+    """
+    Iterate over the pages of getFedRSnaps, one result per page.
+    =================================================================================
+
+    Parameters:
+    -----------
+    prefetch: int.
+             Pages fetched concurrently ahead of the one being read.
+             Defaults to TE_PAGE_PREFETCH (1).
+
+    Notes
+    -----
+    Snapshots by url have a single page.
+
+    Example
+    -------
+    for page in iterFedRSnaps(state = 'tennessee', output_type = 'df', prefetch = 4):
+        store(page)
+
+    """
+
+    if symbol == None and url != None:
+        linkAPI = "/fred/snapshot/url/" + "?url=" + quote(str(url))
+        return iter([fn.dataRequest(api_request=linkAPI, output_type=output_type)])
+
+    linkAPI = fedRSnapLink(symbol, country, state, county)
+    if linkAPI == None:
+        raise ParametersError("A parameter must be provided!")
+
+    return fn.iterPages(
+        lambda page: checkFedRPage(linkAPI, page), output_type, prefetch
+    )
+
+
 def getFedRCountyOld(state=None, county=None, output_type=None):
     """
     List of Pike County, AR.
@@ -234,8 +286,6 @@ def getFedRCountyOld(state=None, county=None, output_type=None):
 
     """
 
-    fn.setup_ssl_context()
-
     linkAPI = "/fred/snapshot/county/Pike%20County,%20AR"
 
     return fn.dataRequest(api_request=linkAPI, output_type=output_type)
@@ -268,8 +318,6 @@ def getFedRCounty(state=None, county=None, output_type=None):
 
     """
 
-    fn.setup_ssl_context()
-
     # d is a dictionary used for create the api url
     d = {
         "url_base": "/fred/snapshot/county/",
@@ -1,6 +1,5 @@
 import json
 import urllib
-import pandas as pd
 
 import sys
 from . import functions as fn
@@ -96,8 +95,6 @@ def getForecastData(country=None, indicator=None, output_type=None):
 
     getForecastData(country = ['United States', 'India'], indicator = ['Imports','Exports'])
     """
-    fn.setup_ssl_context()
-
     if country == None and indicator == None:
         raise ValueError(
             "At least one of the parameters, country or indicator, needs to be supplied."
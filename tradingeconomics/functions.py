@@ -4,9 +4,11 @@ import itertools
 import urllib
 import sys
 import json
-import pandas as pd
 import time
 import ssl
+import http.client
+import contextvars
+import zlib
 
 PY3 = sys.version_info[0] == 3
 
@@ -41,19 +43,19 @@ class WebRequestError(ValueError):
     pass
 
 
+class NoDataError(ParametersError):
+    """Raised when a request succeeds but returns no records"""
+
+    pass
+
+
 def setup_ssl_context():
     """
-    Configure SSL context to use unverified HTTPS connections.
-    This is needed for compatibility with some API endpoints.
-    Call this once at the start of functions that make HTTPS requests.
+    Kept for backward compatibility, does nothing. Requests use the
+    SSLContext of the transport (transport.sslContext), configured with
+    TE_VERIFY_SSL or transport.configurePool(verify = ...), and the
+    process-wide ssl module state is no longer changed.
     """
-    try:
-        _create_unverified_https_context = ssl._create_unverified_context
-    except AttributeError:
-        # Python doesn't support this, skip
-        pass
-    else:
-        ssl._create_default_https_context = _create_unverified_https_context
 
 
 def credCheck(credentials):
@@ -64,31 +66,82 @@ def credCheck(credentials):
         raise CredentialsError("Invalid credentials.")
 
 
-def out_type(init_format, isCommodity=False):
-    if isCommodity:
-        list_of_countries = init_format.Title.unique()
-    else:
-        list_of_countries = init_format.Country.unique()
-    list_of_cat = init_format.Category.unique()
-    dict_start = {el: {elm: 0 for elm in list_of_cat} for el in list_of_countries}
-    for i, j in itertools.product(
-        range(len(list_of_countries)), range(len(list_of_cat))
-    ):
-        if isCommodity:
-            dict_cntry = init_format.loc[init_format["Title"] == list_of_countries[i]]
-        else:
-            dict_cntry = init_format.loc[init_format["Country"] == list_of_countries[i]]
-        dict_cat = dict_cntry.loc[init_format["Category"] == list_of_cat[j]].to_dict(
-            "records"
-        )
-        dict_start[list_of_countries[i]][list_of_cat[j]] = dict_cat
-        for l in range(len(dict_cat)):
-            if isCommodity:
-                del dict_cat[l]["Title"]
-            else:
-                del dict_cat[l]["Country"]
-            del dict_cat[l]["Category"]
-    return dict_start
+def out_type(init_format, isCommodity=False, sparse=False):
+    """
+    Nest the records of a DataFrame by country (Title for commodities) and
+    category: {country: {category: [records without those two keys]}}.
+    Every country gets every category, with an empty list when the pair
+    has no rows, unless sparse is True.
+    """
+    nested = {}
+    if not sparse:
+        key = "Title" if isCommodity else "Country"
+        categories = init_format["Category"].unique()
+        for country in init_format[key].unique():
+            nested[country] = {category: [] for category in categories}
+    for country, category, records in iterOutType(init_format, isCommodity):
+        nested.setdefault(country, {})[category] = records
+    return nested
+
+
+def iterOutType(init_format, isCommodity=False):
+    """
+    Yield (country, category, records) for each pair present in a
+    DataFrame, in order of first appearance, without building the nested
+    dict of out_type. The rows are grouped in a single pass.
+
+    Example
+    -------
+    for country, category, records in iterOutType(getIndicatorData(output_type = 'df')):
+        store(country, category, records)
+    """
+    key = "Title" if isCommodity else "Country"
+    columns = [c for c in init_format.columns if c not in (key, "Category")]
+    groups = {}
+    pairs = zip(init_format[key].tolist(), init_format["Category"].tolist())
+    for row, pair in enumerate(pairs):
+        # Rows with a missing country or category belong to no pair (NaN != NaN)
+        if pair[0] == pair[0] and pair[1] == pair[1]:
+            groups.setdefault(pair, []).append(row)
+    values = [init_format[column].tolist() for column in columns]
+    for (country, category), rows in groups.items():
+        records = [dict(zip(columns, [column[i] for column in values])) for i in rows]
+        yield country, category, records
+
+
+def columnarFrame(webResults, fields, strip=(), categorical=()):
+    """
+    Build a DataFrame with one column per field of a list of records,
+    creating the frame in one step from a list per field.
+    =================================================================
+    Parameters:
+    -----------
+    webResults: list of dict.
+             Records holding every field.
+    fields: list of string.
+             Keys to read, in column order.
+    strip: list of string.
+             Text columns to strip of surrounding whitespace.
+    categorical: list of string.
+             Columns stored with the category dtype, which saves memory for
+             repeated strings such as country or category.
+
+    Example
+    -------
+    columnarFrame(webResults, ['id', 'title', 'country'], strip = ['country'], categorical = ['country'])
+    """
+    import pandas as pd
+    from operator import itemgetter
+
+    frame = pd.DataFrame(
+        {field: list(map(itemgetter(field), webResults)) for field in fields},
+        columns=fields,
+    )
+    for field in strip:
+        frame[field] = frame[field].str.strip()
+    for field in categorical:
+        frame[field] = frame[field].astype("category")
+    return frame
 
 
 def validate(date_string):
@@ -158,16 +211,190 @@ def stringOrListWithAppend(string_or_list_1, string_or_list_2):
     return quote(f",".join(comb))
 
 
+def raiseForStatus(error_code, error_body, reason=""):
+    """
+    Raise the SDK exception matching a non-2xx HTTP status code.
+    """
+    # Try to parse JSON error message from API
+    try:
+        error_json = json.loads(error_body)
+        error_message = error_json.get("message", error_body)
+    except:
+        error_message = error_body or str(reason)
+
+    # Handle authentication/authorization errors
+    if error_code == 401:
+        raise AuthenticationError(
+            f"Authentication failed (401 Unauthorized). "
+            f"Invalid API key or missing credentials. "
+            f"Please check your login credentials. Details: {error_message}"
+        )
+    elif error_code == 403:
+        raise AuthenticationError(
+            f"Access forbidden (403 Forbidden). "
+            f"Your API key may not have permission to access this resource. "
+            f"Details: {error_message}"
+        )
+    elif error_code == 404:
+        raise ParametersError(
+            f"Endpoint not found (404). "
+            f"The requested resource does not exist. "
+            f"Details: {error_message}"
+        )
+    elif 400 <= error_code < 500:
+        raise ParametersError(
+            f"Client error (HTTP {error_code}). "
+            f"Invalid request parameters. "
+            f"Details: {error_message}"
+        )
+    elif error_code >= 500:
+        raise WebRequestError(
+            f"Server error (HTTP {error_code}). "
+            f"Trading Economics API is experiencing issues. "
+            f"Please try again later. Details: {error_message}"
+        )
+    else:
+        raise WebRequestError(f"HTTP error {error_code}: {error_message}")
+
+
+class DeferredRequest(BaseException):
+    """
+    Raised by dataRequest and iterAll instead of sending requests while a
+    caller (the asyncio client) collects the URLs an endpoint function
+    builds. requests is a list of (url, headers) to fetch together.
+    Derives from BaseException so endpoint error handlers let it through.
+    """
+
+    def __init__(self, requests):
+        BaseException.__init__(self, requests[0][0])
+        self.requests = requests
+
+
+# Payloads (or the errors) already fetched by the caller, keyed by URL. While
+# set, dataRequest answers from it and raises DeferredRequest for other URLs.
+_prefetched = contextvars.ContextVar("tradingeconomics_prefetched", default=None)
+
+
+def outputTypeCheck(outputType):
+    if outputType not in (None, "raw", "dict", "df", "arrow", "polars"):
+        raise ParametersError("invalid output_type")
+
+
+def prepareRequest(api_request, client=None):
+    """
+    Return the absolute URL and the headers to send for an API path.
+    """
+    if client is None:
+        from .client import getClient
+
+        client = getClient()
+
+    # Normalize relative paths to full URLs
+    if not api_request.startswith(("http://", "https://")):
+        # Ensure path starts with / for proper concatenation
+        if not api_request.startswith("/"):
+            api_request = "/" + api_request
+        api_request = client.base_url + api_request
+
+    # Add authentication header if available
+    return api_request, client.headers()
+
+
+def parseResponse(response, output_type=None):
+    """
+    Check the status of a transport.Response and decode its JSON body.
+    """
+    code = response.getcode()
+    if not 200 <= code < 300:
+        # Handle HTTP errors with specific status codes
+        raiseForStatus(code, response.body.decode("utf-8", "replace"), response.reason)
+    return decodeBody(response.body, output_type)
+
+
+def decodeBody(body, output_type=None):
+    """
+    Decode a JSON response body, raising if it is invalid or empty.
+    Bodies requested as 'df' are decoded straight into a DataFrame
+    (decoder.loadsFrame), other ones into lists and dicts.
+    """
+    from . import decoder
+
+    try:
+        # Parse JSON response
+        if output_type == "df":
+            webResults = decoder.loadsFrame(body)
+        else:
+            webResults = decoder.loads(body)
+    except ValueError as e:
+        # Handle invalid JSON responses
+        raise WebRequestError(
+            f"Invalid JSON response from API. "
+            f"The server may be experiencing issues. Details: {str(e)}"
+        )
+
+    # Check if response contains data
+    if len(webResults) == 0:
+        raise NoDataError("No data available for the provided parameters.")
+    return webResults
+
+
+def formatResults(webResults, output_type, api_request=None):
+    """
+    Convert decoded JSON to the requested output format. DataFrames get
+    the dtypes of the schema registered for api_request (schema.py) when
+    schemas are enabled; Arrow tables and Polars frames always do.
+    """
+    from . import schema
+
+    if output_type == "df":
+        import pandas as pd
+
+        if not isinstance(webResults, pd.DataFrame):
+            webResults = pd.DataFrame(webResults)
+        if api_request is not None:
+            webResults = schema.applySchema(webResults, api_request)
+        return webResults
+    elif output_type == "arrow":
+        from . import arrow
+
+        return arrow.toTable(webResults, api_request)
+    elif output_type == "polars":
+        from . import arrow
+
+        return arrow.toPolars(webResults, api_request)
+    elif output_type == "raw":
+        return webResults
+    elif output_type == None or output_type == "dict":
+        return webResults
+    else:
+        raise ParametersError(
+            "output_type options : df(default) for data frame, arrow or polars for "
+            "Arrow-based frames or raw for unparsed results."
+        )
+
+
 def dataRequest(api_request, output_type):
     """
     Makes an HTTP request to the Trading Economics API and returns parsed data.
 
+    Requests are sent by the active client (client.py): te.login() and the
+    process-wide settings, unless a TradingEconomicsClient is active.
+    They go through a keep-alive connection pool (transport.py), so
+    consecutive calls reuse open connections. When the
+    response caches are enabled (cache.enableCache, cache.enableDiskCache)
+    fresh entries are served without a request and stale disk entries are
+    revalidated with a conditional request. Identical requests made at the
+    same time from several threads share one download (transport.inflight).
+    Requests wait for the rate limiter (ratelimit.py) and transient failures
+    are retried according to the active policy (retry.py).
+
     Parameters:
     -----------
     api_request : str
         Full API URL including endpoint and query parameters
     output_type : str or None
-        Output format: None/'dict' (list of dicts), 'df' (DataFrame), 'raw' (JSON)
+        Output format: None/'dict' (list of dicts), 'df' (DataFrame), 'raw' (JSON),
+        'arrow' (pyarrow.Table) or 'polars' (polars.DataFrame), see arrow.py
 
     Returns:
     --------
@@ -179,128 +406,370 @@ def dataRequest(api_request, output_type):
     ParametersError: Invalid output_type or no data returned
     WebRequestError: HTTP request failure or connection error
     """
-    from . import glob
+    from .client import getClient
 
-    if PY3:
-        from urllib.error import HTTPError, URLError
-    else:
-        from urllib2 import HTTPError, URLError  # type: ignore
+    outputTypeCheck(output_type)
 
-    def outputTypeCheck(outputType):
-        if outputType not in (None, "raw", "dict", "df"):
-            raise ParametersError("invalid output_type")
+    client = getClient()
+    api_request, headers = prepareRequest(api_request, client)
+
+    prefetched = _prefetched.get()
+    if prefetched is not None:
+        if api_request not in prefetched:
+            raise DeferredRequest([(api_request, headers)])
+        webResults = prefetched[api_request]
+        if isinstance(webResults, Exception):
+            raise webResults
+        return formatResults(webResults, output_type, api_request)
+
+    # Serve from the response cache when enabled
+    body = client.lookup(api_request)
+    if body is not None:
+        return formatResults(decodeBody(body, output_type), output_type, api_request)
+
+    # Concurrent identical requests wait for one download and decode its body
+    key = (api_request, headers.get("Authorization"))
+    (webResults, body), shared = client.inflight.do(
+        key, lambda: download(api_request, headers, client, output_type)
+    )
+    if shared:
+        webResults = decodeBody(body, output_type)
+    return formatResults(webResults, output_type, api_request)
 
-    outputTypeCheck(output_type)
 
-    # Normalize relative paths to full URLs
-    if not api_request.startswith(("http://", "https://")):
-        # Ensure path starts with / for proper concatenation
-        if not api_request.startswith("/"):
-            api_request = "/" + api_request
-        api_request = glob.API_BASE_URL + api_request
+def callerContext(generator):
+    """
+    Decorate a generator function so its body runs in the context of the
+    call that created the generator rather than of the code consuming it:
+    the active client, retry policy and aio.call state of
+    TradingEconomicsClient.call() still apply once the call has returned.
+    """
+    import functools
 
-    # Build HTTP request and add authentication header if available
-    request = Request(api_request)
-    if hasattr(glob, "apikey") and glob.apikey:
-        request.add_header("Authorization", glob.apikey)
+    @functools.wraps(generator)
+    def wrapper(*args, **kwargs):
+        return _runIn(contextvars.copy_context(), generator(*args, **kwargs))
 
+    return wrapper
+
+
+def _runIn(context, iterator):
     try:
-        # Execute HTTP request and parse JSON response
-        with urlopen(request) as response:
-            code = response.getcode()
-            webResults = json.loads(response.read().decode("utf-8"))
+        while True:
+            try:
+                item = context.run(next, iterator)
+            except StopIteration:
+                return
+            yield item
+    finally:
+        context.run(iterator.close)
 
-    except HTTPError as e:
-        # Handle HTTP errors with specific status codes
-        error_code = e.code
-        error_body = ""
 
+@callerContext
+def iterAll(api_requests, output_type, workers=None):
+    """
+    Request every URL of api_requests with dataRequest on a bounded pool of
+    worker threads and yield the results in the order of api_requests,
+    None for the ones without data.
+    =================================================================
+    At most workers requests are in flight and at most workers finished
+    results wait to be consumed, so results can be streamed from long
+    request lists. Requests run in a copy of the context iterAll was
+    called in, so the active client and retry policy apply to them even
+    when the results are consumed after the client call returned (see
+    callerContext). Under aio.call the
+    missing requests are deferred together to the asyncio pool: all the
+    rest of a list, or the next workers URLs of a lazy iterable.
+
+    Parameters:
+    -----------
+    api_requests: iterable of string.
+             URLs or API paths.
+    output_type: string.
+             Output type of every result, as for dataRequest.
+    workers: int.
+             Maximum concurrent requests. Defaults to glob.FANOUT_WORKERS.
+    """
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+    from . import glob
+
+    def fetch(api_request):
         try:
-            error_body = e.read().decode("utf-8")
-            # Try to parse JSON error message from API
+            return dataRequest(api_request, output_type)
+        except NoDataError:
+            return None
+
+    workers = workers or glob.FANOUT_WORKERS
+    prefetched = _prefetched.get()
+    if prefetched is not None:
+        yield from _iterPrefetched(api_requests, fetch, workers, prefetched)
+        return
+    if workers <= 1:
+        for api_request in api_requests:
+            yield fetch(api_request)
+        return
+
+    pool = ThreadPoolExecutor(workers)
+    pending = deque()
+    try:
+        for api_request in api_requests:
+            if len(pending) == workers:
+                yield pending.popleft().result()
+            context = contextvars.copy_context()
+            pending.append(pool.submit(context.run, fetch, api_request))
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        # Requests not started yet are dropped when the caller stops early
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True)
+
+
+def _iterPrefetched(api_requests, fetch, window, prefetched):
+    # Answers from the payloads fetched by aio.call; at the first missing
+    # URL it defers that one with the ones after it in a single round
+    from .client import getClient
+
+    client = getClient()
+    if isinstance(api_requests, (list, tuple)):
+        window = len(api_requests)
+    api_requests = iter(api_requests)
+    for api_request in api_requests:
+        url, headers = prepareRequest(api_request, client)
+        if url in prefetched:
+            yield fetch(api_request)
+            continue
+        missing = {url: headers}
+        for ahead in itertools.islice(api_requests, max(window - 1, 0)):
+            url, headers = prepareRequest(ahead, client)
+            if url not in prefetched:
+                missing.setdefault(url, headers)
+        raise DeferredRequest(list(missing.items()))
+
+
+def fetchAll(api_requests, output_type, workers=None):
+    """
+    Return the results of iterAll(api_requests, output_type, workers) as
+    a list in the order of api_requests.
+    """
+    return list(iterAll(api_requests, output_type, workers))
+
+
+def dropSeen(result, output_type, keys, seen):
+    """
+    Remove from result the records whose key values are in seen, and
+    repeated ones. Records missing all of the keys are kept. Returns the
+    remaining records and the set of their keys, so callers decide how long
+    keys are remembered.
+    =================================================================
+    Parameters:
+    -----------
+    result: list of dict, DataFrame, pyarrow.Table or polars.DataFrame.
+             Records of one request, as returned for output_type.
+    keys: list of string.
+             Fields identifying a record, e.g. ['Date', 'Symbol'].
+    seen: set.
+             Keys of records already returned.
+
+    Example
+    -------
+    window, seen = dropSeen(window, 'df', ['Date', 'Symbol'], seen)
+    """
+    current = set()
+    if result is None:
+        return None, current
+    if output_type in ("df", "arrow", "polars"):
+        names = result.column_names if output_type == "arrow" else result.columns
+        present = [k for k in keys if k in names]
+        if not present:
+            return result, current
+    columns = [recordValues(result, k, output_type) for k in keys]
+    keep = []
+    for key in zip(*columns):
+        if all(value is None for value in key):
+            # Records without the key fields cannot be told apart, keep them
+            keep.append(True)
+            continue
+        keep.append(key not in seen and key not in current)
+        current.add(key)
+    return keepRecords(result, output_type, keep), current
+
+
+def recordValues(result, key, output_type):
+    """
+    Return the values of field key of every record of result as a list,
+    None for records without it.
+    """
+    if output_type == "df":
+        return result[key].tolist() if key in result else [None] * len(result)
+    if output_type == "arrow":
+        names = result.column_names
+        return result[key].to_pylist() if key in names else [None] * len(result)
+    if output_type == "polars":
+        return result[key].to_list() if key in result.columns else [None] * len(result)
+    return [record.get(key) for record in result]
+
+
+def keepRecords(result, output_type, keep):
+    """Return the records of result whose flag in the list keep is true."""
+    if all(keep):
+        return result
+    if output_type == "df":
+        return result[keep].reset_index(drop=True)
+    if output_type == "polars":
+        import polars as pl
+
+        return result.filter(pl.Series(keep))
+    if output_type == "arrow":
+        import pyarrow as pa
+
+        return result.filter(pa.array(keep, pa.bool_()))
+    return [record for record, kept in zip(result, keep) if kept]
+
+
+def mergeResults(results, output_type):
+    """
+    Concatenate the results of several requests of one output_type in
+    order, skipping missing ones, and raise NoDataError when all are.
+    """
+    results = [r for r in results if r is not None]
+    if not results:
+        raise NoDataError("No data available for the provided parameters.")
+    if len(results) == 1:
+        return results[0]
+    if output_type == "df":
+        import pandas as pd
+
+        return pd.concat(results, ignore_index=True)
+    if output_type == "arrow":
+        import pyarrow as pa
+
+        return pa.concat_tables(results, promote_options="default")
+    if output_type == "polars":
+        import polars as pl
+
+        return pl.concat(results, how="diagonal_relaxed")
+    return [record for result in results for record in result]
+
+
+@callerContext
+def iterPages(pageRequest, output_type, prefetch=None, first=1):
+    """
+    Yield the results of consecutive pages of a paged endpoint, one page
+    at a time, until a page has no data or repeats the previous one. A
+    ParametersError (e.g. 404) for a page after the first also ends the
+    walk, as some endpoints answer pages past the end that way.
+    =================================================================
+    Pages are requested lazily through iterAll: with prefetch above 1 the
+    next prefetch pages are fetched concurrently while the current one is
+    consumed, and at most prefetch pages are held in memory. Up to
+    prefetch - 1 requests past the last page are wasted.
+
+    Parameters:
+    -----------
+    pageRequest: callable.
+             Returns the URL of a page number.
+    output_type: string.
+             Output type of every page, as for dataRequest.
+    prefetch: int.
+             Pages requested ahead. Defaults to glob.PAGE_PREFETCH.
+    first: int.
+             Number of the first page.
+
+    Example
+    -------
+    for page in iterPages(lambda n: '/comtrade/countries/%d' % n, 'df', prefetch = 4):
+        store(page)
+    """
+    from . import glob
+
+    pages = iterAll(
+        map(pageRequest, itertools.count(first)),
+        output_type,
+        prefetch or glob.PAGE_PREFETCH,
+    )
+    previous = None
+    try:
+        for number in itertools.count(first):
             try:
-                error_json = json.loads(error_body)
-                error_message = error_json.get("message", error_body)
-            except:
-                error_message = error_body
-        except:
-            error_message = str(e.reason)
-
-        # Handle authentication/authorization errors
-        if error_code == 401:
-            raise AuthenticationError(
-                f"Authentication failed (401 Unauthorized). "
-                f"Invalid API key or missing credentials. "
-                f"Please check your login credentials. Details: {error_message}"
-            )
-        elif error_code == 403:
-            raise AuthenticationError(
-                f"Access forbidden (403 Forbidden). "
-                f"Your API key may not have permission to access this resource. "
-                f"Details: {error_message}"
-            )
-        elif error_code == 404:
-            raise ParametersError(
-                f"Endpoint not found (404). "
-                f"The requested resource does not exist. "
-                f"Details: {error_message}"
-            )
-        elif 400 <= error_code < 500:
-            raise ParametersError(
-                f"Client error (HTTP {error_code}). "
-                f"Invalid request parameters. "
-                f"Details: {error_message}"
-            )
-        elif error_code >= 500:
-            raise WebRequestError(
-                f"Server error (HTTP {error_code}). "
-                f"Trading Economics API is experiencing issues. "
-                f"Please try again later. Details: {error_message}"
-            )
-        else:
-            raise WebRequestError(f"HTTP error {error_code}: {error_message}")
+                page = next(pages)
+            except StopIteration:
+                return
+            except ParametersError:
+                if number == first:
+                    raise
+                return
+            if page is None or _samePage(page, previous, output_type):
+                return
+            yield page
+            previous = page
+    finally:
+        pages.close()
+
+
+def _samePage(page, previous, output_type):
+    # Some endpoints answer pages past the end with the last one again
+    if previous is None:
+        return False
+    if output_type in ("df", "arrow", "polars"):
+        return page.equals(previous)
+    return page == previous
+
+
+def send(api_request, headers, client):
+    """
+    Send one GET request on the client's pool once its rate limiter
+    allows it, and let the limiter adapt to the response.
+    """
+    limiter = client.rate_limiter
+    if limiter is not None:
+        limiter.acquire()
+    response = client.pool.request(api_request, headers)
+    if limiter is not None:
+        limiter.observe(response.status, response.headers)
+    return response
+
+
+def download(api_request, headers, client, output_type=None):
+    """
+    Send api_request through the client's connection pool and return the
+    results decoded for output_type together with the raw body, storing it
+    in its caches.
+    """
+    # Revalidate a stale disk cache entry instead of downloading it again
+    conditional = client.validators(api_request)
+    policy = client.retryPolicy()
 
-    except URLError as e:
+    try:
+        # Execute HTTP request on a pooled connection, retrying transient failures
+        response = policy.call(
+            api_request, lambda: send(api_request, dict(headers, **conditional), client)
+        )
+        if response.getcode() == 304:
+            body = client.revalidated(api_request)
+            if body is not None:
+                return decodeBody(body, output_type), body
+            response = policy.call(api_request, lambda: send(api_request, headers, client))
+    except (OSError, EOFError, http.client.HTTPException) as e:
         # Handle network-level errors (DNS, connection timeout, etc.)
         raise WebRequestError(
             f"Network error: Unable to connect to Trading Economics API. "
-            f"Please check your internet connection. Details: {str(e.reason)}"
+            f"Please check your internet connection. Details: {str(e)}"
         )
+    except zlib.error as e:
+        # A gzip body cut short or corrupted on the way
+        raise WebRequestError(f"Invalid compressed response from API. Details: {str(e)}")
 
-    except json.JSONDecodeError as e:
-        # Handle invalid JSON responses
-        raise WebRequestError(
-            f"Invalid JSON response from API. "
-            f"The server may be experiencing issues. Details: {str(e)}"
-        )
-
-    except Exception as e:
-        # Catch-all for unexpected errors
-        raise WebRequestError(f"Unexpected error during API request: {str(e)}")
-
-    # Process successful response (code should be 200 or 2xx)
-    if 200 <= code < 300:
-        # Check if response contains data
-        if len(webResults) == 0:
-            raise ParametersError("No data available for the provided parameters.")
-
-        # Convert response to requested output format
-        if output_type == "df":
-            return pd.DataFrame(webResults)
-        elif output_type == "raw":
-            return webResults
-        elif output_type == None or output_type == "dict":
-            return webResults
-        else:
-            raise ParametersError(
-                "output_type options : df(default) for data frame or raw for unparsed results."
-            )
-    else:
-        # This should not happen as non-2xx codes trigger HTTPError
-        raise WebRequestError(f"Unexpected response code: {code}")
+    webResults = parseResponse(response, output_type)
+    client.store(api_request, response.body, response.headers)
+    return webResults, response.body
 
 
 def makeRequestAndParse(api_request, output_type):
+    import pandas as pd
+
     code = None
     webResults = None
     try:
@@ -7,6 +7,92 @@ API_BASE_URL = os.environ.get("TE_API_BASE_URL", "https://api.tradingeconomics.c
 # WebSocket stream URL - can be overridden via TE_STREAM_URL environment variable
 STREAM_URL = os.environ.get("TE_STREAM_URL", "wss://stream.tradingeconomics.com")
 
+# Worker threads calling the stream's on_message function - can be overridden via TE_STREAM_WORKERS
+STREAM_WORKERS = int(os.environ.get("TE_STREAM_WORKERS", "4"))
+
+# Stream messages waiting for a worker before the policy applies - can be overridden via TE_STREAM_QUEUE_SIZE
+STREAM_QUEUE_SIZE = int(os.environ.get("TE_STREAM_QUEUE_SIZE", "10000"))
+
+# What a full stream queue does with new messages: block, drop_oldest or coalesce - can be overridden
+# via TE_STREAM_POLICY
+STREAM_POLICY = os.environ.get("TE_STREAM_POLICY", "block")
+
+# Seconds between pings of stream.subscribe() connections (0 turns them off) - can be overridden via
+# TE_STREAM_HEARTBEAT
+STREAM_HEARTBEAT = float(os.environ.get("TE_STREAM_HEARTBEAT", "30"))
+
+# Stream messages per batch of stream.runBatches() - can be overridden via TE_STREAM_BATCH_SIZE
+STREAM_BATCH_SIZE = int(os.environ.get("TE_STREAM_BATCH_SIZE", "1000"))
+
+# Seconds a message waits in an incomplete batch of stream.runBatches() before it is handed over
+# anyway - can be overridden via TE_STREAM_BATCH_INTERVAL
+STREAM_BATCH_INTERVAL = float(os.environ.get("TE_STREAM_BATCH_INTERVAL", "0.1"))
+
+# Seconds since its last stream message for which livecache answers for a symbol - can be overridden
+# via TE_LIVE_MAX_AGE
+LIVE_MAX_AGE = float(os.environ.get("TE_LIVE_MAX_AGE", "60"))
+
+# Idle keep-alive connections kept per host - can be overridden via TE_POOL_SIZE environment variable
+POOL_SIZE = int(os.environ.get("TE_POOL_SIZE", "10"))
+
+# Socket timeout in seconds for API requests (None waits indefinitely) - can be overridden via TE_TIMEOUT
+TIMEOUT = float(os.environ["TE_TIMEOUT"]) if os.environ.get("TE_TIMEOUT") else None
+
+# TLS certificate verification: "1" checks against the system CA store, a file path against that CA
+# bundle, unset or "0" skips the check as earlier releases did - can be overridden via TE_VERIFY_SSL
+VERIFY_SSL = {"": False, "0": False, "false": False, "1": True, "true": True}.get(
+    os.environ.get("TE_VERIFY_SSL", "").lower(), os.environ.get("TE_VERIFY_SSL")
+)
+
+# Maximum in-flight requests of the asyncio client - can be overridden via TE_AIO_LIMIT environment variable
+AIO_LIMIT = int(os.environ.get("TE_AIO_LIMIT", "100"))
+
+# Concurrent requests of functions split into several API calls - can be overridden via TE_FANOUT_WORKERS
+FANOUT_WORKERS = int(os.environ.get("TE_FANOUT_WORKERS", "4"))
+
+# Longest request URL sent before a call is split into several - can be overridden via TE_MAX_URL_LENGTH
+MAX_URL_LENGTH = int(os.environ.get("TE_MAX_URL_LENGTH", "2000"))
+
+# Most rows expected from one getHistoricalData request before it is split - can be overridden via
+# TE_HISTORICAL_CHUNK_ROWS
+HISTORICAL_CHUNK_ROWS = int(os.environ.get("TE_HISTORICAL_CHUNK_ROWS", "100000"))
+
+# Bars per symbol requested at a time by getMarketsIntradayByInterval - can be overridden via
+# TE_INTRADAY_WINDOW_BARS
+INTRADAY_WINDOW_BARS = int(os.environ.get("TE_INTRADAY_WINDOW_BARS", "20000"))
+
+# Pages requested ahead by the iter* functions of paged endpoints - can be overridden via TE_PAGE_PREFETCH
+PAGE_PREFETCH = int(os.environ.get("TE_PAGE_PREFETCH", "1"))
+
+# Directory of the on-disk response cache - can be overridden via TE_CACHE_DIR environment variable
+CACHE_DIR = os.environ.get(
+    "TE_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "tradingeconomics")
+)
+
+# Requests per second allowed by the client-side rate limiter (off when unset) - can be overridden via TE_RATE_LIMIT
+RATE_LIMIT = float(os.environ["TE_RATE_LIMIT"]) if os.environ.get("TE_RATE_LIMIT") else None
+
+# File sharing the rate limiter budget between processes - can be overridden via TE_RATE_LIMIT_FILE
+RATE_LIMIT_FILE = os.environ.get("TE_RATE_LIMIT_FILE") or None
+
+# Attempts per request, including the first, for transient failures - can be overridden via TE_RETRY_ATTEMPTS
+RETRY_ATTEMPTS = int(os.environ.get("TE_RETRY_ATTEMPTS", "1"))
+
+# JSON decoder of responses: orjson, simdjson, ujson or json (auto picks the fastest installed)
+# - can be overridden via TE_JSON_DECODER environment variable
+JSON_DECODER = os.environ.get("TE_JSON_DECODER", "auto")
+
+# Bytes of an output_type='df' response decoded at a time into DataFrame columns (0 decodes it in
+# one go) - can be overridden via TE_JSON_FRAME_CHUNK environment variable
+JSON_FRAME_CHUNK = int(os.environ.get("TE_JSON_FRAME_CHUNK", str(4 << 20)))
+
+# Convert output_type='df' frames with the dtype schema of their endpoint (schema.py) - can be
+# enabled with TE_DF_SCHEMA=1
+DF_SCHEMA = os.environ.get("TE_DF_SCHEMA", "0").lower() in ("1", "true")
+
+# Store price and value columns of schema-converted frames as float32 - can be enabled with TE_DF_FLOAT32=1
+DF_FLOAT32 = os.environ.get("TE_DF_FLOAT32", "0").lower() in ("1", "true")
+
 apikey = None
 
 
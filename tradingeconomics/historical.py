@@ -1,10 +1,7 @@
 import json
-import itertools
 import urllib
-import pandas as pd
 import sys
 from datetime import datetime, date
-from dateutil.relativedelta import relativedelta
 from . import functions as fn
 from . import glob
 import ssl
@@ -14,10 +11,10 @@ PY3 = sys.version_info[0] == 3
 
 if PY3:  # Python 3+
     from urllib.request import urlopen  # type: ignore
-    from urllib.parse import quote  # type: ignore
+    from urllib.parse import quote, unquote  # type: ignore
 else:  # Python 2.X
     from urllib import urlopen  # type: ignore
-    from urllib import quote  # type: ignore
+    from urllib import quote, unquote  # type: ignore
 
 
 class ParametersError(ValueError):
@@ -41,63 +38,85 @@ class WebRequestError(ValueError):
 
 
 def parseData(data):
+    import pandas as pd
+
     indx = pd.DatetimeIndex(data["dates"])
     datafr = pd.DataFrame(data["values"])
     datafr = datafr.set_index(indx)
     return datafr
 
 
-def multiParams(webdata):
-    mycntry = list(set([d["Country"] for d in webdata]))
-    myind = list(set([d["Category"] for d in webdata]))
-    lst = [(d["Country"], d["Value"], d["DateTime"], d["Category"]) for d in webdata]
-    lst2 = [list(i) for i in lst]
-    countryDict = dict()
-    for i in range(len(mycntry)):
-        countryDict[mycntry[i]] = dict()
-        for m in range(len(myind)):
-            countryDict[mycntry[i]][myind[m]] = {"dates": list(), "values": list()}
-            for j in range(len(lst2)):
-                if lst2[j][0] == mycntry[i] and lst2[j][3] == myind[m]:
-                    countryDict[mycntry[i]][myind[m]]["dates"].append(lst2[j][2])
-                    countryDict[mycntry[i]][myind[m]]["values"].append(lst2[j][1])
-    finalDict = multiParsedData(countryDict)
+def multiParams(webdata, wide=False):
+    """
+    Group historical records by country and indicator.
+    =================================================================
+    Returns {country: {indicator: [values]}} where values holds one Series
+    of the indicator's values indexed by date, like
+    parseData(...).to_dict("Series").values(). Pairs without records hold
+    no Series. The records are grouped in a single pass and dates are
+    parsed once for the whole payload.
+
+    Parameters:
+    -----------
+    webdata: list of dict.
+             Records with Country, Category, DateTime and Value.
+    wide: bool.
+             Return one DataFrame indexed by date with (Country, Category)
+             MultiIndex columns instead.
+
+    Example
+    -------
+    multiParams(getHistoricalData(country = ['mexico', 'sweden'], indicator = ['gdp', 'population']))
+    multiParams(webdata, wide = True)['Mexico']
+    """
+    import pandas as pd
+
+    frame = pd.DataFrame.from_records(
+        webdata, columns=["Country", "Category", "DateTime", "Value"]
+    )
+    frame["DateTime"] = pd.to_datetime(frame["DateTime"])
+    if wide:
+        return (
+            frame.drop_duplicates(["DateTime", "Country", "Category"], keep="last")
+            .pivot(index="DateTime", columns=["Country", "Category"], values="Value")
+            .sort_index()
+        )
+
+    categories = frame["Category"].unique()
+    finalDict = {
+        country: {category: [{}.values()] for category in categories}
+        for country in frame["Country"].unique()
+    }
+    dates = frame["DateTime"].to_numpy()
+    # The values as sent, so each Series infers its own dtype like parseData
+    # does, not the dtype of the whole column
+    values = [record.get("Value") for record in webdata]
+    groups = frame.groupby(["Country", "Category"], sort=False, dropna=False).indices
+    for (country, category), rows in groups.items():
+        series = pd.Series(
+            [values[row] for row in rows], index=pd.DatetimeIndex(dates[rows]), name=0
+        )
+        finalDict[country][category] = [{0: series}.values()]
     return finalDict
 
 
 def multiParsedData(countryDict):
-    CNTRY = list(countryDict.keys())
-    INDCTR = list(countryDict[CNTRY[0]].keys())
-    answer = []
-    for i, j in itertools.product(range(len(CNTRY)), range(len(INDCTR))):
-        answer.append(
-            parseData(countryDict[CNTRY[i]][INDCTR[j]]).to_dict("Series").values()  # type: ignore
-        )
-    empty_dict2 = dict.fromkeys(CNTRY)
-    for i in range(len(CNTRY)):
-        empty_dict2[CNTRY[i]] = dict.fromkeys(INDCTR)
-    for i, j in itertools.product(range(len(CNTRY)), range(len(INDCTR))):
-        empty_dict2[CNTRY[i]][INDCTR[j]] = answer[:1]  # type: ignore
-        del answer[0]
-    return empty_dict2
+    """
+    Build {country: {indicator: [values]}} from {country: {indicator:
+    {"dates": [...], "values": [...]}}} using parseData for each pair.
+    """
+    return {
+        country: {
+            indicator: [parseData(data).to_dict("Series").values()]  # type: ignore
+            for indicator, data in indicators.items()
+        }
+        for country, indicators in countryDict.items()
+    }
 
 
 def out_type(init_format):
-    list_of_countries = init_format.Country.unique()
-    list_of_cat = init_format.Category.unique()
-    dict_start = {el: {elm: 0 for elm in list_of_cat} for el in list_of_countries}
-    for i, j in itertools.product(
-        range(len(list_of_countries)), range(len(list_of_cat))
-    ):
-        dict_cntry = init_format.loc[init_format["Country"] == list_of_countries[i]]
-        dict_cat = dict_cntry.loc[init_format["Category"] == list_of_cat[j]].to_dict(
-            "records"
-        )
-        dict_start[list_of_countries[i]][list_of_cat[j]] = dict_cat
-        for l in range(len(dict_cat)):
-            del dict_cat[l]["Country"]
-            del dict_cat[l]["Category"]
-    return dict_start
+    """Nest records by country and category, see functions.out_type."""
+    return fn.out_type(init_format)
 
 
 def paramCheck(country, indicator):
@@ -122,17 +141,14 @@ def checkCountryHistoricalRatings(country):
     return linkAPI
 
 
-def getRatingResults(webResults, rating):
-    names = ["country", "date", "agency", "rating", "outlook"]
-    names2 = ["Country", "Date", "Agency", "Rating", "Outlook"]
-    maindf = pd.DataFrame()
-    for i in range(len(names)):
-        names[i] = [d[names2[i]] for d in webResults]  # type: ignore
-        maindf = pd.concat(
-            [maindf, pd.DataFrame(names[i], columns=[names2[i]])], axis=1
-        )
-    maindf["Rating"] = maindf["Rating"].map(lambda x: x.strip())
-    return maindf
+def getRatingResults(webResults, rating, categorical=False):
+    fields = ["Country", "Date", "Agency", "Rating", "Outlook"]
+    return fn.columnarFrame(
+        webResults,
+        fields,
+        strip=["Rating"],
+        categorical=["Country", "Agency", "Rating", "Outlook"] if categorical else [],
+    )
 
 
 def checkRatings(linkAPI, rating):
@@ -167,23 +183,19 @@ def getHistoricalData(
     Notes
     -----
     Must choose a country and an indicator.
+    Long lists are split into several requests (see planHistorical) that
+    run concurrently on glob.FANOUT_WORKERS threads; their results are
+    merged in order.
     Example
     -------
     getHistoricalData(country = 'United States', indicator = 'Imports', initDate = '2011-01-01', endDate = '2016-01-01')
     getHistoricalData(country = ['United States', 'china'], indicator = ['Imports','Exports'], initDate = '2011-01-01', endDate = '2016-01-01')
     """
-    fn.setup_ssl_context()
-
-    if type(country) is str and type(indicator) is str:
-        linkAPI = (
-            "/historical/country/" + quote(country) + "/indicator/" + quote(indicator)
-        )
-    else:
-        linkAPI = paramCheck(country, indicator)
+    from dateutil.relativedelta import relativedelta
 
+    dates = []
     if initDate == None and endDate == None:
-        minDate = [(datetime.now() - relativedelta(years=15)).strftime("%Y-%m-%d")]
-        linkAPI = fn.finalLink(linkAPI, minDate)
+        dates = [(datetime.now() - relativedelta(years=15)).strftime("%Y-%m-%d")]
     if initDate == None and (endDate is not None):
         raise DateError("initDate value is missing")
     if (initDate is not None) and (endDate is not None):
@@ -203,7 +215,7 @@ def getHistoricalData(
             fn.validatePeriod(initDate, initDateFormat, endDate, endDateFormat)
         except ValueError:
             raise DateError("Invalid time period.")
-        linkAPI = fn.finalLink(linkAPI, [quote(initDate), quote(endDate)])
+        dates = [quote(initDate), quote(endDate)]
     if (initDate is not None) and endDate == None:
         try:
             fn.validate(initDate)
@@ -213,9 +225,99 @@ def getHistoricalData(
             )
             if initDate > str(date.today()):
                 raise DateError("Initial date out of range.")
-        linkAPI = fn.finalLink(linkAPI, [quote(initDate)])
+        dates = [quote(initDate)]
 
-    return fn.dataRequest(api_request=linkAPI, output_type=output_type)
+    if type(country) is str and type(indicator) is str:
+        linkAPI = (
+            "/historical/country/" + quote(country) + "/indicator/" + quote(indicator)
+        )
+        linkAPI = fn.finalLink(linkAPI, dates)
+        return fn.dataRequest(api_request=linkAPI, output_type=output_type)
+
+    plan = planHistorical(country, indicator, dates)
+    if len(plan) == 1:
+        linkAPI = fn.finalLink(paramCheck(country, indicator), dates)
+        return fn.dataRequest(api_request=linkAPI, output_type=output_type)
+
+    # Large requests are split into chunks fetched concurrently
+    links = [fn.finalLink(paramCheck(c, i), dates) for c, i in plan]
+    return fn.mergeResults(fn.fetchAll(links, output_type), output_type)
+
+
+def planHistorical(country, indicator, dates, max_url=None, max_rows=None):
+    """
+    Split a getHistoricalData request into (countries, indicators) chunks,
+    in order, so that every chunk's URL stays under max_url characters and
+    its expected rows under max_rows.
+    =================================================================
+    Rows are estimated as one per month of the requested period for every
+    country and indicator pair.
+
+    Parameters:
+    -----------
+    country: string or list.
+    indicator: string or list.
+    dates: list of string.
+             Quoted start and optional end date, as appended to the URL.
+    max_url: int.
+             Defaults to glob.MAX_URL_LENGTH.
+    max_rows: int.
+             Defaults to glob.HISTORICAL_CHUNK_ROWS.
+
+    Example
+    -------
+    planHistorical(['mexico', 'sweden'], ['gdp', 'inflation rate'], ['2015-01-01'])
+    """
+    countries = [country] if type(country) is str else list(country)
+    indicators = [indicator] if type(indicator) is str else list(indicator)
+    max_url = max_url or glob.MAX_URL_LENGTH
+    max_rows = max_rows or glob.HISTORICAL_CHUNK_ROWS
+
+    fixed = len(glob.API_BASE_URL) + len(fn.finalLink(paramCheck("", ""), dates))
+    budget = max(max_url - fixed, 1)
+    series_rows = _expectedRows(dates)
+
+    plan = []
+    for indicator_chunk in _pack(indicators, budget // 2):
+        limit = max(1, max_rows // (series_rows * len(indicator_chunk)))
+        country_budget = budget - _joinedLength(indicator_chunk)
+        for country_chunk in _pack(countries, country_budget, limit):
+            plan.append((country_chunk, indicator_chunk))
+    return plan
+
+
+def _joinedLength(names):
+    return len(quote(",".join(names), safe=""))
+
+
+def _pack(names, budget, limit=None):
+    # Greedy chunks of whole names whose joined, quoted length fits budget
+    chunks, chunk, length = [], [], 0
+    for name in names:
+        size = len(quote(name, safe="")) + (3 if chunk else 0)
+        if chunk and (length + size > budget or len(chunk) == limit):
+            chunks.append(chunk)
+            chunk, size, length = [], size - 3, 0
+        chunk.append(name)
+        length += size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _expectedRows(dates):
+    # Months between the start date and the end date or today
+    bounds = []
+    for value in dates:
+        value = unquote(value)
+        try:
+            bounds.append(datetime.strptime(value, fn.validate(value)))
+        except ValueError:
+            return 1
+    if not bounds:
+        return 1
+    end = bounds[1] if len(bounds) > 1 else datetime.now()
+    return max(1, (end - bounds[0]).days // 30)
 
 
 def getHistoricalRatings(
@@ -243,8 +345,6 @@ def getHistoricalRatings(
     getHistoricalRatings(country = 'United States', initDate ='2011-01-01', endDate = '2012-01-01')
 
     """
-    fn.setup_ssl_context()
-
     if country == None:
         linkAPI = "/ratings/historical/"
     else:
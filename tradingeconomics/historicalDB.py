@@ -1,10 +1,8 @@
 import json
 import itertools
 import urllib
-import pandas as pd
 import sys
 from datetime import datetime, date
-from dateutil.relativedelta import relativedelta
 from . import functions as fn
 from . import glob
 import ssl
@@ -67,9 +65,9 @@ def getHistorical(symbol=None, initDate=None, endDate=None, output_type=None, *a
     te.getHistorical("RACEDISPARITY005007:fred")
     te.getHistorical("PRTESP24031:comtrade")
     """
-    linkAPI = "/"
+    from dateutil.relativedelta import relativedelta
 
-    fn.setup_ssl_context()
+    linkAPI = "/"
 
     if symbol[-10:] == ":worldbank":  # type: ignore
         linkAPI += "worldBank/historical?" + "s=" + quote(symbol[:-10], safe=":")  # type: ignore
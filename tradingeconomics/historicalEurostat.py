@@ -1,10 +1,8 @@
 import json
 import itertools
 import urllib
-import pandas as pd
 import sys
 from datetime import datetime, date
-from dateutil.relativedelta import relativedelta
 from . import functions as fn
 from . import glob
 import ssl
@@ -76,8 +74,6 @@ def getHistoricalEurostat(ID=None, initDate=None, endDate=None, output_type=None
     getHistoricalEurostat(ID = '24804', initDate ='2015-01-01', endDate = '2020-01-01', output_type = 'df')
 
     """
-    fn.setup_ssl_context()
-
     if ID == None:
         raise ValueError("An ID needs to be supplied.")
 
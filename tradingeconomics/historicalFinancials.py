@@ -1,12 +1,10 @@
 import json
 import urllib
-import pandas as pd
 import sys
 from datetime import datetime, date
 from . import glob
 import ssl
 from . import functions as fn
-from dateutil.relativedelta import relativedelta
 
 PY3 = sys.version_info[0] == 3
 
@@ -65,8 +63,6 @@ def getFinancialsHistorical(
     getFinancialsHistorical(symbol=['aapl:us', 'tsla:us'], category=['assets', 'debt'], output_type='df')
 
     """
-    fn.setup_ssl_context()
-
     if symbol is not None and category is not None:
         if category.__contains__(" "):
             category = category.replace(" ", "-")
@@ -1,10 +1,8 @@
 import json
 import itertools
 import urllib
-import pandas as pd
 import sys
 from datetime import datetime, date
-from dateutil.relativedelta import relativedelta
 from . import functions as fn
 from . import glob
 import ssl
@@ -40,6 +38,8 @@ class WebRequestError(ValueError):
 
 
 def parseData(data):
+    import pandas as pd
+
     datafr = pd.DataFrame.from_dict(data)
     datafr["dates"] = pd.to_datetime(datafr["dates"], format="%d/%m/%Y")
     indx = datafr["dates"]
@@ -77,7 +77,7 @@ def fetchMarkets(symbol=None, initDate=None, endDate=None, output_type=None):
     fetchMarkets(symbol = 'indu:ind', initDate = '2017-01-01', endDate = '2017-06-15', output_type='raw')
     fetchMarkets(symbol = ['aapl:us', 'indu:ind'], initDate = '2017-01-01', endDate = '2017-06-15')
     """
-    fn.setup_ssl_context()
+    from dateutil.relativedelta import relativedelta
 
     linkAPI = "/markets/historical/"
 
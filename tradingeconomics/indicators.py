@@ -1,6 +1,5 @@
 import json
 import urllib
-import pandas as pd
 import sys
 from datetime import datetime, date
 
@@ -95,8 +94,6 @@ def getIndicatorData(country=None, indicators=None, calendar=None, output_type=N
     getIndicatorData(country = ['United States', 'Portugal'], indicators = ['Imports','Exports'])
     getIndicatorData(country = ['United States', 'Portugal'], indicators = ['Imports','Exports'], calendar = 1)
     """
-    fn.setup_ssl_context()
-
     if country is not None and indicators is not None:
         return "Error: You can not use both country and indicators parameters at the same time."
 
@@ -142,8 +139,6 @@ def getRatings(country=None, rating=None, output_type="df"):
     getRatings(country = 'United States', rating = None, output_type = 'df')
     getRatings(country = ['United States', 'Portugal'], rating = None, output_type = 'df')
     """
-    fn.setup_ssl_context()
-
     if country == None:
         linkAPI = "/ratings"
     else:
@@ -173,8 +168,6 @@ def getCreditRatingsUpdates(output_type=None):
         getCreditRatingsUpdates()
         getCreditRatingsUpdates(output_type='df')
     """
-    fn.setup_ssl_context()
-
     # Base endpoint for credit rating updates
     linkAPI = "/credit-ratings/updates"
 
@@ -444,8 +437,6 @@ def getAllCountries(output_type=None):
     getAllCountries()
     getAllCountries(output_type='df')
     """
-    fn.setup_ssl_context()
-
     linkAPI = "/country/"
 
     return fn.dataRequest(api_request=linkAPI, output_type=output_type)
@@ -468,8 +459,6 @@ def getIndicatorChanges(start_date=None, output_type=None):
     getIndicatorChanges()
     getIndicatorChanges(start_date='2024-10-01', output_type='df')
     """
-    fn.setup_ssl_context()
-
     linkAPI = "/changes"
 
     if start_date:
@@ -43,8 +43,6 @@ def getIpo(
     getIpo()
 
     """
-    fn.setup_ssl_context()
-
     linkAPI = "/ipo"
 
     if ticker and country:
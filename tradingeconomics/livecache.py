@@ -0,0 +1,249 @@
+"""
+Last value of every symbol received over the stream.
+
+    from tradingeconomics import livecache
+    livecache.enableLiveCache(prefer_live = True, max_age = 30)
+
+    te.subscribe(['EURUSD:CUR', 'AAPL:US'])
+    te.run(on_message)                    # or stream.subscribe() in asyncio
+
+    livecache.getLiveCache().get('AAPL:US')['Last']
+    livecache.getLiveCache().snapshot('df')
+
+While the cache is on, every market message of the stream updates the
+record of its symbol, stored under the field names of the markets
+endpoints ('price' becomes 'Last', 'dt' becomes 'Date', ...).
+
+With prefer_live, getMarketsBySymbol and getMarketsData answer from the
+cache without a request when every symbol they would return is subscribed
+with te.subscribe(), was returned by an earlier request and got a stream
+message in the last max_age seconds. getMarketsData learns its symbols
+from its first request. The records these calls return are merged in too,
+so a snapshot also has the fields the stream does not send, such as Name.
+Without prefer_live they make their usual requests and leave the cache
+alone.
+"""
+
+import datetime as dt
+import threading
+import time
+
+from . import decoder
+from . import glob
+
+
+# Stream message fields and the markets endpoint fields they update.
+STREAM_FIELDS = {
+    "s": "Symbol",
+    "i": "Ticker",
+    "price": "Last",
+    "nch": "DailyChange",
+    "pch": "DailyPercentualChange",
+    "prev": "yesterday",
+    "state": "State",
+    "type": "Type",
+}
+
+_LIVE = tuple(STREAM_FIELDS.values()) + ("Date",)
+
+
+def marketRecord(message):
+    """Return a stream message with the field names of the markets endpoints."""
+    record = {STREAM_FIELDS[k]: v for k, v in message.items() if k in STREAM_FIELDS}
+    stamp = message.get("dt")
+    if isinstance(stamp, (int, float)):
+        record["Date"] = (
+            dt.datetime.fromtimestamp(stamp / 1000.0, dt.timezone.utc)
+            .replace(tzinfo=None)
+            .isoformat()
+        )
+    return record
+
+
+class LastValueCache(object):
+    """
+    Thread-safe last record per symbol, fed by the stream.
+    =================================================================
+    Parameters:
+    -----------
+    prefer_live: bool.
+             Let getMarketsBySymbol and getMarketsData answer from the cache.
+    max_age: float.
+             Seconds since the last stream message for which a symbol is
+             fresh. Defaults to glob.LIVE_MAX_AGE.
+
+    Example
+    -------
+    cache = LastValueCache()
+    cache.update({'s': 'AAPL:US', 'price': 185.2, 'dt': 1700000000000})
+    cache.get('aapl:us')
+    """
+
+    def __init__(self, prefer_live=False, max_age=None):
+        self.prefer_live = prefer_live
+        self.max_age = glob.LIVE_MAX_AGE if max_age is None else max_age
+        self.updates = 0
+        self.hits = 0
+        self._records = {}
+        self._updated = {}
+        self._seeded = set()
+        self._universes = {}
+        self._lock = threading.Lock()
+
+    def onMessage(self, ws, message):
+        """on_message function for stream.run(): updates from one JSON message."""
+        try:
+            decoded = decoder.loads(message)
+        except (ValueError, TypeError):
+            return
+        if isinstance(decoded, dict):
+            self.update(decoded)
+
+    def update(self, message):
+        """Merge a decoded stream message into the record of its symbol."""
+        symbol = message.get("s")
+        if not isinstance(symbol, str):
+            return
+        key = symbol.upper()
+        fields = marketRecord(message)
+        now = time.monotonic()
+        with self._lock:
+            record = dict(self._records.get(key, ()))
+            record.update(fields)
+            self._records[key] = record
+            self._updated[key] = now
+            self.updates += 1
+
+    def seed(self, records, path=None):
+        """
+        Merge records of the markets endpoints, without making them fresh,
+        and remember the symbols of path for prefer_live lookups.
+        """
+        symbols = []
+        with self._lock:
+            for record in records:
+                symbol = record.get("Symbol") if isinstance(record, dict) else None
+                if not isinstance(symbol, str):
+                    continue
+                key = symbol.upper()
+                merged = dict(record)
+                if key in self._updated:
+                    # Stream values are newer than the response
+                    current = self._records[key]
+                    merged.update((f, current[f]) for f in _LIVE if f in current)
+                self._records[key] = merged
+                self._seeded.add(key)
+                symbols.append(key)
+            if path is not None:
+                self._universes[path] = symbols
+
+    def get(self, symbol, default=None):
+        """Return a copy of the record of a symbol, or default."""
+        record = self._records.get(symbol.upper())
+        return default if record is None else dict(record)
+
+    def age(self, symbol):
+        """Seconds since the last stream message of a symbol, or None."""
+        updated = self._updated.get(symbol.upper())
+        return None if updated is None else time.monotonic() - updated
+
+    def fresh(self, symbols, max_age=None):
+        """
+        Return copies of the records of symbols when each of them was seeded
+        and got a stream message in the last max_age seconds, else None.
+        Records never seeded lack the fields the stream does not send.
+        """
+        max_age = self.max_age if max_age is None else max_age
+        oldest = time.monotonic() - max_age
+        with self._lock:
+            records = []
+            for symbol in symbols:
+                key = symbol.upper()
+                if key not in self._seeded:
+                    return None
+                if self._updated.get(key, oldest - 1) < oldest:
+                    return None
+                records.append(dict(self._records[key]))
+        return records
+
+    def live(self, symbols=None, path=None):
+        """
+        Return fresh records for a prefer_live request for symbols, or for
+        the symbols last returned by path, when all of them are subscribed
+        with te.subscribe(); None means the request has to be made.
+        """
+        if not self.prefer_live:
+            return None
+        if symbols is None:
+            symbols = self._universes.get(path)
+        if not symbols:
+            return None
+        subscribed = {ev.upper() for ev in glob._event}
+        if any(symbol.upper() not in subscribed for symbol in symbols):
+            return None
+        records = self.fresh(symbols)
+        if records is not None:
+            self.hits += 1
+        return records
+
+    def symbols(self):
+        """Return the symbols with a record."""
+        return list(self._records)
+
+    def snapshot(self, output_type=None):
+        """
+        Return a copy of all records: a list of dicts, or a DataFrame indexed
+        by Symbol with output_type='df'.
+        """
+        with self._lock:
+            records = list(self._records.values())
+        if output_type == "df":
+            import pandas as pd
+
+            return pd.DataFrame(records).set_index("Symbol") if records else pd.DataFrame()
+        return [dict(record) for record in records]
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+            self._updated.clear()
+            self._seeded.clear()
+            self._universes.clear()
+
+    def __len__(self):
+        return len(self._records)
+
+    def __contains__(self, symbol):
+        return symbol.upper() in self._records
+
+
+_cache = None
+
+
+def enableLiveCache(prefer_live=False, max_age=None):
+    """
+    Start keeping the last value of every streamed symbol and return the
+    LastValueCache.
+    =================================================================
+    Parameters:
+    -----------
+    See LastValueCache.
+
+    Example
+    -------
+    enableLiveCache()
+    enableLiveCache(prefer_live = True, max_age = 30)
+    """
+    global _cache
+    _cache = LastValueCache(prefer_live, max_age)
+    return _cache
+
+
+def disableLiveCache():
+    global _cache
+    _cache = None
+
+
+def getLiveCache():
+    """Return the active LastValueCache, or None when it is off."""
+    return _cache
@@ -1,12 +1,12 @@
 import json
 import urllib
-import pandas as pd
 import sys
 from datetime import datetime, date
 from . import glob
 import ssl
 from . import functions as fn
-from dateutil.relativedelta import relativedelta
+from . import livecache
+from .client import getClient
 
 PY3 = sys.version_info[0] == 3
 
@@ -52,6 +52,24 @@ def checkCategory(linkAPI, category):
     return linkAPI
 
 
+def liveRequest(linkAPI, output_type, symbols=None):
+    """
+    Make a markets request, answered from the stream's last values instead
+    when livecache is on with prefer_live and every symbol, or every symbol
+    of the previous answer to linkAPI, is subscribed and fresh.
+    """
+    cache = livecache.getLiveCache()
+    if cache is None or not cache.prefer_live:
+        return fn.dataRequest(linkAPI, output_type)
+    fn.outputTypeCheck(output_type)
+    records = cache.live(symbols, linkAPI)
+    if records is None:
+        records = fn.dataRequest(linkAPI, "raw")
+        if isinstance(records, list):
+            cache.seed(records, linkAPI)
+    return fn.formatResults(records, output_type, linkAPI)
+
+
 def getMarketsData(marketsField, type=None, output_type=None):
     """
     Returns a list of available commodities, currencies, indexes or
@@ -73,8 +91,6 @@ def getMarketsData(marketsField, type=None, output_type=None):
     -------
     getMarketsData(marketsField = 'index')
     """
-    fn.setup_ssl_context()
-
     fields = ["commodities", "currency", "index", "bond", "crypto"]
     if marketsField not in fields:
         raise ParametersError(
@@ -91,7 +107,7 @@ def getMarketsData(marketsField, type=None, output_type=None):
     if type is not None:
         linkAPI += "?type=" + quote(type, safe="")
 
-    return fn.dataRequest(linkAPI, output_type)
+    return liveRequest(linkAPI, output_type)
 
 
 def getCurrencyCross(cross, output_type=None):
@@ -111,8 +127,6 @@ def getCurrencyCross(cross, output_type=None):
     getCurrencyCross(cross = 'EUR')
     getCurrencyCross(cross = 'EUR', output_type='df')
     """
-    fn.setup_ssl_context()
-
     if cross is not None:
         linkAPI = "/markets/currency?cross=" + quote(cross, safe="")
     else:
@@ -139,14 +153,14 @@ def getMarketsBySymbol(symbols, output_type=None):
     getMarketsBySymbol(symbols = 'indu:ind')
     getMarketsBySymbol(symbols = ['aapl:us', 'indu:ind'], output_type = 'raw')
     """
-    fn.setup_ssl_context()
-
     if type(symbols) is not str:
         linkAPI = "/markets/symbol/" + quote(",".join(symbols), safe="")
     else:
         linkAPI = "/markets/symbol/" + quote(symbols, safe="")
 
-    return fn.dataRequest(linkAPI, output_type)
+    if type(symbols) is str:
+        symbols = symbols.split(",")
+    return liveRequest(linkAPI, output_type, list(symbols))
 
 
 def getMarketsIntraday(symbols, initDate=None, endDate=None, output_type=None):
@@ -171,8 +185,6 @@ def getMarketsIntraday(symbols, initDate=None, endDate=None, output_type=None):
     getMarketsIntraday(symbols = 'indu:ind', initDate='2018-03-13 15:30')
     getMarketsIntraday(symbols = ['aapl:us', 'indu:ind'], initDate='2022-01-01', endDate='2022-12-31', output_type = 'raw')
     """
-    fn.setup_ssl_context()
-
     if type(symbols) is not str:
         linkAPI = "/markets/intraday/" + quote(",".join(symbols), safe="")
     else:
@@ -201,8 +213,6 @@ def getMarketsPeers(symbols, output_type=None):
     getMarketsPeers(symbols = 'indu:ind')
     getMarketsPeers(symbols = ['aapl:us', 'indu:ind'], output_type = 'raw')
     """
-    fn.setup_ssl_context()
-
     if type(symbols) is not str:
         linkAPI = "/markets/peers/" + quote(",".join(symbols), safe="")
     else:
@@ -229,8 +239,6 @@ def getMarketsComponents(symbols, output_type=None):
     getMarketsComponents(symbols = 'psi20:ind')
     getMarketsComponents(symbols = ['psi20:ind', 'indu:ind'], output_type = 'raw')
     """
-    fn.setup_ssl_context()
-
     if type(symbols) is not str:
         linkAPI = "/markets/components/" + quote(",".join(symbols), safe="")
     else:
@@ -239,7 +247,19 @@ def getMarketsComponents(symbols, output_type=None):
     return fn.dataRequest(linkAPI, output_type)
 
 
-def getMarketsSearch(country=None, category=None, page=None, output_type=None):
+def searchLink(country, category=None):
+    if type(country) is not str:
+        linkAPI = "/markets/search/" + quote(",".join(country), safe="")  # type: ignore
+    else:
+        linkAPI = "/markets/search/" + quote(country, safe="")  # type: ignore
+    if (category) is not None:
+        linkAPI = checkCategory(linkAPI, category)
+    return linkAPI
+
+
+def getMarketsSearch(
+    country=None, category=None, page=None, output_type=None, all_pages=False
+):
     """
     Search for country, category and page number.
     ==========================================================
@@ -251,28 +271,46 @@ def getMarketsSearch(country=None, category=None, page=None, output_type=None):
     output_type: string.
              'dict'(default), 'df' for data frame,
              'raw' for list of unparsed data.
+    all_pages: bool.
+             Fetch every page and return them merged; page is ignored.
     Example
     -------
     getMarketsSearch(country = 'japan', category = None, page = None, output_type = None)
     getMarketsSearch(country = 'japan', category = 'index', page = None, output_type = None)
     getMarketsSearch(country = 'japan', category = ['index', 'markets'], page = None, output_type = None)
     getMarketsSearch(country = 'japan', category = 'index', page = None, output_type = None)
+    getMarketsSearch(country = 'japan', output_type = 'df', all_pages = True)
     """
 
-    fn.setup_ssl_context()
-
-    if type(country) is not str:
-        linkAPI = "/markets/search/" + quote(",".join(country), safe="")  # type: ignore
-    else:
-        linkAPI = "/markets/search/" + quote(country, safe="")  # type: ignore
-    if (category) is not None:
-        linkAPI = checkCategory(linkAPI, category)
+    if all_pages:
+        return fn.mergeResults(
+            iterMarketsSearch(country, category, output_type), output_type
+        )
+    linkAPI = searchLink(country, category)
     if (page) is not None:
         linkAPI = checkPage(linkAPI, page)
 
     return fn.dataRequest(linkAPI, output_type)
 
 
+def iterMarketsSearch(country=None, category=None, output_type=None, prefetch=None):
+    """
+    Iterate over the pages of getMarketsSearch, one result per page.
+    ==========================================================
+    Parameters:
+    -----------
+    prefetch: int.
+             Pages fetched concurrently ahead of the one being read.
+             Defaults to TE_PAGE_PREFETCH (1).
+    Example
+    -------
+    for page in iterMarketsSearch(country = 'japan', output_type = 'df', prefetch = 4):
+        store(page)
+    """
+    linkAPI = searchLink(country, category)
+    return fn.iterPages(lambda page: checkPage(linkAPI, page), output_type, prefetch)
+
+
 def getMarketsForecasts(category=None, symbol=None, output_type=None):
     """
     Returns a stock market forecast information for specific symbols and categories.
@@ -295,8 +333,6 @@ def getMarketsForecasts(category=None, symbol=None, output_type=None):
     getMarketsForecasts(symbol = ['psi20:ind', 'indu:ind'], output_type = 'df')
     getMarketsForecasts(symbol =  'indu:ind', output_type = 'df')
     """
-    fn.setup_ssl_context()
-
     if type(symbol) is list:
         linkAPI = "/markets/forecasts" + "/symbol/" + quote(",".join(symbol), safe="")
 
@@ -309,7 +345,22 @@ def getMarketsForecasts(category=None, symbol=None, output_type=None):
     return fn.dataRequest(linkAPI, output_type)
 
 
-def getMarketsIntradayByInterval(symbol, interval, initDate, endDate, output_type=None):
+# Minutes per bar of the intervals of getMarketsIntradayByInterval.
+INTERVAL_MINUTES = {
+    "1m": 1,
+    "5m": 5,
+    "10m": 10,
+    "15m": 15,
+    "30m": 30,
+    "1h": 60,
+    "2h": 120,
+    "4h": 240,
+}
+
+
+def getMarketsIntradayByInterval(
+    symbol, interval, initDate, endDate, output_type=None, stream=False
+):
     """
     Returns Aggregate intraday prices by interval - allowed intervals: 1m, 5m, 10m, 15m, 30m, 1h, 2h, 4h.
     =================================================================================
@@ -328,14 +379,22 @@ def getMarketsIntradayByInterval(symbol, interval, initDate, endDate, output_typ
         output_type: string.
              'dict'(default) for dictionary format output, 'df' for data frame,
              'raw' for list of dictionaries directly from the web.
+        stream: bool.
+             Return an iterator over the results of each date window, in
+             order, instead of one merged result.
     Notes
     -----
-
+    Long periods are split into date windows of about
+    glob.INTRADAY_WINDOW_BARS bars (see intradayWindows) that are fetched
+    concurrently on glob.FANOUT_WORKERS threads. Bars repeated at window
+    edges are dropped by date and symbol.
 
     Example
     -------
             getMarketsIntradayByInterval(symbol='CL1:COM',interval='1m',initDate='2022-01-01',endDate='2023-12-01',output_type='df')
             getMarketsIntradayByInterval(symbol=['CL1:COM','AAPL:US'],interval='1m',initDate='2022-01-01',endDate='2022-12-01',output_type='df')
+            for frame in getMarketsIntradayByInterval(symbol='AAPL:US',interval='1m',initDate='2023-01-01',endDate='2024-01-01',output_type='df',stream=True):
+                print(frame.tail(1))
     """
 
     # d is a dictionary used for create the api url
@@ -345,9 +404,10 @@ def getMarketsIntradayByInterval(symbol, interval, initDate, endDate, output_typ
         "interval": f"?agr={fn.stringOrList(interval)}",
         "init_date": "",
         "end_date": "",
-        "key": f"&client={glob.apikey}",
+        "key": f"&client={getClient().apikey}",
         "output_type": "",
     }
+    windows = [(initDate, endDate)]
     if initDate and endDate:
 
         initDateFormat = fn.validate(initDate)
@@ -355,19 +415,72 @@ def getMarketsIntradayByInterval(symbol, interval, initDate, endDate, output_typ
         fn.validatePeriod(initDate, initDateFormat, endDate, endDateFormat)
         # #it will parse endDate when initDate and endData are the same.
         # endDate = (lambda x, y : f"{endDate[0:8]}{(int(endDate[8:])+1)}" if x==y else endDate)(initDate,endDate)
-        d["init_date"] = f"&d1={quote(initDate)}"
-        d["end_date"] = f"&d2={quote(endDate)}"
+        symbols = 1 if type(symbol) is str else len(symbol)
+        windows = intradayWindows(initDate, endDate, interval, symbols)
+
+    links = []
+    for init, end in windows:
+        if init and end:
+            d["init_date"] = f"&d1={quote(init)}"
+            d["end_date"] = f"&d2={quote(end)}"
+        links.append(
+            "%s%s%s%s%s%s"
+            % (
+                d["url_base"],
+                d["symbol"],
+                d["interval"],
+                d["init_date"],
+                d["end_date"],
+                d["key"],
+            )
+        )
 
-    api_url_request = "%s%s%s%s%s%s" % (
-        d["url_base"],
-        d["symbol"],
-        d["interval"],
-        d["init_date"],
-        d["end_date"],
-        d["key"],
-    )
+    if len(links) == 1 and not stream:
+        return fn.dataRequest(links[0], output_type)
+    results = _dropRepeatedBars(fn.iterAll(links, output_type), output_type)
+    if stream:
+        return results
+    return fn.mergeResults(list(results), output_type)
 
-    return fn.dataRequest(api_url_request, output_type)
+
+def intradayWindows(initDate, endDate, interval, symbols=1, bars=None):
+    """
+    Split [initDate, endDate] into consecutive windows of whole days
+    holding about bars bars of interval for all symbols. Each window ends
+    where the next one starts, and dates keep the format of initDate.
+    =================================================================
+    Example
+    -------
+    intradayWindows('2024-01-01', '2024-03-01', '1m')
+    # [('2024-01-01', '2024-01-07'), ('2024-01-07', '2024-01-13'), ...]
+    """
+    from datetime import timedelta
+
+    bars = bars or glob.INTRADAY_WINDOW_BARS
+    minutes = INTERVAL_MINUTES.get(str(interval).lower())
+    if minutes is None:
+        return [(initDate, endDate)]
+    days = max(1, bars * minutes // (24 * 60 * symbols))
+    initFormat, endFormat = fn.validate(initDate), fn.validate(endDate)
+    start = datetime.strptime(initDate, initFormat)
+    end = datetime.strptime(endDate, endFormat)
+    windows = []
+    while True:
+        stop = start + timedelta(days=days)
+        if stop >= end:
+            windows.append((start.strftime(initFormat), endDate))
+            return windows
+        windows.append((start.strftime(initFormat), stop.strftime(initFormat)))
+        start = stop
+
+
+def _dropRepeatedBars(results, output_type):
+    # Windows share their edges, so each is compared with the previous one
+    seen = set()
+    for result in results:
+        if result is not None:
+            result, seen = fn.dropSeen(result, output_type, ["Date", "Symbol"], seen)
+            yield result
 
 
 def getMarketsStockDescriptions(symbol=None, country=None, output_type=None):
@@ -525,8 +638,7 @@ def getStocksByCountry(country=None, output_type=None):
             getStocksByCountry(country = ['United States', 'Portugal'],output_type='df')
 
     """
-
-    fn.setup_ssl_context()
+    import pandas as pd
 
     if country == None:
         return "A country is required!"
@@ -605,8 +717,6 @@ def getMarketsDiscontinued(output_type=None):
     getMarketsDiscontinued()
     getMarketsDiscontinued(output_type='df')
     """
-    fn.setup_ssl_context()
-
     linkAPI = "/markets/discontinued"
 
     return fn.dataRequest(linkAPI, output_type)
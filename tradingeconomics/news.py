@@ -1,10 +1,8 @@
 import json
 import itertools
 import urllib
-import pandas as pd
 import sys
 import datetime
-from dateutil.relativedelta import relativedelta
 from . import functions as fn
 from . import glob
 import ssl
@@ -83,35 +81,14 @@ def getNewsLink(country, indicator):
     return linkAPI
 
 
-def getNewsResults(webResults, country):
-    names = [
-        "id",
-        "title",
-        "date",
-        "description",
-        "country",
-        "category",
-        "symbol",
-        "url",
-    ]
-    names2 = [
-        "id",
-        "title",
-        "date",
-        "description",
-        "country",
-        "category",
-        "symbol",
-        "url",
-    ]
-    maindf = pd.DataFrame()
-    for i in range(len(names)):
-        col_data = [d[names2[i]] for d in webResults]
-        maindf = pd.concat(
-            [maindf, pd.DataFrame(col_data, columns=[names2[i]])], axis=1
-        )
-    if "country" in maindf:
-        maindf["country"] = maindf["country"].map(lambda x: x.strip())
+def getNewsResults(webResults, country, categorical=False):
+    fields = ["id", "title", "date", "description", "country", "category", "symbol", "url"]
+    return fn.columnarFrame(
+        webResults,
+        fields,
+        strip=["country"],
+        categorical=["country", "category", "symbol"] if categorical else [],
+    )
 
 
 def checkArticleLink(country, indicator):
@@ -156,19 +133,8 @@ def checkArticleLimit(linkAPI, lim):
     return linkAPI
 
 
-def getArticleResults(webResults, id):
-    names = [
-        "id",
-        "title",
-        "date",
-        "description",
-        "content",
-        "country",
-        "category",
-        "symbol",
-        "url",
-    ]
-    names2 = [
+def getArticleResults(webResults, id, categorical=False):
+    fields = [
         "id",
         "title",
         "date",
@@ -179,14 +145,12 @@ def getArticleResults(webResults, id):
         "symbol",
         "url",
     ]
-    maindf = pd.DataFrame()
-    for i in range(len(names)):
-        col_data = [d[names2[i]] for d in webResults]
-        maindf = pd.concat(
-            [maindf, pd.DataFrame(col_data, columns=[names2[i]])], axis=1
-        )
-    if "category" in maindf:
-        maindf["category"] = maindf["category"].map(lambda x: x.strip())
+    return fn.columnarFrame(
+        webResults,
+        fields,
+        strip=["category"],
+        categorical=["country", "category", "symbol"] if categorical else [],
+    )
 
 
 def checkArticleId(id):
@@ -198,6 +162,217 @@ def checkArticleId(id):
     return linkAPI
 
 
+def articlePath(country=None, indicator=None):
+    if country != None and indicator != None:
+        return checkArticleLink(country, indicator)
+    elif country != None and indicator == None:
+        return checkArticleCountry(country)
+    elif country == None and indicator != None:
+        return checkArticleIndic(indicator)
+    return "/articles/"
+
+
+def newsPath(country=None, indicator=None):
+    linkAPI = "/news"
+    if country:
+        linkAPI += f"/country/{fn.stringOrList(country)}"
+        if indicator:
+            linkAPI += f"/{fn.stringOrList(indicator)}"
+    elif indicator:
+        linkAPI += f"/indicator/{fn.stringOrList(indicator)}"
+    return linkAPI
+
+
+def _asDatetime(value):
+    # Record dates and watermarks compared as naive UTC datetimes
+    if value is None:
+        return None
+    if not isinstance(value, datetime.datetime):
+        if isinstance(value, datetime.date):
+            value = datetime.datetime.combine(value, datetime.time())
+        else:
+            try:
+                value = datetime.datetime.fromisoformat(str(value).strip().rstrip("Z"))
+            except ValueError:
+                return None
+    if value.tzinfo is not None:
+        value = value.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _reached(date, id, since, since_id):
+    if since_id is not None and id is not None:
+        try:
+            if int(id) <= int(since_id):
+                return True
+        except (TypeError, ValueError):
+            if str(id) == str(since_id):
+                return True
+    if since is not None:
+        date = _asDatetime(date)
+        if date is not None and date < since:
+            return True
+    return False
+
+
+@fn.callerContext
+def iterWindows(windowRequest, limit, output_type, since=None, since_id=None, prefetch=None):
+    """
+    Yield the records of consecutive start/limit windows of a newest-first
+    endpoint until a watermark is reached.
+    =================================================================================
+    Records already returned by an earlier window, which happens when new
+    items are published while walking, are dropped by id. The first record
+    older than since, or with an id not above since_id, ends the walk.
+
+    Parameters:
+    -----------
+    windowRequest: callable.
+             Returns the URL of the window starting at a record index.
+    limit: int.
+             Records per window.
+    output_type: string.
+             Output type of every window, as for dataRequest.
+    since: string, date or datetime.
+             Oldest date returned.
+    since_id: int or string.
+             Last id already processed; ids grow with time.
+    prefetch: int.
+             Windows fetched concurrently ahead of the one being read.
+             Defaults to TE_PAGE_PREFETCH (1).
+    """
+    since = _asDatetime(since)
+    seen = set()
+    windows = fn.iterPages(
+        lambda number: windowRequest(number * limit), output_type, prefetch, first=0
+    )
+    try:
+        for window in windows:
+            last = len(window) < limit
+            window, current = fn.dropSeen(window, output_type, ["id"], seen)
+            seen |= current
+            keep = [
+                not _reached(date, id, since, since_id)
+                for date, id in zip(
+                    fn.recordValues(window, "date", output_type),
+                    fn.recordValues(window, "id", output_type),
+                )
+            ]
+            window = fn.keepRecords(window, output_type, keep)
+            if len(window):
+                yield window
+            if last or not all(keep):
+                return
+    finally:
+        windows.close()
+
+
+def iterNews(
+    country=None,
+    indicator=None,
+    since=None,
+    since_id=None,
+    limit=100,
+    output_type=None,
+    prefetch=None,
+):
+    """
+    Iterate over the news, newest first, one start/limit window at a time,
+    down to a date or id watermark.
+    =================================================================================
+
+    Parameters:
+    -----------
+    country: string or list.
+             As for getNews.
+    indicator: string or list.
+             As for getNews.
+    since: string, date or datetime.
+             Oldest date returned, for example '2024-01-02' or
+             '2024-01-02T08:00:00'.
+    since_id: int or string.
+             Id of the newest item of the previous run; only newer items
+             are returned.
+    limit: int.
+             News per request.
+    output_type: string.
+             'dict'(default) for dictionary format output, 'df' for data frame,
+             'raw' for list of dictionaries directly from the web.
+    prefetch: int.
+             Windows fetched concurrently ahead of the one being read.
+             Defaults to TE_PAGE_PREFETCH (1).
+
+    Notes
+    -----
+    Without a watermark every window is read. Items are de-duplicated by id.
+
+    Example
+    -------
+    for news in iterNews(since_id = last_id, prefetch = 2):
+        store(news)
+
+    iterNews(country = 'mexico', since = '2024-01-01', output_type = 'df')
+    """
+    path = newsPath(country, indicator)
+
+    return iterWindows(
+        lambda start: f"{path}?limit={limit}&start={start}",
+        limit,
+        output_type,
+        since,
+        since_id,
+        prefetch,
+    )
+
+
+def iterArticles(
+    country=None,
+    indicator=None,
+    since=None,
+    since_id=None,
+    lim=100,
+    output_type=None,
+    prefetch=None,
+):
+    """
+    Iterate over the articles, newest first, one start/lim window at a
+    time, down to a date or id watermark.
+    =================================================================================
+
+    Parameters:
+    -----------
+    country: string or list.
+             As for getArticles.
+    indicator: string or list.
+             As for getArticles.
+    since: string, date or datetime.
+             Oldest date returned.
+    since_id: int or string.
+             Id of the newest article of the previous run; only newer
+             articles are returned.
+    lim: int.
+             Articles per request.
+    prefetch: int.
+             Windows fetched concurrently ahead of the one being read.
+             Defaults to TE_PAGE_PREFETCH (1).
+
+    Example
+    -------
+    for articles in iterArticles(country = 'united states', since = '2024-01-01', output_type = 'df'):
+        store(articles)
+    """
+    path = checkArticleLimit(articlePath(country, indicator), lim)
+
+    return iterWindows(
+        lambda start: checkIndex(path, start),
+        lim,
+        output_type,
+        since,
+        since_id,
+        prefetch,
+    )
+
+
 def getArticles(
     country=None,
     indicator=None,
@@ -253,16 +428,9 @@ def getArticles(
 
     """
 
-    fn.setup_ssl_context()
+    from dateutil.relativedelta import relativedelta
 
-    if country != None and indicator != None:
-        linkAPI = checkArticleLink(country, indicator)
-    elif country != None and indicator == None:
-        linkAPI = checkArticleCountry(country)
-    elif country == None and indicator != None:
-        linkAPI = checkArticleIndic(indicator)
-    else:
-        linkAPI = "/articles/"
+    linkAPI = articlePath(country, indicator)
 
     if (initDate != None) and (endDate != None):
         try:
@@ -329,7 +497,6 @@ def getArticleId(id=None, output_type=None):
 
     """
     linkAPI = ""
-    fn.setup_ssl_context()
     if type(id) != None:
         linkAPI = checkArticleId(id)
 
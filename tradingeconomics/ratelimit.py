@@ -0,0 +1,254 @@
+"""
+Client-side rate limiting of API requests.
+
+    from tradingeconomics import ratelimit
+    ratelimit.enableRateLimit(rate = 1)                 # one request per second
+    ratelimit.enableRateLimit(rate = 5, burst = 10,     # shared by every process
+                              path = '/tmp/te-rate')    # using the same file
+
+A token bucket refills at `rate` tokens per second up to `burst` tokens and
+every request sent over the network takes one; cache hits and coalesced calls
+take none. Callers are given consecutive slots, so a bulk job runs at exactly
+the configured rate from any number of threads. When `path` is given the
+bucket state lives in that file under an exclusive lock, so several processes
+share one budget. Rate-limit headers and 429 responses from the API make the
+bucket back off until the server's window resets.
+"""
+
+import os
+import struct
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from . import glob
+
+
+# Header names checked for the remaining budget and the seconds to the reset
+# of the server's window, with and without the X- prefix.
+REMAINING_HEADERS = ("X-RateLimit-Remaining", "RateLimit-Remaining")
+RESET_HEADERS = ("X-RateLimit-Reset", "RateLimit-Reset")
+
+_STATE = struct.Struct("<dd")
+
+
+class TokenBucket(object):
+    """
+    Thread-safe token bucket, optionally shared across processes.
+    =================================================================
+    Parameters:
+    -----------
+    rate: float.
+             Tokens added per second, i.e. the sustained request rate.
+    burst: float.
+             Maximum number of tokens, i.e. requests that may be sent back
+             to back after an idle period. Defaults to max(1, rate).
+    path: string.
+             File holding the shared bucket state. Processes using the same
+             file share one budget. Defaults to a per-process bucket.
+
+    Example
+    -------
+    bucket = TokenBucket(rate = 2, burst = 4)
+    bucket.acquire()
+    """
+
+    def __init__(self, rate, burst=None, path=None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(max(1, rate) if burst is None else burst)
+        self.path = path
+        # Processes can only agree on the wall clock
+        self._clock = time.monotonic if path is None else time.time
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._stamp = self._clock()
+        self.acquired = 0
+        self.waited = 0.0
+        self.throttled = 0
+        if path is not None and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    @contextmanager
+    def _locked(self):
+        with self._lock:
+            if self.path is None:
+                yield
+                return
+            with open(self.path, "a+b") as f:
+                _lockFile(f)
+                try:
+                    f.seek(0)
+                    data = f.read(_STATE.size)
+                    if len(data) == _STATE.size:
+                        self._tokens, self._stamp = _STATE.unpack(data)
+                    yield
+                    f.seek(0)
+                    f.truncate()
+                    f.write(_STATE.pack(self._tokens, self._stamp))
+                    f.flush()
+                finally:
+                    _unlockFile(f)
+
+    def _refill(self):
+        now = self._clock()
+        elapsed = now - self._stamp
+        if elapsed > 0:
+            self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+            self._stamp = now
+
+    def reserve(self, tokens=1):
+        """
+        Take tokens and return the seconds to wait before using them.
+        The bucket may go into debt, which queues later callers behind.
+        """
+        with self._locked():
+            self._refill()
+            self._tokens -= tokens
+            delay = max(0.0, -self._tokens / self.rate)
+            self.acquired += 1
+            self.waited += delay
+        return delay
+
+    def acquire(self, tokens=1):
+        """Block until tokens are available."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    def pause(self, seconds):
+        """Hold back every request not yet reserved for the next seconds."""
+        with self._locked():
+            self._refill()
+            self._tokens = min(self._tokens, 0.0) - seconds * self.rate
+
+    def observe(self, status, headers):
+        """
+        Adapt to a response: honour Retry-After on 429 and 503, and never
+        spend more than the remaining budget announced by the server.
+        """
+        retry_after = retryAfter(headers)
+        if status == 429:
+            with self._locked():
+                self.throttled += 1
+            self.pause(retry_after if retry_after is not None else 1 / self.rate)
+            return
+        if status == 503 and retry_after is not None:
+            self.pause(retry_after)
+            return
+
+        remaining = _number(headers, REMAINING_HEADERS)
+        if remaining is None:
+            return
+        reset = _number(headers, RESET_HEADERS)
+        if remaining <= 0 and reset is not None:
+            # Some servers send the reset as a Unix timestamp
+            if reset > 1e9:
+                reset -= time.time()
+            self.pause(max(0.0, reset))
+            return
+        with self._locked():
+            self._refill()
+            self._tokens = min(self._tokens, remaining)
+
+    def stats(self):
+        """Return request and wait counters of this process."""
+        with self._lock:
+            return {
+                "acquired": self.acquired,
+                "waited": self.waited,
+                "throttled": self.throttled,
+            }
+
+
+def _lockFile(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def _unlockFile(f):
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _number(headers, names):
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            try:
+                return float(value)
+            except ValueError:
+                return None
+    return None
+
+
+def retryAfter(headers):
+    """Return the Retry-After header in seconds, or None."""
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+_limiter = None
+if glob.RATE_LIMIT:
+    _limiter = TokenBucket(glob.RATE_LIMIT, path=glob.RATE_LIMIT_FILE)
+
+
+def enableRateLimit(rate=1, burst=None, path=None):
+    """
+    Turn on the process-wide rate limiter and return it.
+    =================================================================
+    Parameters:
+    -----------
+    See TokenBucket.
+
+    Example
+    -------
+    enableRateLimit(rate = 1)
+    enableRateLimit(rate = 10, burst = 20, path = '/tmp/te-rate')
+    """
+    global _limiter
+    _limiter = TokenBucket(rate, burst, path)
+    return _limiter
+
+
+def disableRateLimit():
+    global _limiter
+    _limiter = None
+
+
+def getRateLimiter():
+    """Return the active TokenBucket, or None when rate limiting is off."""
+    return _limiter
+
+
+def _resetAfterFork():
+    # A lock held by another thread at fork time would never be released
+    if _limiter is not None:
+        _limiter._lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_resetAfterFork)
@@ -0,0 +1,252 @@
+"""
+Retries of failed API requests.
+
+    from tradingeconomics import retry
+    retry.setRetryPolicy(retry.RetryPolicy(max_attempts = 5))
+
+    with retry.retrying(retry.RetryPolicy(max_attempts = 10, backoff_cap = 120)):
+        te.getHistoricalData(country = 'mexico', indicator = 'gdp')
+
+A request is sent again when the connection fails or the API answers with
+one of the retryable statuses, after a random delay between zero and an
+exponentially growing bound ("full jitter"), or after the Retry-After time
+the server asked for. Every attempt is timed so the wall time spent on
+retries can be inspected with policy.stats() and policy.history.
+"""
+
+import contextvars
+import http.client
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+from . import glob
+from .ratelimit import retryAfter
+
+
+# Statuses worth sending again: throttling and transient server errors.
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+# Errors raised by the transport when a connection fails.
+NETWORK_ERRORS = (OSError, EOFError, TimeoutError, http.client.HTTPException)
+
+
+class Attempt(object):
+    """
+    One attempt at a request.
+    =================================================================
+    url: the request URL. number: 1 for the first attempt.
+    status: HTTP status, or None when the connection failed (see error).
+    elapsed: seconds spent on the attempt.
+    delay: seconds waited before the next attempt, 0 for the last one.
+    """
+
+    __slots__ = ("url", "number", "status", "error", "elapsed", "delay")
+
+    def __init__(self, url, number, status, error, elapsed, delay):
+        self.url = url
+        self.number = number
+        self.status = status
+        self.error = error
+        self.elapsed = elapsed
+        self.delay = delay
+
+    def __repr__(self):
+        outcome = self.status if self.error is None else type(self.error).__name__
+        return "Attempt(%s #%d: %s in %.3fs, then wait %.3fs)" % (
+            self.url, self.number, outcome, self.elapsed, self.delay,
+        )
+
+
+class RetryPolicy(object):
+    """
+    When and how long to wait before sending a failed request again.
+    =================================================================
+    Parameters:
+    -----------
+    max_attempts: int.
+             Attempts per request including the first one. 1 never retries.
+    backoff_base: float.
+             Upper bound in seconds of the delay before the second attempt,
+             doubled for every further attempt.
+    backoff_cap: float.
+             Maximum upper bound in seconds of the backoff delay.
+    retry_statuses: set of int.
+             HTTP statuses that are retried. Defaults to RETRY_STATUSES.
+    retry_network_errors: bool.
+             Retry when the connection fails or times out.
+    max_retry_after: float.
+             Longest Retry-After in seconds that is waited for; a longer
+             one fails the request straight away.
+    history: int.
+             Number of recent attempts kept in policy.history.
+
+    Example
+    -------
+    RetryPolicy(max_attempts = 5, backoff_base = 1, backoff_cap = 60)
+    RetryPolicy(retry_statuses = {502, 503, 504}, retry_network_errors = False)
+    """
+
+    def __init__(
+        self,
+        max_attempts=3,
+        backoff_base=0.5,
+        backoff_cap=30.0,
+        retry_statuses=RETRY_STATUSES,
+        retry_network_errors=True,
+        max_retry_after=300.0,
+        history=1000,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_network_errors = retry_network_errors
+        self.max_retry_after = max_retry_after
+        self.history = deque(maxlen=history)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.attempts = 0
+        self.retries = 0
+        self.retry_time = 0.0
+
+    def backoff(self, number):
+        """Return a full-jitter delay before attempt number + 1."""
+        bound = min(self.backoff_cap, self.backoff_base * 2 ** (number - 1))
+        return random.uniform(0, bound)
+
+    def nextDelay(self, number, response=None, error=None):
+        """
+        Return the seconds to wait before sending the request again after
+        attempt number ended with response or error, or None to give up.
+        """
+        if number >= self.max_attempts:
+            return None
+        if error is not None:
+            return self.backoff(number) if self.retry_network_errors else None
+        if response.status not in self.retry_statuses:
+            return None
+        wait = retryAfter(response.headers)
+        if wait is None:
+            return self.backoff(number)
+        return wait if wait <= self.max_retry_after else None
+
+    def _record(self, url, number, started, response, error, delay):
+        elapsed = time.monotonic() - started
+        status = None if response is None else response.status
+        attempt = Attempt(url, number, status, error, elapsed, delay or 0.0)
+        with self._lock:
+            self.history.append(attempt)
+            self.attempts += 1
+            if number == 1:
+                self.requests += 1
+            if delay is not None:
+                self.retries += 1
+                self.retry_time += elapsed + delay
+
+    def call(self, url, send):
+        """
+        Call send() until it returns a response that is not retried, and
+        return it. The last network error is raised when attempts run out.
+        """
+        number = 0
+        while True:
+            number += 1
+            started = time.monotonic()
+            response = error = None
+            try:
+                response = send()
+            except NETWORK_ERRORS as e:
+                error = e
+            delay = self.nextDelay(number, response, error)
+            self._record(url, number, started, response, error, delay)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response
+            time.sleep(delay)
+
+    async def callAsync(self, url, send):
+        """Awaitable call(): send is a coroutine function."""
+        import asyncio
+
+        network_errors = NETWORK_ERRORS + (asyncio.TimeoutError,)
+        number = 0
+        while True:
+            number += 1
+            started = time.monotonic()
+            response = error = None
+            try:
+                response = await send()
+            except network_errors as e:
+                error = e
+            delay = self.nextDelay(number, response, error)
+            self._record(url, number, started, response, error, delay)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response
+            await asyncio.sleep(delay)
+
+    def stats(self):
+        """
+        Return counters of requests, attempts and retries, and retry_time:
+        the wall time spent on failed attempts and waiting between them.
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "retry_time": self.retry_time,
+            }
+
+
+_policy = RetryPolicy(max_attempts=glob.RETRY_ATTEMPTS)
+_override = contextvars.ContextVar("tradingeconomics_retry_policy", default=None)
+
+
+def setRetryPolicy(policy):
+    """
+    Set the policy used by every request; None turns retries off.
+    =================================================================
+    Example
+    -------
+    setRetryPolicy(RetryPolicy(max_attempts = 5))
+    """
+    global _policy
+    _policy = RetryPolicy(max_attempts=1) if policy is None else policy
+
+
+def getRetryPolicy(default=None):
+    """
+    Return the policy applying to the current call: the one set by
+    retrying(), else default, else the process-wide policy.
+    """
+    policy = _override.get()
+    if policy is not None:
+        return policy
+    return _policy if default is None else default
+
+
+@contextmanager
+def retrying(policy):
+    """
+    Use policy for the requests made inside the with block, in this
+    thread or asyncio task only.
+    =================================================================
+    Example
+    -------
+    with retrying(RetryPolicy(max_attempts = 10)) as policy:
+        te.getHistoricalData(country = 'mexico', indicator = 'gdp')
+    policy.stats()
+    """
+    token = _override.set(policy)
+    try:
+        yield policy
+    finally:
+        _override.reset(token)
@@ -0,0 +1,193 @@
+"""
+Typed, compact DataFrames for output_type='df'.
+
+    from tradingeconomics import schema
+    schema.enableSchemas(float32 = True)
+
+    te.fetchMarkets(symbol = 'aapl:us', initDate = '2020-01-01', output_type = 'df')
+
+A DataFrame built from JSON keeps dates as strings and every repeated
+country, category or symbol as its own Python string. With schemas enabled
+the frames returned by dataRequest are converted after decoding, following
+the schema registered for the endpoint path: date columns are parsed with
+their known format in one vectorized call, low-cardinality string columns
+become categoricals and, with float32 on, price and value columns are
+stored in single precision.
+
+Schemas are off by default because they change column dtypes. They can be
+turned on with the TE_DF_SCHEMA and TE_DF_FLOAT32 environment variables.
+"""
+
+from urllib.parse import urlsplit
+
+from . import glob
+
+
+# Format of the ISO 8601 timestamps most endpoints return.
+ISO = "ISO8601"
+
+
+class Schema(object):
+    """
+    Column dtypes of the frames of one endpoint.
+    =================================================================
+    Parameters:
+    -----------
+    datetimes: dict.
+             Column name to the format passed to pd.to_datetime.
+    categories: list of string.
+             Low-cardinality string columns stored as categoricals.
+    floats: list of string.
+             Numeric columns stored as float32 when float32 is on.
+
+    Example
+    -------
+    Schema(datetimes = {'Date': '%d/%m/%Y'}, categories = ['Symbol'], floats = ['Close'])
+    """
+
+    def __init__(self, datetimes=None, categories=(), floats=()):
+        self.datetimes = dict(datetimes or {})
+        self.categories = tuple(categories)
+        self.floats = tuple(floats)
+
+    def __repr__(self):
+        return "Schema(datetimes=%r, categories=%r, floats=%r)" % (
+            self.datetimes, self.categories, self.floats,
+        )
+
+    def apply(self, frame, float32=False):
+        """Convert the columns of frame in place and return it."""
+        import pandas as pd
+
+        for column, fmt in self.datetimes.items():
+            if column in frame and frame[column].dtype.kind not in "Mm":
+                try:
+                    frame[column] = pd.to_datetime(frame[column], format=fmt)
+                except (ValueError, TypeError):
+                    # Values in an unexpected format are left untouched
+                    pass
+        for column in self.categories:
+            if column in frame and _isText(frame[column].dtype):
+                frame[column] = frame[column].astype("category")
+        if float32:
+            for column in self.floats:
+                if column in frame and frame[column].dtype == "float64":
+                    frame[column] = frame[column].astype("float32")
+        return frame
+
+
+def _isText(dtype):
+    import pandas as pd
+
+    return dtype == object or isinstance(dtype, pd.StringDtype)
+
+
+_PRICES = ("Open", "High", "Low", "Close")
+
+# Schemas by endpoint path prefix; the longest matching prefix applies.
+_registry = {
+    "/historical": Schema(
+        datetimes={"DateTime": ISO, "LastUpdate": ISO},
+        categories=("Country", "Category", "Frequency", "HistoricalDataSymbol"),
+        floats=("Value",),
+    ),
+    "/markets/historical": Schema(
+        datetimes={"Date": "%d/%m/%Y"}, categories=("Symbol",), floats=_PRICES
+    ),
+    "/markets/intraday": Schema(
+        datetimes={"Date": ISO}, categories=("Symbol",), floats=_PRICES
+    ),
+    "/calendar": Schema(
+        datetimes={"Date": ISO, "ReferenceDate": ISO, "LastUpdate": ISO},
+        categories=(
+            "Country", "Category", "Event", "Reference", "Source",
+            "Currency", "Unit", "Ticker", "Symbol",
+        ),
+    ),
+    "/forecast": Schema(
+        datetimes={"LatestValueDate": ISO},
+        categories=("Country", "Category", "Frequency", "HistoricalDataSymbol"),
+    ),
+    "/news": Schema(
+        datetimes={"date": ISO}, categories=("country", "category", "symbol")
+    ),
+    "/articles": Schema(
+        datetimes={"date": ISO}, categories=("country", "category", "symbol")
+    ),
+    "/ratings/historical": Schema(
+        datetimes={"Date": ISO}, categories=("Country", "Agency", "Rating", "Outlook")
+    ),
+    "/fred/historical": Schema(
+        datetimes={"Date": ISO}, categories=("Symbol",), floats=("Value",)
+    ),
+    "/worldBank/historical": Schema(
+        datetimes={"Date": ISO}, categories=("Symbol",), floats=("Value",)
+    ),
+    "/financials/historical": Schema(
+        datetimes={"Date": ISO}, categories=("Symbol",), floats=("Value",)
+    ),
+    "/comtrade/historical": Schema(
+        datetimes={"date": ISO}, categories=("symbol",), floats=("value",)
+    ),
+}
+
+_enabled = glob.DF_SCHEMA
+_float32 = glob.DF_FLOAT32
+
+
+def register(path, schema):
+    """
+    Register the schema of the endpoints under path, replacing any
+    previous one. None removes it.
+    =================================================================
+    Example
+    -------
+    register('/markets/intraday', Schema(datetimes = {'Date': ISO}, categories = ['Symbol']))
+    """
+    path = "/" + path.strip("/")
+    if schema is None:
+        _registry.pop(path, None)
+    else:
+        _registry[path] = schema
+
+
+def getSchema(url):
+    """Return the schema registered for the path of url, or None."""
+    path = urlsplit(url).path.rstrip("/")
+    while path:
+        schema = _registry.get(path)
+        if schema is not None:
+            return schema
+        path = path.rpartition("/")[0]
+    return None
+
+
+def enableSchemas(float32=False):
+    """
+    Apply the registered schemas to every output_type='df' frame.
+    =================================================================
+    Parameters:
+    -----------
+    float32: bool.
+             Also store price and value columns as float32.
+    """
+    global _enabled, _float32
+    _enabled = True
+    _float32 = float32
+
+
+def disableSchemas():
+    """Return frames with the dtypes inferred by pandas again."""
+    global _enabled, _float32
+    _enabled = False
+    _float32 = False
+
+
+def applySchema(frame, url):
+    """Convert frame with the schema of url when schemas are enabled."""
+    if not _enabled:
+        return frame
+    schema = getSchema(url)
+    if schema is None:
+        return frame
+    return schema.apply(frame, _float32)
@@ -1,12 +1,10 @@
 import json
 import urllib
-import pandas as pd
 import sys
 from datetime import datetime, date
 from . import glob
 import ssl
 from . import functions as fn
-from dateutil.relativedelta import relativedelta
 import time
 
 PY3 = sys.version_info[0] == 3
@@ -45,8 +45,6 @@ def getStockSplits(
 
     """
 
-    fn.setup_ssl_context()
-
     linkAPI = "/splits"
 
     if ticker and fn.stringOrList(ticker):
@@ -2,19 +2,39 @@ import websocket
 import ssl
 
 import json
+import random
+import time
+from collections import deque
 from pprint import pprint
 from time import sleep
 import datetime as dt
 import threading
 from . import glob
+from . import livecache
+from .aiostream import StreamError, Subscription, subscribe
+from .batching import TickBatcher, columnarBatch
+from .dispatch import Dispatcher, decodeMessage
 
 
 te_url = glob.STREAM_URL
 
 
+# Longest wait in seconds between reconnection attempts, and the bound of
+# the first one; the bound doubles with every failed attempt.
 reconnect_timeout = 60
+reconnect_base = 0.5
 function_to_restart = ["", ""]
 
+# Recent outages of the stream, oldest first.
+gaps = deque(maxlen=1000)
+
+_socket = [None]
+_stopped = threading.Event()
+
+_dispatch = {}
+_dispatcher = None
+_dispatch_lock = threading.Lock()
+
 
 def on_error(ws, error):
     print(error)
@@ -28,44 +48,275 @@ def on_open(ws):
 
 
 def build_url():
-    return te_url + "?client=" + glob.apikey + "&app=python&token=20171116"
+    from .client import getClient
+
+    return te_url + "?client=" + getClient().apikey + "&app=python&token=20171116"
+
+
+def configureDispatch(workers=None, queue_size=None, policy=None):
+    """
+    Set how run() hands messages to its on_message function: on workers
+    threads, with at most queue_size messages waiting, and what a full
+    queue does with new ones (see dispatch.py).
+    =================================================================
+    Parameters:
+    -----------
+    workers: int.
+             Worker threads. Defaults to TE_STREAM_WORKERS (4).
+    queue_size: int.
+             Messages waiting for a worker. Defaults to TE_STREAM_QUEUE_SIZE (10000).
+    policy: string.
+             'block', 'drop_oldest' or 'coalesce'. Defaults to TE_STREAM_POLICY ('block').
+
+    Example
+    -------
+    configureDispatch(workers = 8, policy = 'coalesce')
+    """
+    global _dispatcher
+    with _dispatch_lock:
+        _dispatch.update(workers=workers, queue_size=queue_size, policy=policy)
+        old = _dispatcher
+        # A running stream moves to a new dispatcher before the old one
+        # delivers what is waiting and stops
+        if old is None or old.closed:
+            _dispatcher = None
+        else:
+            _dispatcher = Dispatcher(old.callback, **_dispatch)
+    if old is not None:
+        old.close()
+
+
+def getDispatcher():
+    """Return the dispatcher of the running stream, whose stats() show queue depths."""
+    return _dispatcher
+
+
+def dispatcherFor(on_message_client):
+    # One dispatcher per callback, kept across reconnects; looked up for
+    # every message so one swapped in by configureDispatch() takes over
+    global _dispatcher
+    dispatcher = _dispatcher
+    if dispatcher is not None and not dispatcher.closed and dispatcher.callback is on_message_client:
+        return dispatcher
+    with _dispatch_lock:
+        old = _dispatcher
+        if old is None or old.closed or old.callback is not on_message_client:
+            _dispatcher = Dispatcher(on_message_client, **_dispatch)
+        else:
+            old = None
+        dispatcher = _dispatcher
+    if old is not None:
+        old.close(wait=False)
+    return dispatcher
+
+
+def _closeDispatcher(on_message_client):
+    # Deliver what is waiting and stop the workers once run() returns
+    dispatcher = _dispatcher
+    if dispatcher is not None and dispatcher.callback is on_message_client:
+        dispatcher.close()
+
+
+class Gap(object):
+    """
+    An outage of the stream.
+    =================================================================
+    start: UTC datetime of the last message received before the
+    connection was lost, or of the loss when none was.
+    end: UTC datetime the connection was open again.
+    attempts: connections tried to end the outage.
+    """
+
+    __slots__ = ("start", "end", "attempts")
+
+    def __init__(self, start, end, attempts):
+        self.start = start
+        self.end = end
+        self.attempts = attempts
+
+    @property
+    def duration(self):
+        """Seconds without data."""
+        return (self.end - self.start).total_seconds()
+
+    def windows(self, seconds=60):
+        """
+        Return the number of windows of seconds, aligned on the epoch,
+        that the outage overlaps: the bars to backfill at that interval.
+        """
+        first = int(self.start.timestamp() // seconds)
+        last = int(self.end.timestamp() // seconds)
+        return last - first + 1
 
+    def __repr__(self):
+        return "Gap(%s to %s, %.1fs, %d attempts)" % (
+            self.start.isoformat(), self.end.isoformat(), self.duration, self.attempts,
+        )
+
+
+def reconnectDelay(attempt):
+    """
+    Return a random delay before reconnection attempt number attempt,
+    between zero and reconnect_base doubled per earlier attempt, capped at
+    reconnect_timeout ("full jitter").
+    """
+    bound = min(reconnect_timeout, reconnect_base * 2 ** (attempt - 1))
+    return random.uniform(0, bound)
+
+
+def _now():
+    return dt.datetime.now(dt.timezone.utc)
+
+
+def stop():
+    """Close the stream started by run() and return from run()."""
+    _stopped.set()
+    ws = _socket[0]
+    if ws is not None:
+        ws.close()
+
+
+def start_socket(on_message_client, *args, on_gap=None):
+    """
+    Connect to the stream and call on_message_client for every message,
+    reconnecting in a loop until stop() is called. After an outage the
+    subscriptions of glob._event are sent again and on_gap, if given, is
+    called with the Gap so missed data can be backfilled. Waiting
+    messages are delivered before it returns.
+    """
+    dispatcherFor(on_message_client)
+    on_close_client = args[0] if args else function_to_restart[1]
+
+    def deliver(web_sock, message, record):
+        symbol = None if record is None else record.get("s")
+        try:
+            dispatcherFor(on_message_client).submit(web_sock, message, symbol)
+        except RuntimeError:
+            # Replaced by configureDispatch() between the lookup and the submit
+            dispatcherFor(on_message_client).submit(web_sock, message, symbol)
+
+    try:
+        _serve(deliver, on_close_client, on_gap)
+    finally:
+        _closeDispatcher(on_message_client)
+
+
+def _serve(deliver, on_close_client, on_gap):
+    # The reconnect loop; every message is decoded once here and passed to
+    # the live cache and to deliver(web_sock, message, record)
+    # last: time of the last message, lost: time the connection was lost
+    state = {"last": None, "lost": None, "attempts": 0, "received": False}
 
-def start_socket(on_message_client, *args):
     def _on_message(web_sock, message):
         """
         made so we do not have to reinitialize connection
         """
-        t = threading.Thread(target=on_message_client, args=(web_sock, message))
-        t.start()
+        state["received"] = True
+        state["last"] = time.time()
+        record = decodeMessage(message)
+        cache = livecache.getLiveCache()
+        if cache is not None and record is not None:
+            cache.update(record)
+        deliver(web_sock, message, record)
+
+    def _on_open(web_sock):
+        on_open(web_sock)
+        if state["lost"] is None:
+            return
+        last = state["last"]
+        start = state["lost"] if last is None else dt.datetime.fromtimestamp(last, dt.timezone.utc)
+        gap = Gap(start, _now(), state["attempts"])
+        state["lost"] = None
+        state["attempts"] = 0
+        gaps.append(gap)
+        print("+++ Reconnected after a %.1f seconds gap" % gap.duration)
+        if on_gap:
+            try:
+                on_gap(gap)
+            except Exception as e:
+                print(e)
 
-    def _on_close(web_sock):
-        if function_to_restart[1]:
+    def _on_close(web_sock, *close_args):
+        if on_close_client:
             t = threading.Thread(
-                target=function_to_restart[1],  # type: ignore
+                target=on_close_client,  # type: ignore
                 args=(web_sock, json.dumps({"msg": "CLOSING"})),
             )
             t.start()
-        print("### closed ### reconnect in " + str(reconnect_timeout) + " seconds")
-        sleep(reconnect_timeout)
-        start_socket(function_to_restart[0])
 
-    ws = websocket.WebSocketApp(  # type: ignore
-        build_url(), on_message=_on_message, on_error=on_error, on_close=_on_close
-    )
+    _stopped.clear()
+    attempt = 0
+    while True:
+        state["received"] = False
+        ws = websocket.WebSocketApp(  # type: ignore
+            build_url(), on_message=_on_message, on_error=on_error, on_close=_on_close
+        )
+        ws.on_open = _on_open
+        _socket[0] = ws
+        ws.run_forever(sslopt={"cert_reqs": ssl.CERT_NONE})
+        ws.close()
+        _socket[0] = None
+        if _stopped.is_set():
+            return
+        if state["lost"] is None:
+            state["lost"] = _now()
+        # A connection that delivered data starts the backoff over
+        attempt = 1 if state["received"] else attempt + 1
+        state["attempts"] += 1
+        delay = reconnectDelay(attempt)
+        print("### closed ### reconnect in %.1f seconds" % delay)
+        if _stopped.wait(delay):
+            return
 
-    ws.on_open = on_open
-    ws.run_forever(sslopt={"cert_reqs": ssl.CERT_NONE})
-    ws.close()
 
-
-def run(on_message_client, *args):  ##passing on args ('on_close_client')
+def run(on_message_client, *args, on_gap=None):  ##passing on args ('on_close_client')
 
     websocket.enableTrace(False)  # type: ignore
     function_to_restart[0] = on_message_client
 
     if args:
         function_to_restart[1] = args[0]
-        start_socket(function_to_restart[0], function_to_restart[1])
+        start_socket(function_to_restart[0], function_to_restart[1], on_gap=on_gap)
     else:
-        start_socket(function_to_restart[0])
+        start_socket(function_to_restart[0], on_gap=on_gap)
+
+
+def runBatches(on_batch, size=None, interval=None, output_type=None, fields=None, on_gap=None):
+    """
+    Run the stream like run(), calling on_batch with columnar batches of
+    up to size messages instead of calling a function per message. Rows
+    are added on the socket thread in arrival order, without going
+    through the dispatcher.
+    =================================================================
+    Parameters:
+    -----------
+    on_batch: callable.
+             Called with each batch.
+    size: int.
+             Messages per batch. Defaults to glob.STREAM_BATCH_SIZE.
+    interval: float.
+             Longest time in seconds a message waits for its batch to fill.
+             Defaults to glob.STREAM_BATCH_INTERVAL.
+    output_type: string.
+             'dict' (default) for a dict of numpy arrays, 'df' for a
+             DataFrame, 'arrow' for a pyarrow.RecordBatch.
+    fields: list of string.
+             Fields kept. Defaults to all of them.
+
+    Example
+    -------
+    te.subscribe(['EURUSD:CUR', 'AAPL:US'])
+    te.runBatches(lambda df: print(df.groupby('s').price.last()), output_type = 'df')
+    """
+    batcher = TickBatcher(on_batch, size, interval, output_type, fields)
+
+    def deliver(web_sock, message, record):
+        # In arrival order, straight from the socket thread
+        if record is not None:
+            batcher.add(record)
+
+    websocket.enableTrace(False)  # type: ignore
+    try:
+        _serve(deliver, None, on_gap)
+    finally:
+        batcher.close()
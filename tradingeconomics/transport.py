@@ -0,0 +1,419 @@
+"""
+Pooled HTTP transport used by functions.dataRequest.
+
+Connections are kept alive per host and handed back to the pool once a
+response has been fully read, so repeated calls to the API skip the TCP and
+TLS handshakes that a fresh urlopen() pays on every request. New connections
+resume the last TLS session of their host, and the SSLContext is built once
+per verify setting; the process-wide ssl module state is never changed.
+"""
+
+import base64
+import functools
+import gzip
+import http.client
+import os
+import socket
+import ssl
+import threading
+import weakref
+from urllib.parse import urljoin, urlsplit, unquote
+from urllib.request import getproxies, proxy_bypass
+
+from . import glob
+
+
+USER_AGENT = "tradingeconomics-python"
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+MAX_REDIRECTS = 10
+
+# Errors raised when the server already closed an idle keep-alive connection.
+STALE_CONNECTION_ERRORS = (
+    ConnectionResetError,
+    BrokenPipeError,
+    ConnectionAbortedError,
+    http.client.BadStatusLine,
+)
+
+
+_ssl_contexts = {}
+_ssl_lock = threading.Lock()
+
+
+def sslContext(verify=None):
+    """
+    Return the shared SSLContext for a verify setting.
+    =================================================================
+    Parameters:
+    -----------
+    verify: bool or string.
+             True checks certificates against the system CA store, a string
+             against that CA bundle file, False skips certificate checks.
+             Defaults to glob.VERIFY_SSL.
+    """
+    if verify is None:
+        verify = glob.VERIFY_SSL
+    with _ssl_lock:
+        context = _ssl_contexts.get(verify)
+        if context is None:
+            if verify is False:
+                context = ssl._create_unverified_context()
+            else:
+                cafile = verify if isinstance(verify, str) else None
+                context = ssl.create_default_context(cafile=cafile)
+            _ssl_contexts[verify] = context
+        return context
+
+
+class ResumingHTTPSConnection(http.client.HTTPSConnection):
+    """HTTPSConnection that offers a saved TLS session to shorten the handshake."""
+
+    def __init__(self, host, port=None, session=None, **kwargs):
+        super(ResumingHTTPSConnection, self).__init__(host, port, **kwargs)
+        self.tls_session = session
+
+    def connect(self):
+        http.client.HTTPConnection.connect(self)
+        server_hostname = self._tunnel_host or self.host
+        self.sock = self._context.wrap_socket(
+            self.sock, server_hostname=server_hostname, session=self.tls_session
+        )
+
+
+class Response(object):
+    """Status, headers and fully read body of a completed request."""
+
+    def __init__(self, status, reason, headers, body):
+        self.status = status
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+
+    def getcode(self):
+        return self.status
+
+    def getheader(self, name, default=None):
+        return self.headers.get(name, default)
+
+
+def proxyFor(scheme, host):
+    """
+    Return the split URL of the HTTP(S)_PROXY to reach host through, or
+    None when there is none or NO_PROXY covers host.
+    """
+    proxy = getproxies().get(scheme)
+    if not proxy or proxy_bypass(host):
+        return None
+    return urlsplit(proxy if "://" in proxy else "http://" + proxy)
+
+
+def proxyHeaders(proxy):
+    """Return the Proxy-Authorization header for the credentials of proxy."""
+    if not proxy.username:
+        return {}
+    credentials = "%s:%s" % (unquote(proxy.username), unquote(proxy.password or ""))
+    return {
+        "Proxy-Authorization": "Basic "
+        + base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+    }
+
+
+class ConnectionPool(object):
+    """
+    Thread-safe pool of keep-alive HTTP(S) connections.
+    =================================================================
+    Parameters:
+    -----------
+    maxsize: int.
+             Idle connections kept per (scheme, host, port). Extra connections
+             opened under concurrency are closed once they are released.
+             Defaults to glob.POOL_SIZE.
+    timeout: float.
+             Socket timeout in seconds. Defaults to glob.TIMEOUT.
+    verify: bool or string.
+             Certificate verification, see sslContext. Defaults to glob.VERIFY_SSL.
+
+    Example
+    -------
+    pool = ConnectionPool(maxsize = 20)
+    response = pool.request('https://api.tradingeconomics.com/markets/index')
+    """
+
+    def __init__(self, maxsize=None, timeout=None, verify=None):
+        self.maxsize = glob.POOL_SIZE if maxsize is None else maxsize
+        self.timeout = glob.TIMEOUT if timeout is None else timeout
+        self.ssl_context = sslContext(verify)
+        self._lock = threading.Lock()
+        self._idle = {}
+        self._sessions = {}
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+        self.resumed = 0
+        _pools.add(self)
+
+    def _newConnection(self, scheme, host, port):
+        timeout = self.timeout
+        if timeout is None:
+            timeout = socket._GLOBAL_DEFAULT_TIMEOUT  # type: ignore
+        if scheme == "https":
+            connection_class = functools.partial(
+                ResumingHTTPSConnection,
+                context=self.ssl_context,
+                session=self._sessions.get((host, port)),
+            )
+        else:
+            connection_class = http.client.HTTPConnection
+        proxy = proxyFor(scheme, host)
+        if proxy is None:
+            return connection_class(host, port, timeout=timeout)
+
+        proxy_headers = proxyHeaders(proxy)
+        if scheme == "https":
+            # Tunnel TLS through the proxy with CONNECT
+            conn = connection_class(proxy.hostname, proxy.port or 80, timeout=timeout)
+            conn.set_tunnel(host, port, headers=proxy_headers)
+        else:
+            conn = http.client.HTTPConnection(proxy.hostname, proxy.port or 80, timeout=timeout)
+        conn._te_proxy_headers = proxy_headers  # type: ignore
+        return conn
+
+    def _acquire(self, key):
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                self.reused += 1
+                return idle.pop(), True
+            self.created += 1
+        return self._newConnection(*key), False
+
+    def _release(self, key, conn):
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.maxsize:
+                idle.append(conn)
+                return
+            self.discarded += 1
+        conn.close()
+
+    def request(self, url, headers=None, method="GET"):
+        """
+        Send a request and return a Response with the whole body read.
+        Redirects are followed like urlopen() does. Network failures
+        propagate as OSError or http.client.HTTPException.
+        """
+        for _ in range(MAX_REDIRECTS + 1):
+            response = self._send(url, headers, method)
+            location = response.getheader("Location")
+            if response.status not in REDIRECT_CODES or not location:
+                return response
+            url = urljoin(url, location)
+        raise http.client.HTTPException("Too many redirects: " + url)
+
+    def _send(self, url, headers, method):
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in DEFAULT_PORTS:
+            raise ValueError("Unsupported URL scheme: " + parts.scheme)
+        key = (scheme, parts.hostname, parts.port or DEFAULT_PORTS[scheme])
+
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+
+        send_headers = {"Accept-Encoding": "gzip", "User-Agent": USER_AGENT}
+        if headers:
+            send_headers.update(headers)
+
+        while True:
+            conn, reused = self._acquire(key)
+            proxy_headers = getattr(conn, "_te_proxy_headers", None)
+            if proxy_headers is not None and scheme == "http":
+                # Plain HTTP through a proxy sends the absolute URL
+                request_target = url
+                request_headers = dict(send_headers, **proxy_headers)
+            else:
+                request_target = target
+                request_headers = send_headers
+            try:
+                conn.request(method, request_target, headers=request_headers)
+                response = conn.getresponse()
+                body = response.read()
+            except STALE_CONNECTION_ERRORS:
+                conn.close()
+                if reused:
+                    # The server dropped an idle connection, retry on a new one
+                    continue
+                raise
+            except BaseException:
+                conn.close()
+                raise
+            break
+
+        if isinstance(conn.sock, ssl.SSLSocket):
+            self._saveSession(key, conn.sock, reused)
+
+        if response.will_close:
+            conn.close()
+        else:
+            self._release(key, conn)
+
+        if response.getheader("Content-Encoding", "").lower() == "gzip":
+            body = gzip.decompress(body)
+        return Response(response.status, response.reason, response.headers, body)
+
+    def _saveSession(self, key, sock, reused):
+        # TLS 1.3 tickets arrive after the handshake, so save once a response is read
+        session = sock.session
+        with self._lock:
+            if session is not None:
+                self._sessions[key[1:]] = session
+            if not reused and sock.session_reused:
+                self.resumed += 1
+
+    def clear(self):
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for conn in connections:
+                conn.close()
+
+    def _afterFork(self):
+        # The lock may have been held by another thread of the parent
+        self._lock = threading.Lock()
+        self.clear()
+
+
+class SingleFlight(object):
+    """
+    Collapse concurrent calls that share a key into one execution.
+    =================================================================
+    The first caller for a key runs the function; callers arriving while
+    it is in flight wait for it and receive the same result or exception.
+
+    Example
+    -------
+    flight = SingleFlight()
+    result, shared = flight.do(url, lambda: pool.request(url))
+    flight.stats()
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    def do(self, key, func):
+        """
+        Return (result, shared), where shared is True for callers that
+        waited on another thread's call instead of running func.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = func()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result, False
+
+    def stats(self):
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "coalesced": self.coalesced,
+                "in_flight": len(self._calls),
+            }
+
+
+class _Call(object):
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+# Shared by every dataRequest call in the process
+inflight = SingleFlight()
+
+# Every live ConnectionPool, so a forked child drops their connections
+_pools = weakref.WeakSet()
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def getPool():
+    """Return the process-wide connection pool, creating it on first use."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool()
+    return _pool
+
+
+def configurePool(pool_size=None, timeout=None, verify=None):
+    """
+    Replace the process-wide connection pool.
+    =================================================================
+    Parameters:
+    -----------
+    pool_size: int.
+             Idle keep-alive connections kept per host.
+    timeout: float.
+             Socket timeout in seconds.
+    verify: bool or string.
+             Certificate verification, see sslContext.
+
+    Example
+    -------
+    configurePool(pool_size = 32, timeout = 30)
+    configurePool(verify = True)
+    """
+    global _pool
+    with _pool_lock:
+        old, _pool = _pool, ConnectionPool(maxsize=pool_size, timeout=timeout, verify=verify)
+    if old is not None:
+        old.clear()
+    return _pool
+
+
+def _resetAfterFork():
+    # Sockets and locks inherited from the parent must not be shared with the
+    # child, including those of the pools of TradingEconomicsClient instances
+    global _pool, _pool_lock, _ssl_lock, inflight
+    for pool in list(_pools):
+        pool._afterFork()
+    _pool = None
+    _pool_lock = threading.Lock()
+    _ssl_lock = threading.Lock()
+    inflight = SingleFlight()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_resetAfterFork)
@@ -1,6 +1,5 @@
 import json
 import urllib
-import pandas as pd
 import sys
 from . import functions as fn
 from . import glob
@@ -69,7 +68,7 @@ def checkIndicator(linkAPI, indicator):
     return linkAPI
 
 
-def getWBCategories(category=None, page_number=None, output_type=None):
+def getWBCategories(category=None, page_number=None, output_type=None, all_pages=False):
     """
     Return a list of all categories, categories by page number.
     =================================================================================
@@ -89,6 +88,8 @@ def getWBCategories(category=None, page_number=None, output_type=None):
     output_type: string.
              'dict'(default) for dictionary format output, 'df' for data frame,
              'raw' for list of dictionaries directly from the web.
+    all_pages: bool.
+             Fetch every page and return them merged; page_number is ignored.
 
     Notes
     -----
@@ -99,18 +100,13 @@ def getWBCategories(category=None, page_number=None, output_type=None):
     getWBCategories(category = None, output_type = None)
 
     getWBCategories(category = ['education', 'agriculture'], output_type = None)
+
+    getWBCategories(category = 'education', output_type = 'df', all_pages = True)
     """
-    url = ""
-    fn.setup_ssl_context()
-    if category:
-        url = "/worldBank/category/" + quote(str(category), safe="")
-    else:
-        url = "/worldBank/categories"
+    if all_pages:
+        return fn.mergeResults(iterWBCategories(category, output_type), output_type)
 
-    if category == None:
-        linkAPI = "/worldBank/categories"
-    else:
-        linkAPI = "/worldBank/category/" + quote(str(category), safe="")
+    linkAPI = categoryLink(category)
 
     if page_number != None:
         linkAPI = checkPageNumber(linkAPI, page_number)
@@ -118,6 +114,35 @@ def getWBCategories(category=None, page_number=None, output_type=None):
     return fn.dataRequest(api_request=linkAPI, output_type=output_type)
 
 
+def categoryLink(category):
+    if category == None:
+        return "/worldBank/categories"
+    return "/worldBank/category/" + quote(str(category), safe="")
+
+
+def iterWBCategories(category=None, output_type=None, prefetch=None):
+    """
+    Iterate over the pages of getWBCategories, one result per page.
+    =================================================================================
+
+    Parameters:
+    -----------
+    prefetch: int.
+             Pages fetched concurrently ahead of the one being read.
+             Defaults to TE_PAGE_PREFETCH (1).
+
+    Example
+    -------
+    for page in iterWBCategories(category = 'education', output_type = 'df', prefetch = 4):
+        store(page)
+    """
+    linkAPI = categoryLink(category)
+
+    return fn.iterPages(
+        lambda page: checkPageNumber(linkAPI, page), output_type, prefetch
+    )
+
+
 def getWBIndicator(series_code=None, url=None, output_type=None):
     """
     Detailed information about specific indicator for all countries using a series
@@ -149,8 +174,6 @@ def getWBIndicator(series_code=None, url=None, output_type=None):
 
     getWBIndicator(series_code = None, url = '/united-states/real-interest-rate-percent-wb-data.html', output_type = None)
     """
-    fn.setup_ssl_context()
-
     linkAPI = "/worldBank/indicator/"
     if series_code == None and url == None:
         return "Series code or url is required!"
@@ -163,7 +186,7 @@ def getWBIndicator(series_code=None, url=None, output_type=None):
     return fn.dataRequest(api_request=linkAPI, output_type=output_type)
 
 
-def getWBCountry(country=None, page_number=None, output_type=None):
+def getWBCountry(country=None, page_number=None, output_type=None, all_pages=False):
     """
     List of indicators available for a specific country (with pagination).
     =================================================================================
@@ -179,6 +202,8 @@ def getWBCountry(country=None, page_number=None, output_type=None):
     output_type: string.
              'dict'(default) for dictionary format output, 'df' for data frame,
              'raw' for list of dictionaries directly from the web.
+    all_pages: bool.
+             Fetch every page and return them merged; page_number is ignored.
 
     Notes
     -----
@@ -187,12 +212,14 @@ def getWBCountry(country=None, page_number=None, output_type=None):
     Example
     -------
     getWBCountry(country = 'portugal', output_type = None) # page_number is no longer needed!
+
+    getWBCountry(country = 'portugal', output_type = 'df', all_pages = True)
     """
     linkAPI = "/worldBank/country/"
-    fn.setup_ssl_context()
-
     if country == None:
         return "A country is required!"
+    if all_pages:
+        return fn.mergeResults(iterWBCountry(country, output_type), output_type)
     else:
         linkAPI = checkCountry(linkAPI, country)
 
@@ -202,6 +229,31 @@ def getWBCountry(country=None, page_number=None, output_type=None):
     return fn.dataRequest(api_request=linkAPI, output_type=output_type)
 
 
+def iterWBCountry(country=None, output_type=None, prefetch=None):
+    """
+    Iterate over the pages of getWBCountry, one result per page.
+    =================================================================================
+
+    Parameters:
+    -----------
+    prefetch: int.
+             Pages fetched concurrently ahead of the one being read.
+             Defaults to TE_PAGE_PREFETCH (1).
+
+    Example
+    -------
+    for page in iterWBCountry(country = 'portugal', output_type = 'df', prefetch = 4):
+        store(page)
+    """
+    if country == None:
+        raise ParametersError("A country is required!")
+    linkAPI = checkCountry("/worldBank/country/", country)
+
+    return fn.iterPages(
+        lambda page: checkPageNumber(linkAPI, page), output_type, prefetch
+    )
+
+
 def getWBHistorical(series_code=None, output_type=None):
     """
     Historical data for a specific indicator.
@@ -227,8 +279,6 @@ def getWBHistorical(series_code=None, output_type=None):
 
     getWBHistorical(series_code = 'usa.fr.inr.rinr', output_type = None)
     """
-    fn.setup_ssl_context()
-
     linkAPI = "/worldBank/historical"
 
     if series_code == None: